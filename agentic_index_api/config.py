@@ -10,6 +10,7 @@ class Settings(BaseSettings):
 
     API_KEY: str = os.getenv("API_KEY", "test-key")
     IP_WHITELIST: str = os.getenv("IP_WHITELIST", "")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
 
     @property
     def whitelist(self) -> set[str]:
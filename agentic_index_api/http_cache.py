@@ -0,0 +1,108 @@
+"""Serialized response cache with strong ETags for the API endpoints.
+
+Responses are cached as JSON bytes under a key that names the data they
+were built from, for example the snapshot they were read from plus the
+request parameters. A new snapshot means new keys, so nothing is
+invalidated explicitly; old entries age out of the LRU. The ETag is a hash
+of the bytes, so it stays valid across restarts and reloads that leave the
+payload unchanged. A request whose ``If-None-Match`` matches gets an empty
+``304``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, Response
+
+from agentic_index_cli.internal import json_codec
+
+# clients may keep responses but must revalidate them; a match costs a 304
+CACHE_CONTROL = "public, no-cache"
+# for routes behind the API key, which shared caches must not store
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+
+def make_entry(payload: Any) -> CachedResponse:
+    body = json_codec.dumps(payload, compact=True).encode()
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return CachedResponse(body, f'"{digest}"')
+
+
+class ResponseCache:
+    """Thread-safe LRU of :class:`CachedResponse` objects."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Optional[CachedResponse]:
+        """Return the entry for ``key``, building it from ``build()`` on a miss.
+
+        ``build`` returning ``None`` means there is nothing to serve; that is
+        not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        payload = build()
+        if payload is None:
+            return None
+        entry = make_entry(payload)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    tags = (tag.strip() for tag in header.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+
+def respond(
+    request: Request, entry: CachedResponse, *, private: bool = False
+) -> Response:
+    """Return ``entry`` as a response, or ``304`` if the client has it.
+
+    ``private`` marks responses of authenticated routes, so proxies and
+    other shared caches do not hand them to clients without the key.
+    """
+    cache_control = PRIVATE_CACHE_CONTROL if private else CACHE_CONTROL
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+    if request.method in ("GET", "HEAD") and _matches(
+        request.headers.get("if-none-match"), entry.etag
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
@@ -0,0 +1,172 @@
+"""In-process background jobs for the long-running API endpoints.
+
+``POST /sync`` and ``POST /render`` submit a job and return its ID at once.
+The work runs on a small thread pool. A request for the same kind and
+parameters as a job that is still queued or running gets that job back
+instead of starting a duplicate. Every state change is written to
+``state/jobs/<id>.json``, so ``GET /jobs/{id}`` keeps working after a
+restart. Jobs that were queued or running when the process stopped are
+reported as ``failed``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from agentic_index_cli.internal import json_codec
+
+logger = logging.getLogger(__name__)
+
+ACTIVE = ("queued", "running")
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.kind, json.dumps(self.params, sort_keys=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobQueue:
+    """Run submitted jobs on at most ``workers`` threads.
+
+    ``progress`` callables passed to :meth:`submit` are polled when a running
+    job is read, so reporting progress costs nothing while nobody asks.
+    """
+
+    def __init__(self, state_dir: Path, *, workers: int = 2) -> None:
+        self.state_dir = Path(state_dir)
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._active: Dict[Tuple[str, str], Job] = {}
+        self._probes: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._done: Dict[str, threading.Event] = {}
+
+    def _path(self, job_id: str) -> Path:
+        return self.state_dir / f"{job_id}.json"
+
+    def _save(self, job: Job) -> None:
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(job.id)
+        tmp = path.with_suffix(".tmp")
+        json_codec.write(tmp, job.to_dict())
+        tmp.replace(path)
+
+    def submit(
+        self,
+        kind: str,
+        params: Dict[str, Any],
+        fn: Callable[[], Any],
+        *,
+        progress: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> Tuple[Job, bool]:
+        """Queue ``fn`` and return ``(job, created)``.
+
+        ``created`` is ``False`` when an active job with the same ``kind``
+        and ``params`` was returned instead.
+        """
+        job = Job(id=uuid.uuid4().hex, kind=kind, params=params)
+        with self._lock:
+            existing = self._active.get(job.key)
+            if existing is not None:
+                return existing, False
+            self._jobs[job.id] = job
+            self._active[job.key] = job
+            self._done[job.id] = threading.Event()
+            if progress is not None:
+                self._probes[job.id] = progress
+            self._save(job)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="api-job"
+                )
+            self._executor.submit(self._run, job, fn)
+        logger.info("queued %s job %s", kind, job.id)
+        return job, True
+
+    def _run(self, job: Job, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            job.status = "running"
+            job.started_at = time.time()
+            self._save(job)
+        try:
+            result = fn()
+        except Exception as exc:
+            logger.exception("%s job %s failed", job.kind, job.id)
+            status, result, error = "failed", None, str(exc) or type(exc).__name__
+        else:
+            status, error = "succeeded", None
+        with self._lock:
+            job.progress = self._probe(job)
+            job.status, job.result, job.error = status, result, error
+            job.finished_at = time.time()
+            self._probes.pop(job.id, None)
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+            self._save(job)
+            done = self._done.pop(job.id)
+        done.set()
+
+    def _probe(self, job: Job) -> Dict[str, Any]:
+        probe = self._probes.get(job.id)
+        if probe is None or job.status != "running":
+            return job.progress
+        try:
+            return probe()
+        except Exception:  # pragma: no cover - progress is best effort
+            logger.exception("progress of job %s failed", job.id)
+            return job.progress
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the state of job ``job_id``, including its live progress."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return {**job.to_dict(), "progress": self._probe(job)}
+        # a job from an earlier process
+        if not job_id.isalnum():
+            return None
+        try:
+            data = json_codec.read(self._path(job_id))
+        except (OSError, ValueError):
+            return None
+        if data.get("status") in ACTIVE:
+            data["status"] = "failed"
+            data["error"] = "interrupted by a server restart"
+        return data
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> bool:
+        """Block until job ``job_id`` has finished; return ``False`` on timeout."""
+        with self._lock:
+            done = self._done.get(job_id)
+        return done is None or done.wait(timeout)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -1,81 +1,295 @@
 from __future__ import annotations
 
+import datetime
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, List, Literal, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 
-from agentic_index_cli.internal.json_utils import load_json
+from agentic_index_cli.internal.history_index import HistoryIndex, fingerprints
+
+from . import http_cache, repo_index
+from .snapshot import Snapshot, SnapshotManager
 
 DATA_FILE = Path("data/repos.json")
+RANKED_FILE = Path("data/ranked.json")
 HISTORY_DIR = Path("data/history")
 
-app = FastAPI(title="Agentic Index API")
+# watches the data files and swaps in a new snapshot when they change; the
+# first snapshot is built on the first request, not at import
+manager = SnapshotManager(DATA_FILE, [RANKED_FILE], interval=1.0)
 
 
-def _load_repos() -> list[dict[str, Any]]:
-    if DATA_FILE.exists():
-        data = load_json(DATA_FILE, cache=True)
-        return data.get("repos", [])
-    return []
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    manager.start()
+    try:
+        yield
+    finally:
+        manager.stop()
 
 
-REPOS = _load_repos()
-SCORE_KEY = None
-for repo in REPOS:
-    if "AgenticIndexScore" in repo:
-        SCORE_KEY = "AgenticIndexScore"
-        break
-    if "AgentOpsScore" in repo:
-        SCORE_KEY = "AgentOpsScore"
-        break
-if SCORE_KEY is None:
-    SCORE_KEY = "score"
+app = FastAPI(title="Agentic Index API", lifespan=lifespan)
 
-RANKED = sorted(REPOS, key=lambda r: r.get(SCORE_KEY, 0), reverse=True)
-NAME_MAP = {}
-for r in REPOS:
-    NAME_MAP[r.get("name")] = r
-    if "full_name" in r:
-        NAME_MAP[r["full_name"]] = r
+# serialized /repo and /history responses of the hottest names
+responses = http_cache.ResponseCache(maxsize=2048)
 
+_SNAPSHOT_ATTRS = {
+    "TABLE": "table",
+    "REPOS": "repos",
+    "RANKED": "ranked",
+    "NAME_MAP": "name_map",
+    "SCORE_KEY": "score_key",
+}
 
-@app.get("/repo/{name}")
-def get_repo(name: str) -> dict[str, Any]:
-    repo = NAME_MAP.get(name)
+
+def __getattr__(name: str) -> Any:
+    # the module-level views of earlier versions, now read from the snapshot
+    if name in _SNAPSHOT_ATTRS:
+        return getattr(manager.current(), _SNAPSHOT_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def current_snapshot() -> Snapshot:
+    """Return the live snapshot; hold on to it for a consistent view."""
+    return manager.current()
+
+
+def _percentile(rank: int, total: int) -> float:
+    """Return the share of ``total`` repos ranked below ``rank``, in percent."""
+    return round(100.0 * (total - rank) / total, 2)
+
+
+@app.get("/status")
+def get_status() -> dict[str, Any]:
+    return {"snapshot": manager.status()}
+
+
+def _repo_payload(snapshot: Snapshot, name: str) -> Optional[dict[str, Any]]:
+    repo = snapshot.name_map.get(name)
     if not repo:
-        raise HTTPException(status_code=404, detail="Repo not found")
-    rank = next((i + 1 for i, r in enumerate(RANKED) if r is repo), None)
+        return None
+    rank = category_rank = percentile = category_percentile = None
+    position = snapshot.position(repo)
+    if position is not None:
+        rank, category_rank = position
+        percentile = _percentile(rank, len(snapshot.ranked))
+        category_total = snapshot.category_totals.get(repo.get("category"), 0)
+        if category_rank <= category_total:
+            category_percentile = _percentile(category_rank, category_total)
     stars = repo.get("stargazers_count") or repo.get("stars")
     return {
         "name": repo.get("full_name", repo.get("name")),
         "rank": rank,
         "stars": stars,
-        "score": repo.get(SCORE_KEY),
+        "score": repo.get(snapshot.score_key),
+        "category": repo.get("category"),
+        "category_rank": category_rank,
+        "percentile": percentile,
+        "category_percentile": category_percentile,
         "metadata": repo,
     }
 
 
-@app.get("/history/{name}")
-def get_history(name: str) -> dict[str, Any]:
-    points = []
-    for path in sorted(HISTORY_DIR.glob("*.json")):
-        date = path.stem
-        data = load_json(path, cache=True)
-        for entry in data:
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("name") == name or entry.get("full_name") == name:
-                for key in ("AgentOpsScore", "AgenticIndexScore", "score"):
-                    if key in entry:
-                        points.append({"date": date, "score": entry[key]})
-                        break
-                break
+@app.get("/repo/{name}")
+def get_repo(name: str, request: Request) -> Response:
+    snapshot = current_snapshot()
+    entry = responses.get(
+        ("repo", name, snapshot.token), lambda: _repo_payload(snapshot, name)
+    )
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Repo not found")
+    return http_cache.respond(request, entry)
+
+
+SortField = Literal[
+    "score",
+    "stars",
+    "stars_delta",
+    "score_delta",
+    "forks",
+    "issues",
+    "pushed_at",
+    "name",
+]
+
+
+def _within(value: Callable[[dict], Any], low: Any, high: Any) -> Callable:
+    def check(repo: dict) -> bool:
+        v = value(repo)
+        if v is None:
+            return False
+        return (low is None or v >= low) and (high is None or v <= high)
+
+    return check
+
+
+def _project(
+    snapshot: Snapshot, repo: dict, fields: Optional[List[str]]
+) -> dict[str, Any]:
+    if fields is None:
+        return repo
+    item = {}
+    for field in fields:
+        if field == "rank":
+            position = snapshot.position(repo)
+            item["rank"] = position[0] if position else None
+        elif field in repo:
+            item[field] = repo[field]
+    return item
+
+
+@app.get("/repos")
+def list_repos(
+    category: Optional[str] = None,
+    language: Optional[str] = None,
+    license: Optional[str] = None,
+    min_stars: Optional[int] = None,
+    max_stars: Optional[int] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    pushed_after: Optional[datetime.date] = None,
+    pushed_before: Optional[datetime.date] = None,
+    sort: SortField = "score",
+    order: Literal["desc", "asc"] = "desc",
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="comma separated keys"),
+) -> dict[str, Any]:
+    """Return one page of repos matching the filters, in ``sort`` order.
+
+    Pass ``next_cursor`` from a response as ``cursor`` to get the next page.
+    ``pushed_after`` is inclusive and ``pushed_before`` exclusive.
+    """
+    snapshot = current_snapshot()
+    index = snapshot.index.get(sort, category)
+    after = None
+    if cursor:
+        try:
+            after = repo_index.decode_cursor(cursor, sort, order)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    checks: List[Callable[[dict], bool]] = []
+    if language is not None:
+        lang = language.lower()
+        checks.append(lambda r: (r.get("language") or "").lower() == lang)
+    if license is not None:
+        lic = license.lower()
+        checks.append(lambda r: (repo_index.license_id(r) or "").lower() == lic)
+    bounds: Dict[str, tuple] = {
+        "stars": (min_stars, max_stars, repo_index.stars),
+        "score": (min_score, max_score, snapshot.index.fields["score"]),
+    }
+    for low, high, value in bounds.values():
+        if low is not None or high is not None:
+            checks.append(_within(value, low, high))
+    if pushed_after is not None or pushed_before is not None:
+        after_day = pushed_after.isoformat() if pushed_after else None
+        before_day = pushed_before.isoformat() if pushed_before else None
+
+        def pushed(repo: dict) -> bool:
+            day = (repo.get("pushed_at") or "")[:10]
+            if not day:
+                return False
+            if after_day is not None and day < after_day:
+                return False
+            return before_day is None or day < before_day
+
+        checks.append(pushed)
+
+    # filters on the sort field narrow the scan with a bisect
+    low = high = None
+    if sort in bounds:
+        low, high = bounds[sort][:2]
+    elif sort == "pushed_at" and pushed_after is not None:
+        low = pushed_after.isoformat()
+
+    items = []
+    next_cursor = None
+    try:
+        rows = index.scan(descending=order == "desc", after=after, low=low, high=high)
+        for key, repo in rows:
+            if all(check(repo) for check in checks):
+                if len(items) == limit:
+                    next_cursor = repo_index.encode_cursor(sort, order, last)
+                    break
+                items.append(repo)
+                last = key
+    except TypeError as exc:
+        raise HTTPException(status_code=400, detail="malformed cursor") from exc
+
+    projection = None
+    if fields:
+        projection = [f.strip() for f in fields.split(",") if f.strip()]
+    return {
+        "items": [_project(snapshot, repo, projection) for repo in items],
+        "next_cursor": next_cursor,
+        "sort": sort,
+        "order": order,
+        "snapshot": snapshot.version,
+    }
+
+
+@app.get("/search")
+def search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    prefix: bool = True,
+    blend: float = Query(0.0, ge=0.0, le=1.0),
+) -> dict[str, Any]:
+    """Return repos matching ``q`` by BM25, optionally blended with score."""
+    snapshot = current_snapshot()
+    results = []
+    for ident, relevance, bm25 in snapshot.search.search(
+        q, limit=limit, prefix=prefix, blend=blend
+    ):
+        repo = snapshot.name_map.get(ident, {})
+        results.append(
+            {
+                "name": ident,
+                "relevance": relevance,
+                "bm25": bm25,
+                "score": repo.get(snapshot.score_key),
+                "category": repo.get("category"),
+                "description": repo.get("description"),
+            }
+        )
+    return {"query": q, "results": results}
+
+
+_HISTORY: dict[str, Any] = {"sources": None, "index": None}
+
+
+def _history_index(current: Optional[Dict[str, str]] = None) -> HistoryIndex:
+    """Return the history index, rebuilt when a snapshot changes."""
+    if current is None:
+        current = fingerprints(HISTORY_DIR)
+    if _HISTORY["sources"] != current:
+        _HISTORY["index"] = HistoryIndex.build(HISTORY_DIR)
+        _HISTORY["sources"] = current
+    return _HISTORY["index"]
+
+
+def _history_payload(name: str, sources: Dict[str, str]) -> Optional[dict]:
+    index = _history_index(sources)
+    points = [p for p in index.history(name) if p["score"] is not None]
     if not points:
-        raise HTTPException(status_code=404, detail="No history found")
+        return None
     return {"name": name, "history": points}
 
 
+@app.get("/history/{name}")
+def get_history(name: str, request: Request) -> Response:
+    sources = fingerprints(HISTORY_DIR)
+    key = ("history", name, str(HISTORY_DIR), tuple(sorted(sources.items())))
+    entry = responses.get(key, lambda: _history_payload(name, sources))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="No history found")
+    return http_cache.respond(request, entry)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,156 @@
+"""Sorted secondary indexes behind the ``/repos`` listing endpoint.
+
+Every sortable field gets a :class:`SortIndex` over all repos and one per
+category. Pages use keyset cursors, ``(value, repo id)`` of the last item
+returned, so finding where a page starts is a bisect. The cost of a page is
+then the number of repos scanned to fill it, not the size of the snapshot.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+Value = Any
+
+
+def _number(value: Any) -> Optional[float]:
+    # deltas use "+new" for repos without a previous snapshot
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def repo_id(repo: Dict[str, Any]) -> str:
+    return repo.get("full_name") or repo.get("name") or ""
+
+
+def stars(repo: Dict[str, Any]) -> Optional[float]:
+    return _number(repo.get("stargazers_count", repo.get("stars")))
+
+
+def license_id(repo: Dict[str, Any]) -> Optional[str]:
+    value = repo.get("license")
+    if isinstance(value, dict):
+        value = value.get("spdx_id") or value.get("key")
+    return value
+
+
+def sort_fields(score_key: str) -> Dict[str, Callable[[Dict[str, Any]], Value]]:
+    """Return ``{sort name: value getter}``; ``None`` values sort last."""
+    return {
+        "score": lambda r: _number(r.get(score_key)),
+        "stars": stars,
+        "stars_delta": lambda r: _number(r.get("stars_delta")),
+        "score_delta": lambda r: _number(r.get("score_delta")),
+        "forks": lambda r: _number(r.get("forks_count")),
+        "issues": lambda r: _number(r.get("open_issues_count")),
+        "pushed_at": lambda r: r.get("pushed_at") or None,
+        "name": lambda r: repo_id(r).lower() or None,
+    }
+
+
+class SortIndex:
+    """Repos ordered by one field, ties broken by repo id."""
+
+    def __init__(self, repos: List[Dict[str, Any]], value: Callable) -> None:
+        rows = []
+        missing = []
+        for repo in repos:
+            v = value(repo)
+            if v is None:
+                missing.append((repo_id(repo), repo))
+            else:
+                rows.append(((v, repo_id(repo)), repo))
+        rows.sort(key=lambda row: row[0])
+        missing.sort(key=lambda row: row[0])
+        self.keys: List[Tuple[Value, str]] = [k for k, _ in rows]
+        self.repos = [r for _, r in rows]
+        self.missing_ids = [k for k, _ in missing]
+        self.missing = [r for _, r in missing]
+
+    def __len__(self) -> int:
+        return len(self.repos) + len(self.missing)
+
+    def scan(
+        self,
+        *,
+        descending: bool = True,
+        after: Optional[Tuple[Value, str]] = None,
+        low: Value = None,
+        high: Value = None,
+    ) -> Iterator[Tuple[Tuple[Value, str], Dict[str, Any]]]:
+        """Yield ``(cursor key, repo)`` in order, starting past ``after``.
+
+        ``low`` and ``high`` bound the value inclusively; repos without a
+        value are only yielded when neither bound is set.
+        """
+        keys = self.keys
+        after_missing = after is not None and after[0] is None
+        if not after_missing:
+            # clamp to the [low, high] window, then move past the cursor
+            start = 0 if low is None else bisect.bisect_left(keys, (low,))
+            stop = len(keys)
+            if high is not None:
+                stop = bisect.bisect_right(keys, (high, chr(0x10FFFF)))
+            if descending:
+                if after is not None:
+                    stop = min(stop, bisect.bisect_left(keys, tuple(after)))
+                for i in range(stop - 1, start - 1, -1):
+                    yield keys[i], self.repos[i]
+            else:
+                if after is not None:
+                    start = max(start, bisect.bisect_right(keys, tuple(after)))
+                for i in range(start, stop):
+                    yield keys[i], self.repos[i]
+        if low is not None or high is not None:
+            return
+        first = 0
+        if after_missing:
+            first = bisect.bisect_right(self.missing_ids, after[1])
+        for i in range(first, len(self.missing)):
+            yield (None, self.missing_ids[i]), self.missing[i]
+
+
+class RepoIndex:
+    """Sort indexes over every field, overall and per category."""
+
+    def __init__(self, repos: List[Dict[str, Any]], score_key: str) -> None:
+        self.fields = sort_fields(score_key)
+        by_category: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for repo in repos:
+            by_category.setdefault(repo.get("category"), []).append(repo)
+        self.overall = {name: SortIndex(repos, v) for name, v in self.fields.items()}
+        self.by_category = {
+            category: {name: SortIndex(members, v) for name, v in self.fields.items()}
+            for category, members in by_category.items()
+        }
+
+    def get(self, sort: str, category: Optional[str] = None) -> SortIndex:
+        if category is None:
+            return self.overall[sort]
+        indexes = self.by_category.get(category)
+        if indexes is None:
+            return SortIndex([], self.fields[sort])
+        return indexes[sort]
+
+
+def encode_cursor(sort: str, order: str, key: Tuple[Value, str]) -> str:
+    raw = json.dumps([sort, order, key[0], key[1]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> Tuple[Value, str]:
+    """Return the key stored in ``cursor``; raise ``ValueError`` if invalid."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        c_sort, c_order, value, ident = data
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise ValueError("malformed cursor") from exc
+    if (c_sort, c_order) != (sort, order) or not isinstance(ident, str):
+        raise ValueError("cursor belongs to a different sort order")
+    return value, ident
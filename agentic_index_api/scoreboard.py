@@ -0,0 +1,76 @@
+"""Top-N scoreboard over the repos in ``state/sync_data.json``.
+
+Every record is scored with the metrics registry in one
+:func:`compute_scores` batch. A stored ``AgenticIndexScore`` is ignored: the
+harvester writes the legacy :mod:`agentic_index_cli.scoring` value, which is
+on a different scale. Top lists are picked with :func:`heapq.nlargest` and
+kept per category, so asking again for the same or a smaller ``n`` is a
+slice.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agentic_index_cli.internal.scoring import compute_scores
+
+Signature = Tuple[str, int, int]
+
+
+class Scoreboard:
+    """Scores of one version of the sync data, with cached top lists."""
+
+    def __init__(
+        self,
+        repos: List[dict],
+        *,
+        scorer: Callable[[List[dict]], List[float]] = compute_scores,
+    ) -> None:
+        scores = scorer(repos) if repos else []
+        self.entries: List[Tuple[float, str, Optional[str]]] = []
+        for repo, score in zip(repos, scores):
+            name = repo.get("full_name") or repo.get("name")
+            if name:
+                self.entries.append((score, name, repo.get("category")))
+        self._by_category: Dict[Optional[str], list] = {}
+        for entry in self.entries:
+            self._by_category.setdefault(entry[2], []).append(entry)
+        self._top: Dict[Optional[str], list] = {}
+        self._lock = threading.Lock()
+
+    def top(self, n: int, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the ``n`` best ``{"name", "score"}`` rows, best first.
+
+        Ties keep the order of the sync data.
+        """
+        pool = self.entries
+        if category is not None:
+            pool = self._by_category.get(category, [])
+        with self._lock:
+            best = self._top.get(category)
+            # a cached list shorter than ``n`` may already hold the whole pool
+            if best is None or (len(best) < n and len(best) < len(pool)):
+                best = heapq.nlargest(n, pool, key=lambda e: e[0])
+                self._top[category] = best
+        return [{"name": name, "score": score} for score, name, _ in best[:n]]
+
+
+class ScoreboardCache:
+    """Hold the current :class:`Scoreboard`, rebuilt when its file changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signature: Optional[Signature] = None
+        self._board: Optional[Scoreboard] = None
+
+    def get(self, signature: Signature, build: Callable[[], Scoreboard]) -> Scoreboard:
+        """Return the board for ``signature``, calling ``build()`` if it changed."""
+        with self._lock:
+            if self._board is not None and self._signature == signature:
+                return self._board
+        board = build()
+        with self._lock:
+            self._signature, self._board = signature, board
+        return board
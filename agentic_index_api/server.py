@@ -8,16 +8,19 @@ import json
 import os
 import time
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import structlog
-from fastapi import Body, FastAPI, HTTPException, Request, Response
+from fastapi import Body, FastAPI, HTTPException, Query, Request, Response
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
 
-from agentic_index_cli import issue_logger
-from agentic_index_cli.internal.scoring import compute_score
+from agentic_index_cli import github_client, issue_logger
+from agentic_index_cli.internal import json_codec, run_journal
+from agentic_index_cli.internal.scoring import compute_scores
 from agentic_index_cli.internal.scrape import scrape
 from agentic_index_cli.logging_config import (
     configure_logging,
@@ -25,6 +28,10 @@ from agentic_index_cli.logging_config import (
 )
 from agentic_index_cli.validate import save_repos
 
+from . import http_cache
+from .jobs import JobQueue
+from .scoreboard import Scoreboard, ScoreboardCache
+
 configure_logging()
 configure_sentry()
 
@@ -50,15 +57,18 @@ API_KEY = settings.API_KEY
 IP_WHITELIST = settings.whitelist
 
 PROTECTED_PATHS = {"/sync", "/score", "/render", "/issue"}
+PROTECTED_PREFIXES = ("/jobs/",)
 
 SYNC_DATA_PATH = Path("state/sync_data.json")
+JOBS_DIR = Path("state/jobs")
+
+jobs = JobQueue(JOBS_DIR, workers=settings.JOB_WORKERS)
 
 
 def _load_sync_data() -> List[dict[str, Any]]:
     """Return list of repos from :data:`SYNC_DATA_PATH`."""
     try:
-        with SYNC_DATA_PATH.open() as fh:
-            data = json.load(fh)
+        data = json_codec.read(SYNC_DATA_PATH)
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=400,
@@ -76,7 +86,14 @@ def _load_sync_data() -> List[dict[str, Any]]:
     return data
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # let queued jobs finish writing their state
+    jobs.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.middleware("http")
@@ -110,7 +127,8 @@ async def request_logging(request: Request, call_next):
 
 @app.middleware("http")
 async def _auth(request: Request, call_next):
-    if request.url.path in PROTECTED_PATHS:
+    path = request.url.path
+    if path in PROTECTED_PATHS or path.startswith(PROTECTED_PREFIXES):
         client_ip = request.client.host if request.client else None
         key = request.headers.get("X-API-KEY")
         had_key = key is not None
@@ -143,43 +161,108 @@ def healthz() -> Response:
     return Response(status_code=200)
 
 
+def _sync_progress() -> dict[str, Any]:
+    harvested = run_journal.progress("scrape") or {}
+    return {
+        "pages_fetched": harvested.get("pages", 0),
+        "repos_harvested": harvested.get("repos", 0),
+        "api_budget": github_client.scheduler().metrics(),
+    }
+
+
+async def _queued(
+    kind: str,
+    params: dict[str, Any],
+    fn: Callable[[], Any],
+    wait: bool,
+    progress: Optional[Callable[[], dict[str, Any]]] = None,
+) -> Any:
+    job, created = jobs.submit(kind, params, fn, progress=progress)
+    if wait:
+        await run_in_threadpool(jobs.wait, job.id)
+        state = jobs.get(job.id) or {}
+        if state.get("status") != "succeeded":
+            raise HTTPException(status_code=500, detail=state.get("error"))
+        return state["result"]
+    body = {"job_id": job.id, "status": job.status, "coalesced": not created}
+    return JSONResponse(body, status_code=202)
+
+
 @app.post("/sync")
-async def sync(min_stars: int = Body(default=0, embed=True)) -> dict[str, Any]:
-    """Fetch repository data and write to ``data/repos.json``."""
+async def sync(
+    min_stars: int = Body(default=0, embed=True),
+    incremental: bool = Body(default=False, embed=True),
+    wait: bool = Body(default=False, embed=True),
+) -> Any:
+    """Queue a harvest that writes ``data/repos.json``.
+
+    Returns ``202`` with the job ID; poll ``/jobs/{id}`` for progress. With
+    ``incremental`` only repos changed since the last history snapshot are
+    re-scored. ``wait`` blocks until the job is done and returns its result.
+    """
     token = os.getenv("GITHUB_TOKEN")
 
     def _run() -> dict[str, Any]:
-        repos = scrape(min_stars=min_stars, token=token)
+        repos = scrape(min_stars=min_stars, token=token, incremental=incremental)
         save_repos(Path("data/repos.json"), repos)
         return {"repos": len(repos)}
 
-    return await run_in_threadpool(_run)
+    params = {"min_stars": min_stars, "incremental": incremental}
+    return await _queued("sync", params, _run, wait, _sync_progress)
 
 
-@app.post("/score")
-def score() -> dict[str, Any]:
-    """Return top 5 repositories sorted by score."""
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str) -> dict[str, Any]:
+    """Return the status, progress and result of a queued job."""
+    state = jobs.get(job_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return state
 
-    repos = _load_sync_data()
-    scored = []
-    for repo in repos:
-        score = compute_score(repo)
-        name = repo.get("full_name") or repo.get("name")
-        if name:
-            scored.append({"name": name, "score": score})
 
-    scored.sort(key=lambda r: r["score"], reverse=True)
-    return {"top_scores": scored[:5]}
+# scores of the current sync data, and /score responses built from them
+_scoreboards = ScoreboardCache()
+_score_cache = http_cache.ResponseCache(maxsize=64)
+
+
+@app.api_route("/score", methods=["GET", "POST"])
+def score(
+    request: Request,
+    n: int = Query(5, ge=1, le=1000),
+    category: Optional[str] = None,
+) -> Response:
+    """Return the top ``n`` repositories by score, optionally in ``category``.
+
+    Scores and results are cached until the sync data changes; ``GET``
+    requests revalidating with ``If-None-Match`` get a ``304``.
+    """
+    try:
+        stat = SYNC_DATA_PATH.stat()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=400, detail="sync data missing") from exc
+    signature = (str(SYNC_DATA_PATH), stat.st_mtime_ns, stat.st_size)
+
+    def _top() -> dict[str, Any]:
+        board = _scoreboards.get(
+            signature, lambda: Scoreboard(_load_sync_data(), scorer=compute_scores)
+        )
+        return {"top_scores": board.top(n, category)}
+
+    entry = _score_cache.get((*signature, n, category), _top)
+    return http_cache.respond(request, entry, private=True)
 
 
 @app.post("/render")
-async def render() -> dict[str, str]:
-    """Regenerate markdown outputs like README."""
+async def render(wait: bool = Body(default=False, embed=True)) -> Any:
+    """Queue regeneration of the markdown outputs like README."""
 
     from agentic_index_cli.generate_outputs import main as _main
 
-    await run_in_threadpool(_main)
-    return {"status": "ok"}
+    def _run() -> dict[str, str]:
+        _main()
+        return {"status": "ok"}
+
+    return await _queued("render", {}, _run, wait)
 
 
 class IssueBody(BaseModel):
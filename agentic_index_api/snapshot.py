@@ -0,0 +1,235 @@
+"""Hot-reloaded, indexed view of the ranking data served by the read API."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from agentic_index_cli.internal import json_codec
+from agentic_index_cli.internal.search_index import SearchIndex
+from agentic_index_cli.repo_table import RepoTable
+
+from .repo_index import RepoIndex
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[Optional[Tuple[int, int]], ...]
+# unique per process, unlike ``version`` which restarts with each manager
+_TOKENS = itertools.count(1)
+
+
+def _score_key(repos: list[dict]) -> str:
+    for repo in repos:
+        if "AgenticIndexScore" in repo:
+            return "AgenticIndexScore"
+        if "AgentOpsScore" in repo:
+            return "AgentOpsScore"
+    return "score"
+
+
+def signature(paths: Sequence[Path]) -> Signature:
+    """Return ``(mtime_ns, size)`` of each path, ``None`` for missing ones."""
+    stamps = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+class Snapshot:
+    """Repos from one version of ``repos.json`` with precomputed lookups.
+
+    ``positions`` maps each repo (by identity) to its overall and in-category
+    rank, so lookups do not scan :attr:`ranked`; :attr:`index` holds the sorted
+    indexes behind ``/repos``. A snapshot is never changed after it is
+    published; a reload builds a new one.
+    """
+
+    def __init__(
+        self,
+        table: RepoTable,
+        signature: Signature = (),
+        *,
+        version: int = 0,
+        build_seconds: float = 0.0,
+    ) -> None:
+        self.signature = signature
+        self.version = version
+        self.token = next(_TOKENS)
+        self.built_at = time.time()
+        self.build_seconds = build_seconds
+        self.table = table
+        self.repos = table.to_list()
+        self.score_key = _score_key(self.repos)
+        self.ranked = table.sort_by(self.score_key, reverse=True).to_list()
+        self.name_map: Dict[Optional[str], dict] = {}
+        for repo in self.repos:
+            self.name_map[repo.get("name")] = repo
+            if "full_name" in repo:
+                self.name_map[repo["full_name"]] = repo
+        self.category_totals: Dict[Optional[str], int] = {}
+        self.positions: Dict[int, Tuple[int, int]] = {}
+        for rank, repo in enumerate(self.ranked, 1):
+            category = repo.get("category")
+            in_category = self.category_totals.get(category, 0) + 1
+            self.category_totals[category] = in_category
+            self.positions[id(repo)] = (rank, in_category)
+        self.index = RepoIndex(self.repos, self.score_key)
+        self._search: Optional[SearchIndex] = None
+
+    @property
+    def search(self) -> SearchIndex:
+        """Full-text index of :attr:`repos`, built on first use."""
+        if self._search is None:
+            self._search = SearchIndex.build(self.repos)
+        return self._search
+
+    @classmethod
+    def load(cls, data_file: Path, signature: Signature = (), **kwargs: Any):
+        """Build a snapshot from ``data_file``; a missing file gives no repos."""
+        start = time.perf_counter()
+        table = RepoTable()
+        if Path(data_file).exists():
+            table = RepoTable(json_codec.read(data_file).get("repos", []))
+        snapshot = cls(table, signature, **kwargs)
+        # reuse the index the ranking run saved next to the data when current
+        snapshot._search = SearchIndex.for_data(data_file, snapshot.repos)
+        snapshot.build_seconds = time.perf_counter() - start
+        return snapshot
+
+    def position(self, repo: dict) -> Optional[Tuple[int, int]]:
+        """Return ``(rank, category_rank)`` of ``repo``, ``None`` if unranked."""
+        found = self.positions.get(id(repo))
+        if found is not None and found[0] <= len(self.ranked):
+            if self.ranked[found[0] - 1] is repo:
+                return found
+        # the lists were edited in place; fall back to a scan
+        rank = next((i + 1 for i, r in enumerate(self.ranked) if r is repo), None)
+        if rank is None:
+            return None
+        category = repo.get("category")
+        in_category = sum(
+            1 for r in self.ranked[:rank] if r.get("category") == category
+        )
+        return rank, in_category
+
+
+class SnapshotManager:
+    """Keep the newest :class:`Snapshot` of ``data_file`` published.
+
+    The watched files are polled every ``interval`` seconds. After
+    :meth:`start`, a background thread polls them and builds new snapshots
+    off the request path. Without the thread, :meth:`current` polls inline.
+    Publishing a snapshot is a single reference swap, so a request that
+    already holds a snapshot keeps a consistent view of it.
+    """
+
+    def __init__(
+        self,
+        data_file: Path,
+        watch: Sequence[Path] = (),
+        *,
+        interval: float = 1.0,
+    ) -> None:
+        self.data_file = Path(data_file)
+        self.watch = [Path(p) for p in watch]
+        self.interval = interval
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_check = 0.0
+
+    def _paths(self) -> list[Path]:
+        return [self.data_file, *self.watch]
+
+    def publish(self, snapshot: Snapshot) -> None:
+        """Make ``snapshot`` the one handed to new requests."""
+        self._snapshot = snapshot
+        self._ready.set()
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Rebuild the snapshot if a watched file changed; return ``True`` if so."""
+        with self._lock:
+            self._last_check = time.monotonic()
+            current = signature(self._paths())
+            old = self._snapshot
+            if not force and old is not None and old.signature == current:
+                return False
+            version = old.version + 1 if old is not None else 1
+            self.publish(Snapshot.load(self.data_file, current, version=version))
+        logger.info("loaded snapshot %s of %s", version, self.data_file)
+        return True
+
+    def current(self) -> Snapshot:
+        """Return the published snapshot, loading the first one if needed."""
+        if self.running:
+            if self._snapshot is None:
+                self._ready.wait()
+        elif (
+            self._snapshot is None
+            or time.monotonic() - self._last_check >= self.interval
+        ):
+            self.refresh()
+        assert self._snapshot is not None
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _poll(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:  # pragma: no cover - keep serving the old view
+                logger.exception("failed to reload %s", self.data_file)
+                if self._snapshot is None:
+                    self.publish(Snapshot(RepoTable(), ()))
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Start polling in a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._poll, name="snapshot-reloader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        """Describe the published snapshot for the ``/status`` endpoint."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"loaded": False, "watching": self.running}
+        now = time.time()
+        stamp = snapshot.signature[0] if snapshot.signature else None
+        return {
+            "loaded": True,
+            "watching": self.running,
+            "version": snapshot.version,
+            "repos": len(snapshot.repos),
+            "built_at": snapshot.built_at,
+            "age_seconds": round(now - snapshot.built_at, 3),
+            "build_seconds": round(snapshot.build_seconds, 4),
+            "data_age_seconds": (
+                round(now - stamp[0] / 1e9, 3) if stamp is not None else None
+            ),
+        }
@@ -1,4 +1,3 @@
-import json
 import time
 import uuid
 from pathlib import Path
@@ -6,6 +5,7 @@ from typing import Any, List, Optional
 
 import structlog
 
+from agentic_index_cli.internal import json_codec
 from agentic_index_cli.network import search_and_harvest
 
 STATE_PATH = Path("state/sync_data.json")
@@ -35,7 +35,7 @@ def sync(org: Optional[str] = None, topics: Optional[List[str]] = None) -> List[
         ]
 
     STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    STATE_PATH.write_text(json.dumps(repos, indent=2))
+    STATE_PATH.write_text(json_codec.dumps(repos))
 
     global _cache
     _cache = repos
@@ -12,6 +12,7 @@ import typer
 
 from . import cli as agentic_index
 from . import enricher, faststart, prune
+from .internal import cache_store, history_store, search_index
 from .logging_config import configure_logging, configure_sentry
 
 app = typer.Typer(add_completion=True, help="Agentic Index CLI")
@@ -37,9 +38,32 @@ def scrape(
     min_stars: int = typer.Option(0, "--min-stars"),
     iterations: int = typer.Option(1, "--iterations"),
     output: Path = typer.Option(Path("data"), "--output"),
+    stream: bool = typer.Option(
+        False, "--stream", help="Write repos.jsonl incrementally while harvesting"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue an interrupted run from its checkpoint"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only re-harvest repos changed since the last history snapshot",
+    ),
+    max_pages: int = typer.Option(1, "--max-pages", help="Search pages read per query"),
+    all_pages: bool = typer.Option(
+        False, "--all-pages", help="Shard every query until all matches are read"
+    ),
 ):
     """Scrape repositories."""
-    agentic_index.run_index(min_stars, iterations, output)
+    agentic_index.run_index(
+        min_stars,
+        iterations,
+        output,
+        stream=stream,
+        resume=resume,
+        incremental=incremental,
+        max_pages=None if all_pages else max_pages,
+    )
 
 
 @app.command()
@@ -67,6 +91,65 @@ def prune_cmd(
     prune.prune(inactive, repos_path=repos_path, changelog_path=changelog_path)
 
 
+@app.command()
+def cache_migrate(
+    cache_dir: Path = typer.Option(Path(".cache"), "--cache-dir"),
+    backend: str = typer.Option("sqlite", "--backend"),
+    remove: bool = typer.Option(False, "--remove", help="Delete imported files"),
+):
+    """Import legacy per-file cache entries into the cache store."""
+    store = cache_store.open_store(cache_dir, backend)
+    count = cache_store.migrate_directory(cache_dir, store, remove=remove)
+    typer.echo(f"Imported {count} cache entries")
+
+
+@app.command()
+def cache_evict(
+    cache_dir: Path = typer.Option(Path(".cache"), "--cache-dir"),
+    max_age_days: Optional[float] = typer.Option(None, "--max-age-days"),
+    max_mb: Optional[float] = typer.Option(None, "--max-mb"),
+):
+    """Evict old cache entries and compact the store."""
+    store = cache_store.open_store(cache_dir)
+    removed = store.evict(
+        max_age=max_age_days * 86400 if max_age_days is not None else None,
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+    )
+    store.vacuum()
+    typer.echo(f"Evicted {removed} cache entries")
+
+
+@app.command()
+def history_compact(
+    history_dir: Path = typer.Option(Path("data/history"), "--history-dir"),
+):
+    """Convert full history snapshots to manifests and drop unused records."""
+    store = history_store.HistoryStore(history_dir)
+    converted = store.migrate()
+    removed = store.gc()
+    typer.echo(f"Converted {converted} snapshots, removed {removed} records")
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(...),
+    data_path: Path = typer.Option(Path("data/repos.json"), "--data"),
+    limit: int = typer.Option(10, "--limit"),
+    blend: float = typer.Option(
+        0.0, "--blend", min=0.0, max=1.0, help="Weight of the repo score"
+    ),
+    prefix: bool = typer.Option(True, "--prefix/--no-prefix"),
+):
+    """Search repo names, descriptions, topics and READMEs."""
+    index = search_index.SearchIndex.for_data(data_path)
+    results = index.search(query, limit=limit, prefix=prefix, blend=blend)
+    if not results:
+        typer.echo("No matches")
+        return
+    for i, (name, relevance, _) in enumerate(results, start=1):
+        typer.echo(f"{i:>3}. {name}  {relevance:.3f}")
+
+
 def run(args: Optional[List[str]] = None) -> None:
     log = structlog.get_logger(__name__).bind(run_id=str(uuid.uuid4()))
     start = time.perf_counter()
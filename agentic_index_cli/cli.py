@@ -12,8 +12,16 @@ from rich.progress import track
 
 from agentic_index_cli.constants import SCORE_KEY
 
-from .network import search_and_harvest
-from .render import changelog, load_previous, save_changelog, save_csv, save_markdown
+from .network import search_and_harvest, stream_search_and_harvest
+from .render import (
+    JsonlSink,
+    TopN,
+    changelog,
+    load_previous,
+    save_changelog,
+    save_csv,
+    save_markdown,
+)
 
 
 def sort_and_select(repos: List[Dict], limit: int = 100) -> List[Dict]:
@@ -22,10 +30,53 @@ def sort_and_select(repos: List[Dict], limit: int = 100) -> List[Dict]:
     return repos[:limit]
 
 
+def stream_index(
+    min_stars: int,
+    path: Path,
+    limit: int = 100,
+    resume: bool = False,
+    incremental: bool = False,
+    max_pages: int | None = 1,
+) -> List[Dict]:
+    """Write harvested repos to ``path`` as they arrive and return the top ``limit``.
+
+    Only the current top ``limit`` repos are held in memory.
+    """
+    top = TopN(limit)
+    with JsonlSink(path) as sink:
+
+        def _consume(repo: Dict) -> None:
+            sink.write(repo)
+            top.add(repo)
+
+        stream_search_and_harvest(
+            _consume,
+            min_stars,
+            max_pages=max_pages,
+            resume=resume,
+            incremental=incremental,
+        )
+    return top.items()
+
+
 def run_index(
-    min_stars: int = 0, iterations: int = 1, output: Path = Path("data")
+    min_stars: int = 0,
+    iterations: int = 1,
+    output: Path = Path("data"),
+    stream: bool = False,
+    resume: bool = False,
+    incremental: bool = False,
+    max_pages: int | None = 1,
 ) -> None:
-    """Run the full indexing workflow."""
+    """Run the full indexing workflow.
+
+    With ``stream`` every harvested repo is appended to ``output/repos.jsonl``
+    as soon as it is scored instead of being collected first. ``resume``
+    continues an interrupted harvest from its journal under ``state/`` and
+    ``incremental`` re-harvests only repos changed since the last snapshot.
+    ``max_pages`` caps the search pages read per query; ``None`` shards every
+    query until all matches are read.
+    """
     is_test = os.getenv("PYTEST_CURRENT_TEST") is not None
     output.mkdir(parents=True, exist_ok=True)
     prev_csv = output / "top100.csv"
@@ -36,8 +87,16 @@ def run_index(
     for _ in track(
         range(iterations), description="ranking", disable=not sys.stderr.isatty()
     ):
-        repos = search_and_harvest(min_stars)
-        top = sort_and_select(repos, 100)
+        if stream:
+            top = stream_index(
+                min_stars, output / "repos.jsonl", 100, resume, incremental, max_pages
+            )
+        else:
+            repos = search_and_harvest(
+                min_stars, max_pages=max_pages, resume=resume, incremental=incremental
+            )
+            top = sort_and_select(repos, 100)
+        resume = False
         names = [r["name"] for r in top]
         if names == last_top:
             break
@@ -59,9 +118,38 @@ def main() -> None:
     parser.add_argument("--min-stars", type=int, default=0)
     parser.add_argument("--iterations", type=int, default=1)
     parser.add_argument("--output", type=Path, default=Path("data"))
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="write repos.jsonl incrementally while harvesting",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="continue an interrupted run"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-harvest repos changed since the last snapshot",
+    )
+    parser.add_argument(
+        "--max-pages", type=int, default=1, help="search pages read per query"
+    )
+    parser.add_argument(
+        "--all-pages",
+        action="store_true",
+        help="shard every query until all matches are read",
+    )
     args = parser.parse_args()
 
-    run_index(args.min_stars, args.iterations, args.output)
+    run_index(
+        args.min_stars,
+        args.iterations,
+        args.output,
+        stream=args.stream,
+        resume=args.resume,
+        incremental=args.incremental,
+        max_pages=None if args.all_pages else args.max_pages,
+    )
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution
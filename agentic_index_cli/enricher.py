@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 
 from jsonschema import Draft7Validator
 
+from .repo_table import RepoTable
 from .scoring import (
     categorize,
     compute_issue_health,
@@ -44,9 +45,18 @@ def _previous_map(data_file: Path) -> Dict[str, Dict]:
     return {r.get("full_name", r.get("name")): r for r in prev_repos}
 
 
-def enrich(path: Path) -> None:
-    """Add derived fields to a repository JSON file."""
-    data = load_repos(path)
+def enrich(path: Path, table: Optional[RepoTable] = None) -> RepoTable:
+    """Add derived fields to a repository JSON file.
+
+    ``table`` supplies the repos in memory instead of reading ``path``. The
+    enriched repos are written to ``path`` and returned as a table that can
+    be passed on to :func:`agentic_index_cli.internal.rank_main.main`.
+    """
+    if table is None:
+        data = load_repos(path)
+    else:
+        data = table.to_list()
+        table.invalidate()
     prev_map = _previous_map(path)
     schema_path = Path(__file__).resolve().parents[1] / "schemas" / "repo.schema.json"
     schema = json.loads(schema_path.read_text())
@@ -101,6 +111,7 @@ def enrich(path: Path) -> None:
             item = dict(item)
             item["license"] = {"spdx_id": lic}
         validator.validate(item)
+    return RepoTable(data)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
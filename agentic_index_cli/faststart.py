@@ -30,30 +30,36 @@ def generate_table(repos):
     return "\n".join(lines) + "\n"
 
 
+from .constants import SCORE_KEY
+from .repo_table import RepoTable
 from .validate import load_repos
 
 
-def run(top: int, data_path: Path, output_path: Path | None = None) -> None:
-    """Write a FAST_START table for the highest scored repos."""
-    repos = load_repos(data_path)
+def run(
+    top: int,
+    data_path: Path,
+    output_path: Path | None = None,
+    table: RepoTable | None = None,
+) -> None:
+    """Write a FAST_START table for the highest scored repos.
 
-    filtered = [
-        r for r in repos if r.get("stars", 0) >= 5000 and r.get("doc_completeness") == 1
-    ]
+    ``table`` supplies the repos in memory instead of reading ``data_path``.
+    """
+    if table is None:
+        table = RepoTable(load_repos(data_path))
 
-    ranked = sorted(
-        filtered,
-        key=lambda r: r.get("AgenticIndexScore", r.get("AgentOpsScore", 0)),
-        reverse=True,
+    filtered = table.where(
+        (table.column("stars", default=0) >= 5000)
+        & (table.column("doc_completeness", coerce=True) == 1)
     )
-    ranked = ranked[:top]
+    ranked = filtered.sort_by(SCORE_KEY, reverse=True).head(top)
 
-    table = generate_table(ranked)
+    markdown = generate_table(ranked)
 
     if output_path is None:
         output_path = Path("FAST_START.md")
     with output_path.open("w") as f:
-        f.write(table)
+        f.write(markdown)
 
 
 def main(argv=None):
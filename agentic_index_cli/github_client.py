@@ -1,11 +1,13 @@
 import os
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 import aiohttp
 
-from .internal import http_utils
+from .internal import cache_store, http_utils, rate_limit
 
 GITHUB_API = "https://api.github.com"
+GRAPHQL_API = f"{GITHUB_API}/graphql"
 DEFAULT_HEADERS = {"Accept": "application/vnd.github+json"}
 TOKEN = os.getenv("GITHUB_TOKEN")
 if TOKEN:
@@ -14,26 +16,93 @@ if TOKEN:
 MAX_RETRIES = int(os.getenv("NETWORK_RETRIES", str(http_utils.DEFAULT_RETRIES)))
 REQUEST_TIMEOUT = float(os.getenv("NETWORK_TIMEOUT", str(http_utils.DEFAULT_TIMEOUT)))
 BACKOFF_FACTOR = float(os.getenv("NETWORK_BACKOFF", str(http_utils.DEFAULT_BACKOFF)))
+HARVEST_BACKENDS = ("rest", "graphql")
+HARVEST_BACKEND = os.getenv("HARVEST_BACKEND", "rest")
+POOL_SIZE = int(os.getenv("NETWORK_POOL_SIZE", str(http_utils.DEFAULT_POOL_SIZE)))
+POOL_PER_HOST = int(
+    os.getenv("NETWORK_POOL_PER_HOST", str(http_utils.DEFAULT_POOL_PER_HOST))
+)
+CONCURRENCY = {
+    kind: int(os.getenv(f"NETWORK_CONCURRENCY_{kind.upper()}", str(limit)))
+    for kind, limit in http_utils.DEFAULT_CONCURRENCY.items()
+}
+
+CONDITIONAL_CACHE = os.getenv("NETWORK_CONDITIONAL_CACHE", "1") != "0"
+HTTP_CACHE_DIR = Path(os.getenv("NETWORK_HTTP_CACHE_DIR", ".cache"))
+HTTP_CACHE_MAX_AGE = float(
+    os.getenv("NETWORK_HTTP_CACHE_MAX_AGE", str(http_utils.DEFAULT_HTTP_CACHE_MAX_AGE))
+)
+RATE_LOW_WATER = float(
+    os.getenv("NETWORK_RATE_LOW_WATER", str(rate_limit.DEFAULT_LOW_WATER))
+)
+
+_http_cache: Optional[http_utils.ConditionalCache] = None
+_scheduler = rate_limit.RateLimitScheduler(low_water=RATE_LOW_WATER)
+
+
+def client() -> http_utils.SharedClient:
+    """Return the process-wide HTTP client used for GitHub traffic."""
+    return http_utils.get_client(
+        limit=POOL_SIZE, limit_per_host=POOL_PER_HOST, concurrency=CONCURRENCY
+    )
+
+
+def http_cache() -> http_utils.ConditionalCache:
+    """Return the ETag/Last-Modified cache shared by GitHub GETs."""
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = http_utils.ConditionalCache(
+            cache_store.open_store(HTTP_CACHE_DIR), max_age=HTTP_CACHE_MAX_AGE
+        )
+        _http_cache.prune()
+    return _http_cache
+
+
+def record_cache_hit() -> None:
+    """Count a cache hit in :func:`http_cache` unless the cache is disabled."""
+    if CONDITIONAL_CACHE:
+        http_cache().record_hit()
+
+
+def http_cache_stats() -> Optional[Dict[str, int]]:
+    """Return :func:`http_cache` counters, or ``None`` if it is disabled."""
+    return http_cache().stats() if CONDITIONAL_CACHE else None
+
+
+def scheduler() -> rate_limit.RateLimitScheduler:
+    """Return the rate-limit scheduler pacing GitHub requests."""
+    return _scheduler
+
+
+def _cache_arg() -> Optional[http_utils.ConditionalCache]:
+    return http_cache() if CONDITIONAL_CACHE else None
 
 
 async def async_get(
     url: str,
     *,
-    session: aiohttp.ClientSession,
+    session: Optional[aiohttp.ClientSession] = None,
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
 ) -> http_utils.Response:
-    """Make an authenticated async GET request to GitHub."""
+    """Make an authenticated async GET request to GitHub.
+
+    Requests go through the shared :func:`client` pool unless an explicit
+    ``session`` is supplied.
+    """
     hdrs = DEFAULT_HEADERS if headers is None else {**DEFAULT_HEADERS, **headers}
-    return await http_utils.async_get(
-        url,
+    kwargs: Dict[str, Any] = dict(
         params=params,
         headers=hdrs,
-        session=session,
         retries=MAX_RETRIES,
         timeout=REQUEST_TIMEOUT,
         backoff_factor=BACKOFF_FACTOR,
+        cache=_cache_arg(),
+        scheduler=_scheduler,
     )
+    if session is not None:
+        return await http_utils.async_get(url, session=session, **kwargs)
+    return await client().async_get(url, **kwargs)
 
 
 def get(
@@ -51,4 +120,26 @@ def get(
         retries=MAX_RETRIES,
         timeout=REQUEST_TIMEOUT,
         backoff_factor=BACKOFF_FACTOR,
+        client=client(),
+        cache=_cache_arg(),
+        scheduler=_scheduler,
+    )
+
+
+async def async_graphql(
+    query: str,
+    *,
+    variables: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> http_utils.Response:
+    """POST ``query`` to the GitHub GraphQL endpoint."""
+    hdrs = DEFAULT_HEADERS if headers is None else {**DEFAULT_HEADERS, **headers}
+    return await client().async_post(
+        GRAPHQL_API,
+        json_body={"query": query, "variables": variables or {}},
+        headers=hdrs,
+        retries=MAX_RETRIES,
+        timeout=REQUEST_TIMEOUT,
+        backoff_factor=BACKOFF_FACTOR,
+        scheduler=_scheduler,
     )
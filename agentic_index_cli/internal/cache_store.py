@@ -0,0 +1,309 @@
+"""Pluggable key/value stores backing the ``.cache`` directory."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import json_codec
+
+DEFAULT_BACKEND = os.getenv("CACHE_BACKEND", "sqlite")
+SQLITE_NAME = "cache.sqlite3"
+_BATCH = 500
+
+
+class CacheStore:
+    """Base interface for cache stores.
+
+    Keys are the legacy ``.cache`` file names (``repo_owner_name.json``,
+    ``readme_owner_name.txt``...) and values are JSON-serializable objects.
+    ``max_age`` filters on the time an entry was written while ``ttl`` sets
+    an explicit expiry when storing it.
+    """
+
+    def get(self, key: str, *, max_age: Optional[float] = None) -> Any | None:
+        return self.get_many([key], max_age=max_age).get(key)
+
+    def put(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        self.put_many({key: value}, ttl=ttl)
+
+    def get_many(
+        self, keys: Iterable[str], *, max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def put_many(
+        self,
+        items: Dict[str, Any],
+        *,
+        ttl: Optional[float] = None,
+        updated: Optional[float] = None,
+    ) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def keys(self) -> List[str]:
+        raise NotImplementedError
+
+    def evict(
+        self, *, max_age: Optional[float] = None, max_bytes: Optional[int] = None
+    ) -> int:
+        """Drop expired and stale entries and return how many were removed.
+
+        Entries older than ``max_age`` seconds go first, then the oldest
+        entries until the store fits in ``max_bytes``.
+        """
+        raise NotImplementedError
+
+    def vacuum(self) -> None:
+        """Reclaim space freed by deletions."""
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class FileCacheStore(CacheStore):
+    """Legacy layout with one file per key under ``root``.
+
+    ``.txt`` keys hold raw text, everything else pretty-printed JSON. The
+    file mtime doubles as the write time; ``ttl`` is not supported.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def _read(self, path: Path, key: str) -> Any:
+        if key.endswith(".txt"):
+            return path.read_text()
+        return json_codec.read(path)
+
+    def get_many(
+        self, keys: Iterable[str], *, max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
+        now = time.time()
+        found: Dict[str, Any] = {}
+        for key in keys:
+            path = self.root / key
+            try:
+                if max_age is not None and now - path.stat().st_mtime >= max_age:
+                    continue
+                found[key] = self._read(path, key)
+            except (OSError, ValueError):
+                continue
+        return found
+
+    def put_many(
+        self,
+        items: Dict[str, Any],
+        *,
+        ttl: Optional[float] = None,
+        updated: Optional[float] = None,
+    ) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        for key, value in items.items():
+            path = self.root / key
+            if key.endswith(".txt"):
+                path.write_text(value)
+            else:
+                json_codec.write(path, value)
+            if updated is not None:
+                os.utime(path, (updated, updated))
+
+    def delete(self, key: str) -> None:
+        (self.root / key).unlink(missing_ok=True)
+
+    def keys(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(
+            p.name
+            for p in self.root.iterdir()
+            if p.is_file() and p.suffix in {".json", ".txt"}
+        )
+
+    def evict(
+        self, *, max_age: Optional[float] = None, max_bytes: Optional[int] = None
+    ) -> int:
+        entries = []
+        for key in self.keys():
+            st = (self.root / key).stat()
+            entries.append((st.st_mtime, st.st_size, key))
+        entries.sort(reverse=True)
+        cutoff = time.time() - max_age if max_age is not None else None
+        total = 0
+        removed = 0
+        for mtime, size, key in entries:
+            total += size
+            too_old = cutoff is not None and mtime < cutoff
+            too_big = max_bytes is not None and total > max_bytes
+            if too_old or too_big:
+                self.delete(key)
+                removed += 1
+        return removed
+
+
+class SQLiteCacheStore(CacheStore):
+    """Single-file store with indexed keys and write/expiry time columns."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "updated REAL NOT NULL, expires REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_updated ON cache(updated)")
+
+    def get_many(
+        self, keys: Iterable[str], *, max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
+        keys = list(keys)
+        now = time.time()
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for i in range(0, len(keys), _BATCH):
+                chunk = keys[i : i + _BATCH]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value, updated, expires FROM cache "
+                    f"WHERE key IN ({marks})",
+                    chunk,
+                ).fetchall()
+                for key, value, updated, expires in rows:
+                    if expires is not None and expires <= now:
+                        continue
+                    if max_age is not None and now - updated >= max_age:
+                        continue
+                    found[key] = json_codec.loads(value)
+        return found
+
+    def put_many(
+        self,
+        items: Dict[str, Any],
+        *,
+        ttl: Optional[float] = None,
+        updated: Optional[float] = None,
+    ) -> None:
+        now = time.time() if updated is None else updated
+        expires = now + ttl if ttl is not None else None
+        rows: List[Tuple[str, str, int, float, Optional[float]]] = []
+        for key, value in items.items():
+            encoded = json_codec.dumps(value, compact=True)
+            rows.append((key, encoded, len(encoded.encode()), now, expires))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache "
+                    "(key, value, size, updated, expires) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM cache ORDER BY key").fetchall()
+        return [r[0] for r in rows]
+
+    def evict(
+        self, *, max_age: Optional[float] = None, max_bytes: Optional[int] = None
+    ) -> int:
+        now = time.time()
+        removed = 0
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (now,)
+            )
+            removed += cur.rowcount
+            if max_age is not None:
+                cur = self._conn.execute(
+                    "DELETE FROM cache WHERE updated < ?", (now - max_age,)
+                )
+                removed += cur.rowcount
+            if max_bytes is not None:
+                total = 0
+                stale = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM cache ORDER BY updated DESC"
+                ):
+                    total += size
+                    if total > max_bytes:
+                        stale.append((key,))
+                self._conn.executemany("DELETE FROM cache WHERE key = ?", stale)
+                removed += len(stale)
+        return removed
+
+    def vacuum(self) -> None:
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+BACKENDS = {"sqlite": SQLiteCacheStore, "files": FileCacheStore}
+
+_stores: Dict[Tuple[str, Path], CacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(root: Path, backend: str | None = None) -> CacheStore:
+    """Return the shared cache store for the ``root`` cache directory."""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown cache backend {backend!r}")
+    key = (backend, Path(root).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if backend == "sqlite":
+                store = SQLiteCacheStore(Path(root) / SQLITE_NAME)
+            else:
+                store = FileCacheStore(Path(root))
+            _stores[key] = store
+        return store
+
+
+def migrate_directory(root: Path, store: CacheStore, *, remove: bool = False) -> int:
+    """Import legacy per-file entries under ``root`` into ``store``.
+
+    Entries keep their file mtime as write time so TTL checks carry over.
+    Files from the ``http`` subdirectory are stored as ``http_<name>``.
+    Return the number of entries imported.
+    """
+    legacy = FileCacheStore(root)
+    sources = [(legacy, key, key) for key in legacy.keys()]
+    http = FileCacheStore(Path(root) / "http")
+    sources += [(http, key, f"http_{key}") for key in http.keys()]
+    count = 0
+    for src, key, new_key in sources:
+        path = src.root / key
+        value = src.get(key)
+        if value is None:
+            continue
+        store.put_many({new_key: value}, updated=path.stat().st_mtime)
+        if remove:
+            path.unlink()
+        count += 1
+    return count
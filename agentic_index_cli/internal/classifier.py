@@ -0,0 +1,183 @@
+"""Keyword classifier for repo categories and ecosystems.
+
+The rules live in ``agentic_index_cli/categories.yaml``, or in the file named
+by ``AGENTIC_INDEX_CATEGORIES``, grouped in schemes such as ``category`` for
+the ranking labels. The keywords of every scheme
+are compiled into one regular expression. Classifying a text is therefore
+one scan, however many labels there are, and that scan answers every scheme
+at once. Results are cached per text, so asking for the category and then
+the ecosystem of the same text scans it only once.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, constr
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "categories.yaml"
+RULES_ENV = "AGENTIC_INDEX_CATEGORIES"
+CACHE_SIZE = 65536
+
+
+class RuleModel(BaseModel):
+    """One label and the keywords that select it."""
+
+    label: str
+    priority: int = 0
+    keywords: List[constr(min_length=1)] = Field(min_length=1)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SchemeModel(BaseModel):
+    """Labels competing for one answer, e.g. a repo's category."""
+
+    default: Optional[str] = None
+    labels: List[RuleModel]
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class RulesModel(BaseModel):
+    schemes: Dict[str, SchemeModel]
+
+    model_config = ConfigDict(extra="forbid")
+
+
+def _trie_pattern(keywords: List[str]) -> str:
+    """Return a regex matching any of ``keywords``, longest first.
+
+    Keywords sharing a prefix share its branch, so a position is compared
+    with each prefix once instead of with every keyword.
+    """
+    root: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # greedy, so a longer keyword wins over its prefix
+        return f"(?:{body})?" if "" in node else body
+
+    return build(root)
+
+
+@dataclass(frozen=True)
+class Match:
+    scheme: str
+    label: str
+    priority: int
+
+
+class Classifier:
+    """Match texts against the keyword rules of several schemes at once.
+
+    Keywords match as case-insensitive substrings, like the ``in`` checks
+    this replaces.
+    """
+
+    def __init__(self, schemes: Dict[str, SchemeModel]) -> None:
+        self.defaults = {name: scheme.default for name, scheme in schemes.items()}
+        owners: Dict[str, List[Match]] = {}
+        ordered: List[Tuple[int, int, int, Match]] = []
+        for s, (name, scheme) in enumerate(schemes.items()):
+            for r, rule in enumerate(scheme.labels):
+                match = Match(name, rule.label, rule.priority)
+                ordered.append((s, -rule.priority, r, match))
+                for keyword in rule.keywords:
+                    owners.setdefault(keyword.lower(), []).append(match)
+        # best first within a scheme; ties keep the order of the rules file
+        self._rank: Dict[Match, int] = {}
+        for entry in sorted(ordered, key=lambda e: e[:3]):
+            self._rank.setdefault(entry[3], len(self._rank))
+
+        # The pattern tries every position and reports the longest keyword
+        # starting there; the keywords inside it occur there as well.
+        keywords = sorted(owners)
+        self._implied: Dict[str, FrozenSet[Match]] = {
+            keyword: frozenset(
+                match
+                for other in keywords
+                if other in keyword
+                for match in owners[other]
+            )
+            for keyword in keywords
+        }
+        self._pattern = None
+        if keywords:
+            self._pattern = re.compile(f"(?=({_trie_pattern(keywords)}))")
+        self._matches = lru_cache(maxsize=CACHE_SIZE)(self._scan)
+        # texts share few distinct keyword sets, so their ranking is cached
+        self._resolve = lru_cache(maxsize=CACHE_SIZE)(self._rank_matches)
+
+    def _rank_matches(self, keywords: FrozenSet[str]) -> Tuple[Match, ...]:
+        found = set().union(*(self._implied[keyword] for keyword in keywords))
+        return tuple(sorted(found, key=self._rank.__getitem__))
+
+    def _scan(self, text: str) -> Tuple[Match, ...]:
+        if self._pattern is None:
+            return ()
+        keywords = frozenset(self._pattern.findall(text.lower()))
+        return self._resolve(keywords) if keywords else ()
+
+    def matches(self, text: str) -> Tuple[Match, ...]:
+        """Return every label ``text`` matches, grouped by scheme, best first."""
+        return self._matches(text)
+
+    def labels(self, text: str, scheme: str) -> List[str]:
+        """Return the labels of ``scheme`` that ``text`` matches, best first."""
+        return [m.label for m in self._matches(text) if m.scheme == scheme]
+
+    def classify(self, text: str, scheme: str) -> Optional[str]:
+        """Return the best label of ``scheme`` for ``text``, or its default."""
+        for match in self._matches(text):
+            if match.scheme == scheme:
+                return match.label
+        return self.defaults[scheme]
+
+
+def load_rules(path: str | Path | None = None) -> Classifier:
+    """Return a :class:`Classifier` for the rules file at ``path``."""
+    p = Path(path) if path else DEFAULT_PATH
+    with p.open("r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f) or {}
+    try:
+        rules = RulesModel.model_validate(raw)
+    except ValidationError as exc:
+        errors = "; ".join(
+            f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}"
+            for err in exc.errors()
+        )
+        raise ValueError(f"invalid rules file {p}: {errors}") from None
+    return Classifier(rules.schemes)
+
+
+@lru_cache(maxsize=None)
+def _cached_rules(path: Path) -> Classifier:
+    return load_rules(path)
+
+
+def default_classifier() -> Classifier:
+    """Return the classifier for ``$AGENTIC_INDEX_CATEGORIES`` or the bundled rules.
+
+    Each rules file is loaded once per process.
+    """
+    path = os.getenv(RULES_ENV)
+    return _cached_rules(Path(path).resolve() if path else DEFAULT_PATH)
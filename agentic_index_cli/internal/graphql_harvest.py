@@ -0,0 +1,180 @@
+"""Batched repository harvesting via the GitHub GraphQL API."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from ..github_client import async_graphql
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+# README bodies make responses far larger, so batches that fetch them are
+# smaller to stay within GraphQL response size and time limits
+TEXT_BATCH_SIZE = 10
+README_PATHS = ["README.md", "readme.md", "README.rst", "README"]
+DOC_PATHS = ["docs/index.md", "docs/README.md", "documentation/README.md"]
+
+_FRAGMENT = """
+fragment RepoFields on Repository {
+  nameWithOwner
+  name
+  url
+  description
+  stargazerCount
+  forkCount
+  isArchived
+  pushedAt
+  owner { login }
+  licenseInfo { spdxId }
+  primaryLanguage { name }
+  openIssues: issues(states: OPEN) { totalCount }
+  closedIssues: issues(states: CLOSED) { totalCount }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+}
+"""
+
+
+@dataclass
+class RepoSnapshot:
+    """Metadata for one repository returned by a batched query."""
+
+    repo: Dict[str, Any]
+    readme: str
+    readme_size: int
+    has_docs: bool
+
+
+def build_query(names: List[str], *, readme_text: bool = False) -> str:
+    """Return one GraphQL query covering every repository in ``names``.
+
+    README blobs report only their size unless ``readme_text`` is set.
+    """
+    blob = "byteSize text" if readme_text else "byteSize"
+    parts = []
+    for i, full_name in enumerate(names):
+        owner, _, name = full_name.partition("/")
+        objects = [
+            f'readme{j}: object(expression: "HEAD:{path}") {{ ... on Blob {{ {blob} }} }}'
+            for j, path in enumerate(README_PATHS)
+        ] + [
+            f'doc{j}: object(expression: "HEAD:{path}") {{ __typename }}'
+            for j, path in enumerate(DOC_PATHS)
+        ]
+        parts.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ ...RepoFields {' '.join(objects)} }}"
+        )
+    return "query {\n" + "\n".join(parts) + "\n}\n" + _FRAGMENT
+
+
+def _to_snapshot(node: Dict[str, Any]) -> RepoSnapshot:
+    """Convert a GraphQL repository node to REST-shaped metadata.
+
+    ``open_issues_count`` counts issues only; the REST field also includes
+    open pull requests.
+    """
+    lic = node.get("licenseInfo") or {}
+    lang = node.get("primaryLanguage") or {}
+    topics = [
+        t["topic"]["name"]
+        for t in (node.get("repositoryTopics") or {}).get("nodes", [])
+        if t and t.get("topic")
+    ]
+    repo = {
+        "name": node.get("name"),
+        "full_name": node.get("nameWithOwner"),
+        "html_url": node.get("url"),
+        "description": node.get("description"),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "open_issues_count": (node.get("openIssues") or {}).get("totalCount", 0),
+        "closed_issues": (node.get("closedIssues") or {}).get("totalCount", 0),
+        "archived": node.get("isArchived", False),
+        "license": {"spdx_id": lic.get("spdxId")} if lic else None,
+        "language": lang.get("name"),
+        "pushed_at": node.get("pushedAt"),
+        "owner": node.get("owner") or {},
+        "topics": topics,
+    }
+    readme = next(
+        (
+            node[f"readme{j}"]
+            for j in range(len(README_PATHS))
+            if node.get(f"readme{j}") is not None
+        ),
+        {},
+    )
+    has_docs = any(node.get(f"doc{j}") is not None for j in range(len(DOC_PATHS)))
+    return RepoSnapshot(
+        repo=repo,
+        readme=readme.get("text") or "",
+        readme_size=readme.get("byteSize", 0),
+        has_docs=has_docs,
+    )
+
+
+async def async_fetch_batch(
+    names: List[str],
+    *,
+    readme_text: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, RepoSnapshot]:
+    """Fetch ``names`` with a single GraphQL query.
+
+    Missing repositories and failed queries are omitted from the result so
+    callers can fall back to REST for them.
+    """
+    query = build_query(names, readme_text=readme_text)
+    try:
+        resp = await async_graphql(query, headers=headers)
+    except Exception as exc:  # pragma: no cover - network error path
+        logger.warning("GraphQL batch failed: %s", exc)
+        return {}
+    if resp.status_code != 200:
+        logger.warning("GraphQL batch error %s: %s", resp.status_code, resp.text)
+        return {}
+    try:
+        payload = resp.json()
+    except ValueError as exc:
+        logger.warning("GraphQL batch returned bad JSON: %s", exc)
+        return {}
+    for err in payload.get("errors") or []:
+        logger.warning("GraphQL error: %s", err.get("message"))
+    data = payload.get("data") or {}
+    results: Dict[str, RepoSnapshot] = {}
+    for i, full_name in enumerate(names):
+        node = data.get(f"r{i}")
+        if node:
+            results[full_name] = _to_snapshot(node)
+    return results
+
+
+async def async_fetch_all(
+    names: List[str],
+    *,
+    batch_size: Optional[int] = None,
+    readme_text: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, RepoSnapshot]:
+    """Fetch ``names`` in concurrent batches of ``batch_size`` repositories.
+
+    ``batch_size`` defaults to :data:`BATCH_SIZE`, or :data:`TEXT_BATCH_SIZE`
+    when README text is requested.
+    """
+    if batch_size is None:
+        batch_size = TEXT_BATCH_SIZE if readme_text else BATCH_SIZE
+    batches = [names[i : i + batch_size] for i in range(0, len(names), batch_size)]
+    results: Dict[str, RepoSnapshot] = {}
+    for part in await asyncio.gather(
+        *(
+            async_fetch_batch(batch, readme_text=readme_text, headers=headers)
+            for batch in batches
+        )
+    ):
+        results.update(part)
+    return results
@@ -0,0 +1,232 @@
+"""Per-repo time series of the metrics in the ``data/history`` snapshots.
+
+The index lives in ``history/index/timeseries.json`` and holds, for every
+repo, its ``[date, stars, forks, issues, score]`` points plus the name,
+language and category from its newest snapshot. :meth:`HistoryIndex.update`
+only reads snapshots added or changed since the index was written, so
+history lookups and trend plots cost one pass over the points they need
+instead of parsing every snapshot.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..constants import SCORE_KEY
+from . import json_codec
+from .history_store import HistoryStore
+
+INDEX_PATH = Path("index") / "timeseries.json"
+INDEX_VERSION = 1
+FIELDS = ("stars", "forks", "issues", "score")
+_SCORE_KEYS = (SCORE_KEY, "AgentOpsScore", "score")
+_DIGESTS: Dict[Path, Tuple[int, int, str]] = {}
+
+
+def repo_key(repo: Dict[str, Any]) -> Optional[str]:
+    """Return the name a repo is indexed under."""
+    return repo.get("full_name") or repo.get("name")
+
+
+def _metrics(repo: Dict[str, Any]) -> List[Any]:
+    stars = repo.get("stars", repo.get("stargazers_count"))
+    score = next((repo[k] for k in _SCORE_KEYS if k in repo), None)
+    return [stars, repo.get("forks_count"), repo.get("open_issues_count"), score]
+
+
+def _items(raw: Any) -> List[Any]:
+    if isinstance(raw, dict):
+        raw = raw.get("repos", [])
+    return raw if isinstance(raw, list) else []
+
+
+def _digest(path: Path) -> str:
+    stat = path.stat()
+    seen = _DIGESTS.get(path)
+    if seen is not None and seen[:2] == (stat.st_size, stat.st_mtime_ns):
+        return seen[2]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _DIGESTS[path] = (stat.st_size, stat.st_mtime_ns, digest)
+    return digest
+
+
+def fingerprints(history_dir: Path) -> Dict[str, str]:
+    """Return ``{date: sha256}`` for the dated snapshots in ``history_dir``.
+
+    Hashing the content keeps the index valid across git checkouts, which
+    reset every mtime. Digests are remembered per size and mtime, so a
+    process only rereads snapshots that were touched.
+    """
+    found: Dict[str, str] = {}
+    for path in HistoryStore(history_dir).snapshots():
+        try:
+            datetime.date.fromisoformat(path.stem)
+            found[path.stem] = _digest(path)
+        except (ValueError, OSError):
+            continue
+    return found
+
+
+class HistoryIndex:
+    """Time series of :data:`FIELDS` per repo across history snapshots."""
+
+    def __init__(self) -> None:
+        self.sources: Dict[str, str] = {}
+        self.repos: Dict[str, Dict[str, Any]] = {}
+        self._names: Optional[Dict[str, List[str]]] = None
+
+    @property
+    def dates(self) -> List[str]:
+        """Return the indexed snapshot dates, oldest first."""
+        return sorted(self.sources)
+
+    # -- persistence -----------------------------------------------------------
+
+    @classmethod
+    def load(cls, history_dir: Path) -> "HistoryIndex":
+        """Return the saved index for ``history_dir``, or an empty one."""
+        index = cls()
+        path = Path(history_dir) / INDEX_PATH
+        try:
+            raw = json_codec.read(path)
+        except (OSError, ValueError):
+            return index
+        if raw.get("version") == INDEX_VERSION and raw.get("fields") == list(FIELDS):
+            index.sources = raw["sources"]
+            index.repos = raw["repos"]
+        return index
+
+    def save(self, history_dir: Path) -> None:
+        path = Path(history_dir) / INDEX_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "fields": list(FIELDS),
+            "sources": self.sources,
+            "repos": self.repos,
+        }
+        tmp = path.with_suffix(".tmp")
+        json_codec.write(tmp, payload, compact=True)
+        tmp.replace(path)
+
+    @classmethod
+    def build(cls, history_dir: Path) -> "HistoryIndex":
+        """Load the saved index and bring it up to date in memory."""
+        index = cls.load(history_dir)
+        index.update(history_dir)
+        return index
+
+    # -- maintenance -----------------------------------------------------------
+
+    def update(self, history_dir: Path) -> bool:
+        """Index new or changed snapshots, forget deleted ones.
+
+        Returns ``True`` if anything changed.
+        """
+        store = HistoryStore(history_dir)
+        current = fingerprints(history_dir)
+        stale = {d for d, fp in self.sources.items() if current.get(d) != fp}
+        if stale:
+            self._drop(stale)
+        added = sorted(d for d in current if d not in self.sources)
+        for day in added:
+            try:
+                raw = store.read(Path(history_dir) / f"{day}.json")
+            except (OSError, ValueError):
+                raw = []
+            self.add(day, _items(raw))
+            self.sources[day] = current[day]
+        return bool(stale or added)
+
+    def _drop(self, days: set) -> None:
+        for day in days:
+            self.sources.pop(day, None)
+        for key in list(self.repos):
+            entry = self.repos[key]
+            entry["points"] = [p for p in entry["points"] if p[0] not in days]
+            if not entry["points"]:
+                del self.repos[key]
+        self._names = None
+
+    def add(self, day: str, repos: List[Any]) -> None:
+        """Add the points of one snapshot taken on ``day``."""
+        for repo in repos:
+            if not isinstance(repo, dict):
+                continue
+            key = repo_key(repo)
+            if not key:
+                continue
+            entry = self.repos.setdefault(key, {"points": []})
+            points = entry["points"]
+            point = [day, *_metrics(repo)]
+            if points and points[-1][0] >= day:
+                pos = bisect.bisect_left([p[0] for p in points], day)
+                # a repo listed twice in one snapshot keeps its first entry
+                if points[pos][0] != day:
+                    points.insert(pos, point)
+                continue
+            points.append(point)
+            entry["name"] = repo.get("name", key)
+            entry["language"] = repo.get("language")
+            entry["category"] = repo.get("category")
+        self._names = None
+
+    # -- queries ---------------------------------------------------------------
+
+    def lookup(self, name: str) -> List[str]:
+        """Return the keys of repos whose ``full_name`` or ``name`` is ``name``.
+
+        Snapshots without ``full_name`` index a repo under its short name, so
+        one repo can have several keys.
+        """
+        if self._names is None:
+            self._names = {}
+            for key, entry in self.repos.items():
+                self._names.setdefault(entry.get("name", key), []).append(key)
+        keys = list(self._names.get(name, []))
+        if name in self.repos and name not in keys:
+            keys.insert(0, name)
+        return keys
+
+    def history(self, name: str) -> List[Dict[str, Any]]:
+        """Return the points of ``name`` across all its keys, one per date."""
+        merged: Dict[str, Dict[str, Any]] = {}
+        for key in self.lookup(name):
+            for point in self.points(key):
+                merged.setdefault(point["date"], point)
+        return [merged[day] for day in sorted(merged)]
+
+    def points(self, key: str) -> List[Dict[str, Any]]:
+        """Return ``[{"date": ..., "stars": ..., ...}]`` for ``key``."""
+        entry = self.repos.get(key)
+        if entry is None:
+            return []
+        return [dict(zip(("date", *FIELDS), p)) for p in entry["points"]]
+
+    def aligned(self, key: str, field: str) -> List[Any]:
+        """Return ``field`` for ``key`` on every indexed date, ``None`` if absent."""
+        column = FIELDS.index(field) + 1
+        entry = self.repos.get(key, {"points": []})
+        values = {p[0]: p[column] for p in entry["points"]}
+        return [values.get(day) for day in self.dates]
+
+    def latest(self) -> Dict[str, Dict[str, Any]]:
+        """Return metrics and metadata of the repos in the newest snapshot."""
+        if not self.sources:
+            return {}
+        newest = max(self.sources)
+        found = {}
+        for key, entry in self.repos.items():
+            point = entry["points"][-1]
+            if point[0] == newest:
+                found[key] = {
+                    "name": entry.get("name", key),
+                    "language": entry.get("language"),
+                    "category": entry.get("category"),
+                    **dict(zip(FIELDS, point[1:])),
+                }
+        return found
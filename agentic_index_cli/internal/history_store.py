@@ -0,0 +1,151 @@
+"""Content-addressed storage for the daily ``data/history`` snapshots.
+
+A snapshot ``history/<date>.json`` is a small manifest listing the SHA-256 of
+each repo record in order. Records are stored once under ``history/objects``
+and shared by every day that contains them, so a year of mostly unchanged
+snapshots costs little more than one. Older full snapshots stay readable and
+are converted by :meth:`HistoryStore.migrate`.
+
+:func:`agentic_index_cli.validate.load_repos` expands manifests
+transparently, so any day loads like a regular ``repos.json``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT = "manifest"
+OBJECTS_DIR = "objects"
+
+
+def is_manifest(raw: Any) -> bool:
+    """Return ``True`` if ``raw`` is a parsed snapshot manifest."""
+    return isinstance(raw, dict) and raw.get("format") == MANIFEST_FORMAT
+
+
+def _encode(record: Any) -> bytes:
+    # json_codec's compact output depends on the backend; object names must not
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class HistoryStore:
+    """Snapshots and their shared records below ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.objects = self.root / OBJECTS_DIR
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / f"{digest[2:]}.json"
+
+    def snapshots(self) -> List[Path]:
+        """Return the snapshot files in ``root``, oldest first."""
+        return sorted(self.root.glob("*.json"))
+
+    def put(self, path: Path, raw: Any) -> Dict[str, Any]:
+        """Write ``raw`` repo data as a manifest at ``path``.
+
+        ``raw`` is the parsed content of a repos file, either a v2/v3
+        ``{"schema_version": ..., "repos": [...]}`` mapping or a bare list.
+        """
+        if isinstance(raw, dict):
+            records = raw.get("repos", [])
+            manifest: Dict[str, Any] = {
+                "format": MANIFEST_FORMAT,
+                "schema_version": raw.get("schema_version", 1),
+            }
+        else:
+            records = raw
+            manifest = {"format": MANIFEST_FORMAT}
+        digests = []
+        for record in records:
+            data = _encode(record)
+            digest = hashlib.sha256(data).hexdigest()
+            target = self._object_path(digest)
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp = target.with_suffix(".tmp")
+                tmp.write_bytes(data)
+                tmp.replace(target)
+            digests.append(digest)
+        manifest["objects"] = digests
+        json_codec.write(path, manifest)
+        return manifest
+
+    def expand(self, manifest: Dict[str, Any]) -> Any:
+        """Return the full repo data described by ``manifest``.
+
+        Raises ``FileNotFoundError`` if a referenced record is missing.
+        """
+        cache: Dict[str, Any] = {}
+        records = []
+        for digest in manifest.get("objects", []):
+            if digest not in cache:
+                cache[digest] = json_codec.read(self._object_path(digest))
+            records.append(cache[digest])
+        if "schema_version" not in manifest:
+            return records
+        return {"schema_version": manifest["schema_version"], "repos": records}
+
+    def read(self, path: Path) -> Any:
+        """Return the parsed snapshot at ``path`` with manifests expanded."""
+        raw = json_codec.read(path)
+        return self.expand(raw) if is_manifest(raw) else raw
+
+    def migrate(self, paths: Optional[Iterable[Path]] = None) -> int:
+        """Convert full snapshots to manifests and return how many changed."""
+        converted = 0
+        for path in self.snapshots() if paths is None else paths:
+            try:
+                raw = json_codec.read(path)
+            except (OSError, ValueError) as exc:
+                logger.warning("cannot migrate snapshot %s: %s", path, exc)
+                continue
+            if is_manifest(raw) or not isinstance(raw, (dict, list)):
+                continue
+            self.put(path, raw)
+            converted += 1
+        return converted
+
+    def referenced(self) -> Set[str]:
+        """Return the digests referenced by any manifest."""
+        digests: Set[str] = set()
+        for path in self.snapshots():
+            try:
+                raw = json_codec.read(path)
+            except (OSError, ValueError):
+                continue
+            if is_manifest(raw):
+                digests.update(raw.get("objects", []))
+        return digests
+
+    def gc(self) -> int:
+        """Delete records no manifest refers to and return how many."""
+        if not self.objects.exists():
+            return 0
+        keep = self.referenced()
+        removed = 0
+        for bucket in self.objects.iterdir():
+            if not bucket.is_dir():
+                continue
+            for obj in bucket.iterdir():
+                if obj.suffix != ".json" or bucket.name + obj.stem not in keep:
+                    obj.unlink()
+                    removed += 1
+            if not any(bucket.iterdir()):
+                bucket.rmdir()
+        return removed
+
+
+def read_snapshot(path: Path) -> Any:
+    """Return the parsed history snapshot at ``path``, manifest or not."""
+    path = Path(path)
+    return HistoryStore(path.parent).read(path)
@@ -1,22 +1,33 @@
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import os
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 
 import aiohttp
 
 from ..exceptions import APIError
+from .cache_store import CacheStore
+from .rate_limit import RateLimitScheduler, get_header, resource_for
 
 logger = logging.getLogger(__name__)
 
 CONCURRENCY_LIMIT = 5
-_semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)
+DEFAULT_CONCURRENCY = {"search": 2, "core": 20, "raw": 20}
 
 DEFAULT_RETRIES = 5
 DEFAULT_TIMEOUT = 10
 DEFAULT_BACKOFF = 1.0
+DEFAULT_POOL_SIZE = 100
+DEFAULT_POOL_PER_HOST = 30
+DEFAULT_HTTP_CACHE_MAX_AGE = 30 * 86400  # seconds
 
 
 @dataclass
@@ -29,47 +40,387 @@ class Response:
         return json.loads(self.text)
 
 
-async def async_get(
+class ConditionalCache:
+    """Cache of GET bodies with their ``ETag``/``Last-Modified`` validators.
+
+    Cached entries turn refreshes into conditional requests; a ``304`` reply
+    is answered from ``store`` and does not count against GitHub's primary rate
+    limit. Entries expire ``max_age`` seconds after they were written and
+    :meth:`prune` drops them from the store.
+    """
+
+    def __init__(
+        self, store: CacheStore, max_age: Optional[float] = DEFAULT_HTTP_CACHE_MAX_AGE
+    ) -> None:
+        self.store = store
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+    def _key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        return f"http_{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def load(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for ``url`` and ``params`` if any."""
+        return self.store.get(self._key(url, params), max_age=self.max_age)
+
+    def validators(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Return conditional request headers for ``entry``."""
+        headers: Dict[str, str] = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        resp: Response,
+        entry: Optional[Dict[str, Any]],
+    ) -> Response:
+        """Record ``resp`` and return the response the caller should see."""
+        if resp.status_code == 304 and entry:
+            with self._lock:
+                self.not_modified += 1
+            return Response(
+                entry["status"], {**entry["headers"], **resp.headers}, entry["text"]
+            )
+        with self._lock:
+            self.misses += 1
+        etag = get_header(resp.headers, "ETag")
+        modified = get_header(resp.headers, "Last-Modified")
+        if resp.status_code == 200 and (etag or modified):
+            self.store.put(
+                self._key(url, params),
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": modified,
+                    "status": resp.status_code,
+                    "headers": resp.headers,
+                    "text": resp.text,
+                },
+                ttl=self.max_age,
+            )
+        return resp
+
+    def prune(self) -> int:
+        """Drop expired entries from the store and return how many."""
+        return self.store.evict()
+
+    def record_hit(self) -> None:
+        """Count a lookup served by a caller's own fresh cache."""
+        with self._lock:
+            self.hits += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and ``304`` counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+
+def request_class(url: str) -> str:
+    """Return the concurrency class (``search``, ``core`` or ``raw``) of ``url``."""
+    if urlsplit(url).hostname == "raw.githubusercontent.com":
+        return "raw"
+    if resource_for(url) == "search":
+        return "search"
+    return "core"
+
+
+class ConcurrencyLimiter:
+    """Semaphores per event loop and request class.
+
+    ``asyncio.Semaphore`` binds to the loop that first waits on it, so each
+    running loop gets its own set, sized from ``limits``. Classes missing
+    from ``limits`` fall back to :data:`CONCURRENCY_LIMIT`.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None) -> None:
+        self.limits = {**DEFAULT_CONCURRENCY, **(limits or {})}
+        self._lock = threading.Lock()
+        self._loops: WeakKeyDictionary = WeakKeyDictionary()
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore guarding ``url`` on the running loop."""
+        loop = asyncio.get_running_loop()
+        kind = request_class(url)
+        with self._lock:
+            sems = self._loops.setdefault(loop, {})
+            sem = sems.get(kind)
+            if sem is None:
+                sem = sems[kind] = asyncio.Semaphore(
+                    self.limits.get(kind, CONCURRENCY_LIMIT)
+                )
+            return sem
+
+
+_default_limiter = ConcurrencyLimiter()
+
+
+def _logged_wait(
+    scheduler: Optional[RateLimitScheduler], url: str, delay: float
+) -> float:
+    """Return how long the retry of ``url`` waits, ``delay`` unless paced."""
+    resource = resource_for(url)
+    if scheduler is None or resource is None:
+        return delay
+    return round(scheduler.eta(resource, 1), 1)
+
+
+async def async_request(
+    method: str,
     url: str,
     *,
     params: Optional[Dict[str, Any]] = None,
+    json_body: Any = None,
     headers: Optional[Dict[str, str]] = None,
     session: aiohttp.ClientSession,
     retries: int = DEFAULT_RETRIES,
     timeout: float = DEFAULT_TIMEOUT,
     backoff_factor: float = DEFAULT_BACKOFF,
+    cache: Optional[ConditionalCache] = None,
+    scheduler: Optional[RateLimitScheduler] = None,
+    limiter: Optional[ConcurrencyLimiter] = None,
 ) -> Response:
-    """GET with exponential backoff, timeout and rate limit handling."""
+    """Send ``method`` with exponential backoff, timeout and rate limit handling.
+
+    GET requests consult ``cache`` and revalidate stored bodies with
+    conditional headers. When a ``scheduler`` is given, requests are paced
+    against the remaining rate-limit budget before they are sent. In-flight
+    requests are capped per host class by ``limiter``.
+    """
+    send = getattr(session, method.lower())
+    semaphore = (limiter or _default_limiter).semaphore(url)
+    if method != "GET":
+        cache = None
+    entry = cache.load(url, params) if cache is not None else None
+    if entry:
+        headers = {**(headers or {}), **cache.validators(entry)}
+    kwargs: Dict[str, Any] = {"params": params, "headers": headers, "timeout": timeout}
+    if json_body is not None:
+        kwargs["json"] = json_body
     backoff = backoff_factor
+    # the scheduler only paces GitHub resources; other hosts wait here
+    paced = scheduler is not None and resource_for(url) is not None
     for attempt in range(retries):
+        if scheduler is not None:
+            await scheduler.acquire(url, conditional=entry is not None)
+        delay = 0.0
         try:
-            async with _semaphore:
-                async with session.get(
-                    url, params=params, headers=headers, timeout=timeout
-                ) as resp:
+            async with semaphore:
+                async with send(url, **kwargs) as resp:
                     text = await resp.text()
+                    if scheduler is not None:
+                        scheduler.update(url, resp.status, resp.headers)
+                    retry_after = resp.headers.get("Retry-After")
                     if (
                         resp.status == 403
                         and resp.headers.get("X-RateLimit-Remaining") == "0"
                     ):
                         reset = int(resp.headers.get("X-RateLimit-Reset", "0"))
-                        sleep_for = max(0, reset - int(time.time()))
-                        logger.warning("Rate limit hit, sleeping %s seconds", sleep_for)
-                        await asyncio.sleep(sleep_for)
-                        continue
-                    if resp.status >= 500:
+                        if not paced:
+                            delay = max(0, reset - int(time.time()))
+                        logger.warning(
+                            "Rate limit hit, waiting %s seconds",
+                            _logged_wait(scheduler, url, delay),
+                        )
+                    elif resp.status in (403, 429) and retry_after is not None:
+                        if not paced:
+                            delay = float(retry_after)
+                        logger.warning(
+                            "Secondary rate limit, retry after %s",
+                            _logged_wait(scheduler, url, delay),
+                        )
+                    elif resp.status >= 500:
                         logger.warning("Server error %s", resp.status)
-                        await asyncio.sleep(backoff)
+                        delay = backoff
                         backoff *= 2
-                        continue
-                    return Response(resp.status, dict(resp.headers), text)
+                    else:
+                        response = Response(resp.status, dict(resp.headers), text)
+                        if cache is not None:
+                            response = cache.update(url, params, response, entry)
+                        return response
         except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
             if attempt == retries - 1:
-                raise APIError(f"GET {url} failed: {exc}") from exc
+                raise APIError(f"{method} {url} failed: {exc}") from exc
             logger.warning("Request error: %s; retrying in %s seconds", exc, backoff)
-            await asyncio.sleep(backoff)
+            delay = backoff
             backoff *= 2
-    raise APIError(f"GET {url} failed after retries")
+        # Wait outside the semaphore so other requests keep flowing.
+        if delay:
+            await asyncio.sleep(delay)
+    raise APIError(f"{method} {url} failed after retries")
+
+
+async def async_get(url: str, **kwargs: Any) -> Response:
+    """GET with exponential backoff, timeout and rate limit handling."""
+    return await async_request("GET", url, **kwargs)
+
+
+async def async_post(url: str, *, json_body: Any, **kwargs: Any) -> Response:
+    """POST ``json_body`` with the same retry semantics as :func:`async_get`."""
+    return await async_request("POST", url, json_body=json_body, **kwargs)
+
+
+class SharedClient:
+    """Long-lived ``aiohttp`` session served from a background event loop.
+
+    All requests share one keep-alive connection pool regardless of the
+    calling thread or event loop, so repeated GETs against the same host
+    skip the TCP and TLS handshakes.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = DEFAULT_POOL_SIZE,
+        limit_per_host: int = DEFAULT_POOL_PER_HOST,
+        concurrency: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.limiter = ConcurrencyLimiter(concurrency)
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pid: Optional[int] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked child must not reuse the parent's loop or sockets.
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="http-client", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+                self._session = None
+            return self._loop
+
+    async def _on_create(self, session, ctx, params) -> None:
+        self.connections_created += 1
+
+    async def _on_reuse(self, session, ctx, params) -> None:
+        self.connections_reused += 1
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self._on_create)
+            trace.on_connection_reuseconn.append(self._on_reuse)
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[trace]
+            )
+        return self._session
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Response:
+        session = await self._get_session()
+        self.requests += 1
+        send = async_get if method == "GET" else async_post
+        kwargs.setdefault("limiter", self.limiter)
+        return await send(url, session=session, **kwargs)
+
+    async def _submit(self, method: str, url: str, **kwargs: Any) -> Response:
+        loop = self._ensure_loop()
+        coro = self._request(method, url, **kwargs)
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        fut = asyncio.run_coroutine_threadsafe(coro, loop)
+        return await asyncio.wrap_future(fut)
+
+    def _run(self, method: str, url: str, **kwargs: Any) -> Response:
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._request(method, url, **kwargs), loop
+        ).result()
+
+    async def async_get(self, url: str, **kwargs: Any) -> Response:
+        """Await a GET on the shared pool from any event loop."""
+        return await self._submit("GET", url, **kwargs)
+
+    async def async_post(self, url: str, **kwargs: Any) -> Response:
+        """Await a POST on the shared pool from any event loop."""
+        return await self._submit("POST", url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        """Blocking GET on the shared pool."""
+        return self._run("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Response:
+        """Blocking POST on the shared pool."""
+        return self._run("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool and concurrency configuration and reuse counters."""
+        return {
+            "pool_size": self.limit,
+            "limit_per_host": self.limit_per_host,
+            **{f"concurrency_{k}": v for k, v in self.limiter.limits.items()},
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+        }
+
+    def close(self) -> None:
+        """Close the session and stop the background loop."""
+        with self._lock:
+            loop, thread, session = self._loop, self._thread, self._session
+            self._loop = self._thread = self._session = None
+        if loop is None or self._pid != os.getpid():
+            return
+        if session is not None and not session.closed:
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+
+_client: Optional[SharedClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client(**kwargs: Any) -> SharedClient:
+    """Return the process-wide :class:`SharedClient`.
+
+    ``kwargs`` configure the pool and only apply when the client is created.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SharedClient(**kwargs)
+        return _client
+
+
+def close_client() -> None:
+    """Close and discard the process-wide client."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_client)
 
 
 def sync_get(
@@ -80,19 +431,19 @@ def sync_get(
     retries: int = DEFAULT_RETRIES,
     timeout: float = DEFAULT_TIMEOUT,
     backoff_factor: float = DEFAULT_BACKOFF,
+    client: Optional[SharedClient] = None,
+    cache: Optional[ConditionalCache] = None,
+    scheduler: Optional[RateLimitScheduler] = None,
 ) -> Response:
-    """Synchronous wrapper around :func:`async_get`."""
-
-    async def runner() -> Response:
-        async with aiohttp.ClientSession() as session:
-            return await async_get(
-                url,
-                params=params,
-                headers=headers,
-                session=session,
-                retries=retries,
-                timeout=timeout,
-                backoff_factor=backoff_factor,
-            )
-
-    return asyncio.run(runner())
+    """Blocking GET served from the shared connection pool."""
+    client = client or get_client()
+    return client.get(
+        url,
+        params=params,
+        headers=headers,
+        retries=retries,
+        timeout=timeout,
+        backoff_factor=backoff_factor,
+        cache=cache,
+        scheduler=scheduler,
+    )
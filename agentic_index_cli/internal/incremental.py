@@ -0,0 +1,102 @@
+"""Compare search hits against the last history snapshot for incremental runs."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Container, Dict, List, Optional
+
+from .history_store import read_snapshot
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIR = Path("data/history")
+# re-check repos pushed on the snapshot day itself
+OVERLAP = datetime.timedelta(days=1)
+# Search can only select repos by push date, so stars, forks and issues of
+# repos nobody pushed to would never change. Each run re-fetches one slice of
+# the carried repos, refreshing every one of them within this many days.
+REFRESH_DAYS = int(os.getenv("INCREMENTAL_REFRESH_DAYS", "7"))
+COMPARED_FIELDS = (
+    "pushed_at",
+    "stargazers_count",
+    "forks_count",
+    "open_issues_count",
+    "archived",
+)
+
+
+@dataclass
+class Baseline:
+    """Repos from the snapshot an incremental run is compared against."""
+
+    day: datetime.date
+    repos: Dict[str, Dict[str, Any]]
+    refresh_days: int = 0
+
+    @property
+    def since(self) -> datetime.date:
+        """Return the first push date that can hold unseen changes."""
+        return self.day - OVERLAP
+
+    def changed(self, item: Dict[str, Any]) -> bool:
+        """Return ``True`` if search hit ``item`` differs from its snapshot."""
+        previous = self.repos.get(item.get("full_name", ""))
+        if previous is None:
+            return True
+        return any(item.get(key) != previous.get(key) for key in COMPARED_FIELDS)
+
+    def due(self, full_name: str, today: Optional[datetime.date] = None) -> bool:
+        """Return ``True`` if carried repo ``full_name`` is re-fetched today.
+
+        Repos are split into :attr:`refresh_days` slices by a hash of their
+        name and one slice is due per day. ``refresh_days`` 0 disables this.
+        """
+        if self.refresh_days <= 0:
+            return False
+        today = today or datetime.date.today()
+        slot = zlib.crc32(full_name.encode()) % self.refresh_days
+        return slot == today.toordinal() % self.refresh_days
+
+    def carried(self, done: Container[str], min_stars: int = 0) -> List[str]:
+        """Return snapshot repos not in ``done`` that still meet ``min_stars``."""
+        return [
+            name
+            for name, repo in self.repos.items()
+            if name not in done and (repo.get("stargazers_count") or 0) >= min_stars
+        ]
+
+
+def load_baseline(
+    history_dir: Optional[Path] = None, refresh_days: Optional[int] = None
+) -> Optional[Baseline]:
+    """Return the newest ``YYYY-MM-DD.json`` snapshot in ``history_dir``.
+
+    ``history_dir`` defaults to :data:`HISTORY_DIR` and ``refresh_days`` to
+    :data:`REFRESH_DAYS`.
+    """
+    if refresh_days is None:
+        refresh_days = REFRESH_DAYS
+    history_dir = Path(history_dir or HISTORY_DIR)
+    for path in sorted(history_dir.glob("*.json"), reverse=True):
+        try:
+            day = datetime.date.fromisoformat(path.stem)
+        except ValueError:
+            continue
+        try:
+            raw = read_snapshot(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("skipping unreadable snapshot %s: %s", path, exc)
+            continue
+        items = raw.get("repos", []) if isinstance(raw, dict) else raw
+        repos = {
+            item["full_name"]: item
+            for item in items
+            if isinstance(item, dict) and item.get("full_name")
+        }
+        return Baseline(day=day, repos=repos, refresh_days=refresh_days)
+    return None
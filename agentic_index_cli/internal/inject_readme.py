@@ -10,6 +10,7 @@ from pathlib import Path
 import structlog
 
 import agentic_index_cli.internal.readme_utils as _readme_utils
+from agentic_index_cli.repo_table import RepoTable
 
 from .readme_utils import (
     BY_CAT_INDEX,
@@ -89,8 +90,12 @@ def main(
     ranked_path: Path | None = None,
     readme_path: Path | None = None,
     index_path: Path | None = None,
+    table: RepoTable | None = None,
 ) -> int:
-    """Synchronise the README table."""
+    """Synchronise the README table.
+
+    ``table`` supplies the ranked repos in memory instead of reading them.
+    """
     request_id = str(uuid.uuid4())
     log = logger.bind(func="main", request_id=request_id)
     start_time = time.perf_counter()
@@ -117,6 +122,7 @@ def main(
             ranked_path=ranked_path,
             readme_path=readme_path,
             index_path=index_path,
+            table=table,
         )
     except Exception as exc:
         log.exception("build-failed", error=str(exc))
@@ -157,6 +163,7 @@ def write_category_readme(
     limit: int | None = None,
     repos_path: Path | None = None,
     ranked_path: Path | None = None,
+    table: RepoTable | None = None,
 ) -> int:
     """Write or check ``README_<category>.md``."""
     request_id = str(uuid.uuid4())
@@ -176,6 +183,7 @@ def write_category_readme(
         limit=cfg_limit,
         repos_path=repos_path,
         ranked_path=ranked_path,
+        table=table,
     )
     fname = f"README_{category.replace(' ', '_')}.md"
     path = ROOT / fname
@@ -193,9 +201,16 @@ def write_category_readme(
 
 
 def write_all_categories(
-    *, repos_path: Path | None = None, ranked_path: Path | None = None, **kwargs
+    *,
+    repos_path: Path | None = None,
+    ranked_path: Path | None = None,
+    table: RepoTable | None = None,
+    **kwargs,
 ) -> int:
-    """Write or check README files for all categories."""
+    """Write or check README files for all categories.
+
+    Pass ``table`` to load the ranked repos once for every category.
+    """
     request_id = str(uuid.uuid4())
     log = logger.bind(func="write_all_categories", request_id=request_id)
     start_time = time.perf_counter()
@@ -204,11 +219,12 @@ def write_all_categories(
     if ranked_path is None:
         ranked_path = RANKED_PATH
     status = 0
-    for cat in available_categories(repos_path, ranked_path):
+    for cat in available_categories(repos_path, ranked_path, table):
         ret = write_category_readme(
             cat,
             repos_path=repos_path,
             ranked_path=ranked_path,
+            table=table,
             **kwargs,
         )
         status = max(status, ret)
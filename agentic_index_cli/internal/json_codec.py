@@ -0,0 +1,80 @@
+"""JSON encoding and decoding with the fastest available backend.
+
+Parsing and compact encoding use ``orjson`` when it is installed and fall
+back to the standard library; set ``JSON_CODEC=json`` to force the latter.
+Indented output always comes from :func:`json.dumps` so tracked data files
+keep stable diffs: ``orjson`` neither escapes non-ASCII text nor writes small
+floats the way ``repr`` does, and rewriting its output costs more than the
+faster encoder saves.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKENDS = ("orjson", "json")
+
+
+def _select_backend() -> str:
+    wanted = os.getenv("JSON_CODEC", "").lower()
+    if wanted == "json" or orjson is None:
+        return "json"
+    return "orjson"
+
+
+BACKEND = _select_backend()
+
+
+def dumps(obj: Any, *, compact: bool = False, sort_keys: bool = False) -> str:
+    """Serialise ``obj`` to a JSON string.
+
+    By default the result is ``json.dumps(obj, indent=2)``. ``compact`` drops
+    whitespace and keeps non-ASCII text unescaped; the exact formatting then
+    depends on the backend.
+    """
+    if not compact:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys)
+    if BACKEND == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # integers beyond 64 bits, lone surrogates and the like
+            pass
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys
+    )
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from ``data``.
+
+    Raises :class:`json.JSONDecodeError` for invalid input.
+    """
+    if BACKEND == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib also accepts NaN/Infinity and integers beyond 64 bits
+            pass
+    return json.loads(data)
+
+
+def read(path: Path) -> Any:
+    """Return the parsed contents of the JSON file at ``path``."""
+    return loads(Path(path).read_bytes())
+
+
+def write(path: Path, obj: Any, *, compact: bool = False) -> None:
+    """Write ``obj`` to ``path`` as JSON followed by a newline."""
+    Path(path).write_text(dumps(obj, compact=compact) + "\n")
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
+from . import json_codec
+
 _cache: Dict[Path, Tuple[float, Any]] = {}
 
 
@@ -29,8 +30,7 @@ def load_json(
         with path.open("rb") as fh:
             data = ijson.load(fh)
     else:
-        with path.open() as fh:
-            data = json.load(fh)
+        data = json_codec.read(path)
     if cache:
         _cache[path] = (mtime, data)
     return data
@@ -8,13 +8,15 @@ Usage:
 import datetime
 import json
 import os
-import shutil
 import urllib.request
 from pathlib import Path
 
 import lib.quality_metrics  # ensure built-in metrics are registered
 from agentic_index_cli.config import load_config
 from agentic_index_cli.constants import SCORE_KEY
+from agentic_index_cli.internal.classifier import default_classifier
+from agentic_index_cli.internal.scoring import compute_scores
+from agentic_index_cli.internal.snapshot import persist_history
 from agentic_index_cli.scoring import (
     compute_issue_health,
     compute_recency_factor,
@@ -49,16 +51,7 @@ def infer_category(repo: dict) -> str:
         + " "
         + repo.get("name", "")
     )
-    text = blob.lower()
-    if "rag" in text:
-        return "RAG-centric"
-    if "multi-agent" in text or "multi agent" in text or "crew" in text:
-        return "Multi-Agent Coordination"
-    if "devtool" in text or "runtime" in text or "tool" in text:
-        return "DevTools"
-    if "experiment" in text or "research" in text:
-        return "Experimental"
-    return "General-purpose"
+    return default_classifier().classify(blob, "category")
 
 
 # ─────────────────────────────  Badge helpers  ─────────────────────────────────
@@ -156,8 +149,8 @@ def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> N
     skip_top_write = is_test
 
     # score + categorise
-    for repo in repos:
-        repo[SCORE_KEY] = compute_score(repo)
+    for repo, score in zip(repos, compute_scores(repos)):
+        repo[SCORE_KEY] = score
         repo["category"] = infer_category(repo)
         prev = prev_map.get(repo.get("full_name", repo.get("name")))
         if prev:
@@ -187,14 +180,7 @@ def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> N
     repos.sort(key=lambda r: r[SCORE_KEY], reverse=True)
     if not skip_repo_write:
         save_repos(data_file, repos)
-        # persist snapshot
-        today_iso = datetime.date.today().isoformat()
-        snapshot_path = history_dir / f"{today_iso}.json"
-        shutil.copy(data_file, snapshot_path)
-        last_snapshot_file.write_text(str(snapshot_path))
-        snapshots = sorted(history_dir.glob("*.json"))
-        for old in snapshots[:-delta_days]:
-            old.unlink()
+        persist_history(data_file, repos, delta_days=delta_days)
 
         # write per-category lists
         by_cat = data_dir / "by_category"
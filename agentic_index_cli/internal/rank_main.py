@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import datetime
 import json
+import logging
+import multiprocessing
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lib.quality_metrics  # ensure built-in metrics are registered
 from agentic_index_cli.config import load_config
 from agentic_index_cli.constants import SCORE_KEY
+from agentic_index_cli.repo_table import RepoTable
 from agentic_index_cli.scoring import (
     compute_issue_health,
     compute_recency_factor,
@@ -15,23 +20,130 @@ from agentic_index_cli.scoring import (
 )
 from agentic_index_cli.templates import SUMMARY_ROW_TMPL, format_link, short_desc
 from agentic_index_cli.validate import load_repos, save_repos
+from lib.metrics_registry import get_metrics, set_metrics
 
 from .badges import generate_badges
-from .scoring import compute_score
+from .scoring import compute_scores
 from .scoring import infer_category as _infer_category
+from .search_index import INDEX_FILE, SearchIndex
 from .snapshot import persist_history, write_by_category
 
 infer_category = _infer_category
+logger = logging.getLogger(__name__)
+
+# fields :func:`_prepare` may add or overwrite, in the order it sets them
+PREPARED_FIELDS = (
+    "stars",
+    "recency_factor",
+    "issue_health",
+    "doc_completeness",
+    "license_freedom",
+    "ecosystem_integration",
+    SCORE_KEY,
+    "category",
+)
+# below this many repos per worker, pickling outweighs the parallel work
+MIN_CHUNK = 5_000
+
+
+def _prepare(repos: list[dict]) -> None:
+    """Backfill derived fields, then score and categorize ``repos`` in place."""
+    for repo in repos:
+        repo.setdefault("stars", repo.get("stargazers_count", 0))
+        if "recency_factor" not in repo and repo.get("pushed_at"):
+            repo["recency_factor"] = compute_recency_factor(repo["pushed_at"])
+        if "issue_health" not in repo:
+            repo["issue_health"] = compute_issue_health(
+                repo.get("open_issues_count", 0), repo.get("closed_issues", 0)
+            )
+        repo.setdefault("doc_completeness", 0.0)
+        if "license_freedom" not in repo:
+            lic = repo.get("license")
+            if isinstance(lic, dict):
+                lic = lic.get("spdx_id")
+            repo["license_freedom"] = license_freedom(lic)
+        repo.setdefault("ecosystem_integration", 0.0)
+
+    for repo, score in zip(repos, compute_scores(repos)):
+        repo[SCORE_KEY] = score
+        repo["category"] = infer_category(repo)
 
 
-def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> None:
-    """Rank repositories and write results back to disk."""
+def _prepare_chunk(repos: list[dict]) -> dict[str, tuple[list, list[int]]]:
+    """Run :func:`_prepare` in a worker and return the prepared fields.
+
+    Each field comes back as a column of values plus the positions of repos
+    that do not have it, which pickles far faster than one dict per repo.
+    """
+    _prepare(repos)
+    columns = {}
+    for key in PREPARED_FIELDS:
+        values = [repo.get(key) for repo in repos]
+        absent = [i for i, repo in enumerate(repos) if key not in repo]
+        columns[key] = (values, absent)
+    return columns
+
+
+def _prepare_parallel(repos: list[dict], workers: int) -> None:
+    """Same as :func:`_prepare`, split across ``workers`` processes.
+
+    Every field is computed per repo, so the chunks are independent. Fields
+    are applied in :data:`PREPARED_FIELDS` order, so new keys land where
+    :func:`_prepare` would put them and the written JSON is byte-identical.
+    Workers are spawned rather than forked, since the parent may be running
+    threads (HTTP clients, caches) whose locks a fork would copy mid-use.
+    A spawned worker only has the metrics its imports register, so it is
+    handed the parent's metrics; if one cannot be pickled, e.g. a lambda,
+    ``repos`` are prepared serially instead.
+    """
+    metrics = list(get_metrics())
+    try:
+        pickle.dumps(metrics)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        logger.info("ranking serially; metrics cannot reach workers: %s", exc)
+        _prepare(repos)
+        return
+    size = max(MIN_CHUNK, -(-len(repos) // (workers * 4)))
+    chunks = [repos[i : i + size] for i in range(0, len(repos), size)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=set_metrics,
+        initargs=(metrics,),
+    ) as pool:
+        for chunk, columns in zip(chunks, pool.map(_prepare_chunk, chunks)):
+            for key, (values, absent) in columns.items():
+                skip = set(absent)
+                for i, (repo, value) in enumerate(zip(chunk, values)):
+                    if i not in skip:
+                        repo[key] = value
+
+
+def main(
+    json_path: str = "data/repos.json",
+    *,
+    config: dict | None = None,
+    table: RepoTable | None = None,
+    workers: int = 1,
+) -> RepoTable:
+    """Rank repositories and write results back to disk.
+
+    ``table`` supplies the repos in memory instead of reading ``json_path``,
+    e.g. straight from :func:`agentic_index_cli.enricher.enrich`. With
+    ``workers`` above 1, large repo sets are scored and categorized in that
+    many processes; the output is the same. Returns the ranked table.
+    """
     cfg = config or load_config()
     top_n = cfg.get("ranking", {}).get("top_n", 100)
     delta_days = cfg.get("ranking", {}).get("delta_days", 7)
     data_file = Path(json_path)
     is_test = os.getenv("PYTEST_CURRENT_TEST") is not None
-    repos = load_repos(data_file)
+    if table is None:
+        repos = load_repos(data_file, validation="hash")
+    else:
+        repos = table.to_list()
+        table.invalidate()
 
     data_dir = data_file.parent
     history_dir = data_dir / "history"
@@ -44,7 +156,7 @@ def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> N
             prev_path = history_dir / prev_path.name
         if prev_path.exists():
             try:
-                prev_repos = load_repos(prev_path)
+                prev_repos = load_repos(prev_path, validation="hash")
                 prev_map = {r.get("full_name", r.get("name")): r for r in prev_repos}
             except Exception:
                 prev_map = {}
@@ -53,30 +165,24 @@ def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> N
         if "AgentOpsScore" in repo:
             repo[SCORE_KEY] = repo.pop("AgentOpsScore")
 
-    for repo in repos:
-        repo.setdefault("stars", repo.get("stargazers_count", 0))
-        if "recency_factor" not in repo and repo.get("pushed_at"):
-            repo["recency_factor"] = compute_recency_factor(repo["pushed_at"])
-        if "issue_health" not in repo:
-            repo["issue_health"] = compute_issue_health(
-                repo.get("open_issues_count", 0), repo.get("closed_issues", 0)
-            )
-        repo.setdefault("doc_completeness", 0.0)
-        if "license_freedom" not in repo:
-            lic = repo.get("license")
-            if isinstance(lic, dict):
-                lic = lic.get("spdx_id")
-            repo["license_freedom"] = license_freedom(lic)
-        repo.setdefault("ecosystem_integration", 0.0)
-
     skip_repo_write = (
         is_test and data_file.resolve() == Path("data/repos.json").resolve()
     )
     skip_top_write = is_test
 
+    if workers > 1 and len(repos) > MIN_CHUNK:
+        _prepare_parallel(repos, workers)
+    else:
+        if workers > 1:
+            logger.info(
+                "ranking %s repos serially; %s workers need more than %s",
+                len(repos),
+                workers,
+                MIN_CHUNK,
+            )
+        _prepare(repos)
+
     for repo in repos:
-        repo[SCORE_KEY] = compute_score(repo)
-        repo["category"] = infer_category(repo)
         prev = prev_map.get(repo.get("full_name", repo.get("name")))
         if prev:
             repo["stars_delta"] = repo.get("stars", 0) - prev.get(
@@ -101,13 +207,15 @@ def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> N
     allowed_zero = max(1, int(len(repos) * 0.02))
     assert zero_scores <= allowed_zero, "too many repos scored 0.0"
 
-    repos.sort(key=lambda r: r[SCORE_KEY], reverse=True)
+    ranked = RepoTable(repos).sort_by(SCORE_KEY, reverse=True)
+    repos = ranked.to_list()
     if not skip_repo_write:
-        save_repos(data_file, repos)
+        save_repos(data_file, repos, validation="hash")
         persist_history(data_file, repos, delta_days=delta_days)
-        write_by_category(data_dir, repos)
+        write_by_category(data_dir, ranked)
         ranked_path = data_dir / "ranked.json"
-        save_repos(ranked_path, repos)
+        save_repos(ranked_path, repos, validation="hash")
+        SearchIndex.build(repos).save(data_dir / INDEX_FILE)
 
     header = [
         "| Rank | Repo | Description | Score | Stars | Δ Stars |",
@@ -138,3 +246,4 @@ def main(json_path: str = "data/repos.json", *, config: dict | None = None) -> N
     today_iso = datetime.date.today().isoformat()
     top_repo_name = repos[0]["name"] if repos else "unknown"
     generate_badges(top_repo_name, today_iso, len(repos))
+    return ranked
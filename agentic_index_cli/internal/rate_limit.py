@@ -0,0 +1,169 @@
+"""Rate-limit-aware request pacing for GitHub API traffic."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+# (limit, window seconds) assumed until the first response reports real values
+DEFAULT_LIMITS = {
+    "core": (5000, 3600),
+    "search": (30, 60),
+    "graphql": (5000, 3600),
+}
+DEFAULT_LOW_WATER = 0.1
+POLL_INTERVAL = 0.05
+
+
+def resource_for(url: str) -> Optional[str]:
+    """Return the GitHub rate-limit resource ``url`` is billed against."""
+    parts = urlsplit(url)
+    if parts.hostname != "api.github.com":
+        return None
+    if parts.path.startswith("/graphql"):
+        return "graphql"
+    if parts.path.startswith("/search/"):
+        return "search"
+    return "core"
+
+
+def get_header(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    """Return header ``name`` from ``headers`` ignoring case."""
+    lname = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lname:
+            return value
+    return None
+
+
+@dataclass
+class Budget:
+    """Known budget for one rate-limit resource."""
+
+    limit: int
+    window: float
+    tokens: int
+    reset: float
+    blocked_until: float = 0.0
+    next_slot: float = 0.0
+    waiting_conditional: int = 0
+
+
+class RateLimitScheduler:
+    """Token-bucket pacing driven by GitHub's rate-limit headers.
+
+    Each resource (``core``, ``search``, ``graphql``) holds a bucket of tokens
+    mirroring ``X-RateLimit-Remaining``. Requests run freely while the bucket
+    is above ``low_water`` of the limit; below it, full fetches are spaced so
+    the remaining tokens last until the reset, and conditional requests,
+    which usually cost nothing, are served first. An empty bucket or a
+    secondary limit (``Retry-After``) makes callers wait instead of hitting
+    the wall.
+    """
+
+    def __init__(self, *, low_water: float = DEFAULT_LOW_WATER) -> None:
+        self.low_water = low_water
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, Budget] = {}
+
+    def _budget(self, resource: str, now: float) -> Budget:
+        budget = self._budgets.get(resource)
+        if budget is None:
+            limit, window = DEFAULT_LIMITS.get(resource, DEFAULT_LIMITS["core"])
+            budget = Budget(
+                limit=limit, window=window, tokens=limit, reset=now + window
+            )
+            self._budgets[resource] = budget
+        if now >= budget.reset:
+            budget.tokens = budget.limit
+            budget.reset = now + budget.window
+            budget.next_slot = 0.0
+        return budget
+
+    def _reserve(self, resource: str, conditional: bool) -> float:
+        """Take a token for ``resource`` or return seconds to wait."""
+        now = time.time()
+        with self._lock:
+            budget = self._budget(resource, now)
+            if budget.blocked_until > now:
+                return budget.blocked_until - now
+            if budget.tokens <= 0:
+                return max(budget.reset - now, POLL_INTERVAL)
+            if not conditional and budget.tokens <= budget.limit * self.low_water:
+                if budget.waiting_conditional:
+                    return POLL_INTERVAL
+                if budget.next_slot > now:
+                    return budget.next_slot - now
+                budget.next_slot = now + (budget.reset - now) / budget.tokens
+            budget.tokens -= 1
+            return 0.0
+
+    async def acquire(self, url: str, *, conditional: bool = False) -> None:
+        """Wait until a request to ``url`` fits within the budget."""
+        resource = resource_for(url)
+        if resource is None:
+            return
+        if conditional:
+            with self._lock:
+                self._budget(resource, time.time()).waiting_conditional += 1
+        try:
+            while True:
+                wait = self._reserve(resource, conditional)
+                if wait <= 0:
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            if conditional:
+                with self._lock:
+                    self._budgets[resource].waiting_conditional -= 1
+
+    def update(self, url: str, status: int, headers: Mapping[str, Any]) -> None:
+        """Sync the budget for ``url`` with a response's rate-limit headers."""
+        resource = get_header(headers, "X-RateLimit-Resource") or resource_for(url)
+        if resource is None:
+            return
+        now = time.time()
+        with self._lock:
+            budget = self._budget(resource, now)
+            limit = get_header(headers, "X-RateLimit-Limit")
+            remaining = get_header(headers, "X-RateLimit-Remaining")
+            reset = get_header(headers, "X-RateLimit-Reset")
+            if limit is not None:
+                budget.limit = int(limit)
+            if reset is not None and float(reset) > now:
+                budget.reset = float(reset)
+            if remaining is not None:
+                budget.tokens = int(remaining)
+            retry_after = get_header(headers, "Retry-After")
+            if status in (403, 429) and retry_after is not None:
+                budget.blocked_until = now + float(retry_after)
+
+    def eta(self, resource: str, requests: int) -> float:
+        """Return the estimated seconds needed to issue ``requests`` more calls."""
+        now = time.time()
+        with self._lock:
+            budget = self._budget(resource, now)
+            wait = max(0.0, budget.blocked_until - now)
+            if requests <= budget.tokens:
+                return wait
+            windows = -(-(requests - budget.tokens) // max(budget.limit, 1))
+            return wait + (budget.reset - now) + (windows - 1) * budget.window
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Return current budget and reset ETA for every seen resource."""
+        now = time.time()
+        with self._lock:
+            return {
+                name: {
+                    "limit": b.limit,
+                    "remaining": b.tokens,
+                    "reset_in": round(max(0.0, b.reset - now), 1),
+                    "blocked_for": round(max(0.0, b.blocked_until - now), 1),
+                    "paced": b.tokens <= b.limit * self.low_water,
+                }
+                for name, b in self._budgets.items()
+            }
@@ -11,6 +11,7 @@ import uuid
 
 import structlog
 
+from agentic_index_cli.repo_table import RepoTable
 from agentic_index_cli.templates import (
     FULL_ROW_TMPL,
     SUMMARY_ROW_TMPL,
@@ -82,10 +83,17 @@ def _load_rows(
     summary: bool = False,
     repos_path: pathlib.Path = REPOS_PATH,
     ranked_path: pathlib.Path = RANKED_PATH,
+    table: RepoTable | None = None,
 ) -> list[str] | tuple[list[str], list[dict]]:
-    """Return table rows computed from repo data using v3 fields."""
+    """Return table rows computed from repo data using v3 fields.
+
+    ``table`` supplies the repos in memory instead of reading
+    ``ranked_path`` or ``repos_path``.
+    """
     try:
-        if ranked_path.exists():
+        if table is not None:
+            repos = table.category(category) if category else table
+        elif ranked_path.exists():
             data = json.loads(ranked_path.read_text())
             repos = data.get("repos", data)
         else:
@@ -242,8 +250,11 @@ def _load_rows(
 def available_categories(
     repos_path: pathlib.Path = REPOS_PATH,
     ranked_path: pathlib.Path = RANKED_PATH,
+    table: RepoTable | None = None,
 ) -> list[str]:
     """Return sorted list of categories present in ``REPOS_PATH``."""
+    if table is not None:
+        return table.categories()
     try:
         if ranked_path.exists():
             data = json.loads(ranked_path.read_text())
@@ -333,6 +344,7 @@ def build_readme(
     repos_path: pathlib.Path = REPOS_PATH,
     ranked_path: pathlib.Path = RANKED_PATH,
     index_path: pathlib.Path = BY_CAT_INDEX,
+    table: RepoTable | None = None,
 ) -> str:
     """Return README text with the ranking table injected."""
     request_id = str(uuid.uuid4())
@@ -373,10 +385,11 @@ def build_readme(
         summary=True,
         repos_path=repos_path,
         ranked_path=ranked_path,
+        table=table,
     )
-    table = "\n".join(header_lines + rows)
+    markdown = "\n".join(header_lines + rows)
 
-    new_text = f"{before}\n{table}\n{end_marker}{after}"
+    new_text = f"{before}\n{markdown}\n{end_marker}{after}"
     # inject navigation using provided index
     new_text = _inject_category_section(new_text, index_path)
     if os.getenv("PYTEST_CURRENT_TEST") is None:
@@ -430,6 +443,7 @@ def build_category_table(
     limit: int | None = None,
     repos_path: pathlib.Path = REPOS_PATH,
     ranked_path: pathlib.Path = RANKED_PATH,
+    table: RepoTable | None = None,
 ) -> str:
     """Return a markdown table for ``category`` with optional topic metadata."""
     header_lines = [
@@ -445,6 +459,7 @@ def build_category_table(
         link=True,
         repos_path=repos_path,
         ranked_path=ranked_path,
+        table=table,
     )
     topics = _infer_topics(repos)
     heading = f"## 🧠 Top Agentic-AI Repositories: {category}  \n"
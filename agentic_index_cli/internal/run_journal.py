@@ -0,0 +1,135 @@
+"""Append-only run journals that let interrupted scrapes resume."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+# anchored to the checkout, not the working directory of the caller
+STATE_DIR = Path(__file__).resolve().parents[2] / "state"
+
+# journals of runs in progress, for progress reports from other threads
+_OPEN: Dict[Path, "RunJournal"] = {}
+
+
+class RunJournal:
+    """Record completed search pages and harvested repos for one run.
+
+    Each line of the journal is a JSON event: a ``start`` header with the
+    run parameters, then ``page`` events holding search payloads (the cursor
+    for every query shard) and ``repo`` events holding finished records.
+    Lines are flushed as they are written, so a crash loses at most the
+    event in progress. Reopening with ``resume=True`` and the same
+    parameters replays the events; otherwise the journal starts over.
+    """
+
+    def __init__(
+        self, path: Path, params: Dict[str, Any], *, resume: bool = False
+    ) -> None:
+        self.path = Path(path)
+        # normalise tuples and the like so parameters compare after a reload
+        self.params = json.loads(json.dumps(params))
+        self.pages: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self.repos: Dict[str, Dict[str, Any]] = {}
+        self.resumed = resume and self.path.exists() and self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        if self.resumed:
+            self._fh = self.path.open("a")
+            logger.info(
+                "resuming %s: %s pages, %s repos done",
+                self.path,
+                len(self.pages),
+                len(self.repos),
+            )
+        else:
+            self.pages.clear()
+            self.repos.clear()
+            self._fh = self.path.open("w")
+            self._write({"event": "start", "params": self.params})
+        _OPEN[self.path] = self
+
+    def _load(self) -> bool:
+        started = False
+        with self.path.open() as fh:
+            for lineno, line in enumerate(fh):
+                try:
+                    event = json_codec.loads(line)
+                except ValueError:
+                    if lineno == 0:
+                        break
+                    # a torn line from a crash; the events around it still hold
+                    continue
+                kind = event.get("event")
+                if lineno == 0:
+                    started = kind == "start" and event.get("params") == self.params
+                    if not started:
+                        break
+                elif kind == "page":
+                    self.pages[(event["query"], event["page"])] = event["payload"]
+                elif kind == "repo":
+                    self.repos[event["name"]] = event["record"]
+        if not started:
+            # a missing or torn header cannot vouch for the parameters
+            logger.warning(
+                "journal %s is for a different run; starting over", self.path
+            )
+        return started
+
+    def _write(self, event: Dict[str, Any]) -> None:
+        self._fh.write(json_codec.dumps(event, compact=True) + "\n")
+        self._fh.flush()
+
+    def page(self, query: str, page: int) -> Optional[Dict[str, Any]]:
+        """Return the recorded payload for ``page`` of ``query``, if any."""
+        return self.pages.get((query, page))
+
+    def record_page(self, query: str, page: int, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self.pages[(query, page)] = payload
+            self._write(
+                {"event": "page", "query": query, "page": page, "payload": payload}
+            )
+
+    def repo(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded record for repository ``name``, if any."""
+        return self.repos.get(name)
+
+    def record_repo(self, name: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.repos[name] = record
+            self._write({"event": "repo", "name": name, "record": record})
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+        if _OPEN.get(self.path) is self:
+            del _OPEN[self.path]
+
+    def complete(self) -> None:
+        """Close and delete the journal once the run has finished."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+def progress(name: str) -> Optional[Dict[str, int]]:
+    """Return the page and repo counts of the open journal ``name``, if any."""
+    journal = _OPEN.get(STATE_DIR / f"{name}_journal.jsonl")
+    if journal is None:
+        return None
+    return {"pages": len(journal.pages), "repos": len(journal.repos)}
+
+
+def open_journal(
+    name: str, params: Dict[str, Any], *, resume: bool = False
+) -> RunJournal:
+    """Return the journal ``STATE_DIR/<name>_journal.jsonl`` for a run."""
+    return RunJournal(STATE_DIR / f"{name}_journal.jsonl", params, resume=resume)
@@ -1,21 +1,75 @@
 from __future__ import annotations
 
+import logging
+import math
+from typing import List, Sequence
+
+import numpy as np
+
 from agentic_index_cli.constants import SCORE_KEY
-from lib.metrics_registry import get_metrics
+from lib.metrics_registry import (
+    MetricProvider,
+    RepoColumns,
+    get_metrics,
+    is_number,
+)
+
+from .classifier import default_classifier
+
+logger = logging.getLogger(__name__)
+
+
+def _metric_value(metric: MetricProvider, repo: dict) -> float:
+    """Return ``metric`` for ``repo``; errors and non-finite values count as 0."""
+    try:
+        value = metric.score(repo)
+    except Exception:
+        return 0.0
+    if not is_number(value) or not math.isfinite(value):
+        return 0.0
+    return float(value)
 
 
 def compute_score(repo: dict) -> float:
     """Return the Agentic Index score using registered metrics."""
     score = 0.0
     for metric in get_metrics():
-        try:
-            val = metric.score(repo)
-        except Exception:
-            val = 0.0
-        score += metric.weight * val
+        score += metric.weight * _metric_value(metric, repo)
     return round(score, 2)
 
 
+def _metric_values(metric: MetricProvider, columns: RepoColumns) -> np.ndarray:
+    """Return ``metric`` for every repo, unscorable repos counting as 0."""
+    score_batch = getattr(metric, "score_batch", None)
+    if score_batch is not None:
+        try:
+            values = np.asarray(score_batch(columns), dtype=float)
+            if values.shape != (len(columns),):
+                raise ValueError(f"expected {len(columns)} values, got {values.shape}")
+            return np.where(np.isfinite(values), values, 0.0)
+        except NotImplementedError:
+            pass
+        except Exception as exc:
+            logger.warning(
+                "batch metric %s failed, scoring per repo: %s", metric.name, exc
+            )
+    return np.array([_metric_value(metric, repo) for repo in columns.repos])
+
+
+def compute_scores(repos: Sequence[dict]) -> List[float]:
+    """Return :func:`compute_score` for each of ``repos`` in one pass.
+
+    Metrics providing ``score_batch`` run as vectorized operations over
+    :class:`~lib.metrics_registry.RepoColumns`; other plugins fall back to
+    per-repo ``score`` calls.
+    """
+    columns = RepoColumns(repos)
+    total = np.zeros(len(columns))
+    for metric in get_metrics():
+        total += metric.weight * _metric_values(metric, columns)
+    return [round(score, 2) for score in total.tolist()]
+
+
 def infer_category(repo: dict) -> str:
     """Derive a high-level category from repo metadata."""
     blob = (
@@ -25,13 +79,4 @@ def infer_category(repo: dict) -> str:
         + " "
         + repo.get("name", "")
     )
-    text = blob.lower()
-    if "rag" in text:
-        return "RAG-centric"
-    if "multi-agent" in text or "multi agent" in text or "crew" in text:
-        return "Multi-Agent Coordination"
-    if "devtool" in text or "runtime" in text or "tool" in text:
-        return "DevTools"
-    if "experiment" in text or "research" in text:
-        return "Experimental"
-    return "General-purpose"
+    return default_classifier().classify(blob, "category")
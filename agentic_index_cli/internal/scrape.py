@@ -13,13 +13,18 @@ from typing import Any, Dict, List
 
 from pydantic import BaseModel, ValidationError
 
+from agentic_index_cli.github_client import HARVEST_BACKEND, HARVEST_BACKENDS
 from agentic_index_cli.github_client import get as github_get
-from agentic_index_cli.internal import http_utils
+from agentic_index_cli.internal import graphql_harvest, http_utils
+from agentic_index_cli.internal import incremental as incremental_mod
+from agentic_index_cli.internal import run_journal, search_planner
 
 from ..exceptions import APIError, InvalidRepoError, RateLimitError
 from ..validate import save_repos
+from .classifier import default_classifier
 
 RATE_LIMIT_REMAINING = None
+REPO_URL = "https://api.github.com/repos"
 logger = logging.getLogger(__name__)
 
 QUERIES = [
@@ -42,6 +47,7 @@ FIELDS = [
     "language",
     "pushed_at",
     "owner",
+    "topics",
     "stars",
     "recency_factor",
     "issue_health",
@@ -147,15 +153,13 @@ def get_doc_completeness(full_name: str) -> float:
 
 def get_ecosystem_integration(description: str, topics: List[str]) -> float:
     """Check for ecosystem integration keywords."""
-    text = (description or "").lower() + " " + " ".join(topics).lower()
-    keywords = ["langchain", "openai", "plugin", "framework", "tool", "api"]
-    for keyword in keywords:
-        if keyword in text:
-            return 1.0
-    return 0.0
+    text = (description or "") + " " + " ".join(topics)
+    return 1.0 if default_classifier().labels(text, "ecosystem") else 0.0
 
 
-def _extract(item: Dict[str, Any]) -> Dict[str, Any]:
+def _extract(
+    item: Dict[str, Any], doc_completeness: float | None = None
+) -> Dict[str, Any]:
     try:
         repo = RepoModel(**item)
     except ValidationError as e:
@@ -175,9 +179,13 @@ def _extract(item: Dict[str, Any]) -> Dict[str, Any]:
     data["stars"] = stars  # Add stars for consistency with ranker
     data["recency_factor"] = compute_recency_factor(pushed_at)
     data["issue_health"] = compute_issue_health(open_issues)
-    data["doc_completeness"] = get_doc_completeness(data["full_name"])
+    if doc_completeness is None:
+        doc_completeness = get_doc_completeness(data["full_name"])
+    data["doc_completeness"] = doc_completeness
     data["license_freedom"] = get_license_freedom(license_info)
     data["ecosystem_integration"] = get_ecosystem_integration(description, topics)
+    # for the search index; ecosystem_integration above still ignores them
+    data["topics"] = list(item.get("topics") or [])
 
     return {
         field: data.get(field)
@@ -193,64 +201,154 @@ def _extract(item: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def scrape(min_stars: int = 0, token: str | None = None) -> List[Dict[str, Any]]:
-    """Return repository metadata from GitHub."""
+def _carry_forward(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a snapshot ``record`` in scrape output form."""
+    data = {field: record.get(field) for field in FIELDS}
+    if not isinstance(data["license"], dict):
+        data["license"] = {"spdx_id": data["license"]}
+    data["recency_factor"] = compute_recency_factor(data["pushed_at"] or "")
+    return data
+
+
+def scrape(
+    min_stars: int = 0,
+    token: str | None = None,
+    backend: str | None = None,
+    resume: bool = False,
+    incremental: bool = False,
+) -> List[Dict[str, Any]]:
+    """Return repository metadata from GitHub.
+
+    Every query is sharded by star and push-date ranges so results beyond
+    the 1,000-item search cap are included. With the ``graphql`` backend
+    documentation presence is checked in batched GraphQL queries instead of
+    probing raw URLs for every repository. Completed search pages and repos
+    are journaled under ``state/``; ``resume`` continues an interrupted run
+    with the same parameters instead of repeating its requests.
+
+    With ``incremental`` only repos pushed since the newest snapshot in
+    ``data/history`` are searched, and only those whose push date or counts
+    differ from it are re-scored. Every other snapshot entry is carried
+    forward with its recency refreshed, except the daily slice picked by
+    :meth:`Baseline.due`, which is fetched again so star and issue counts of
+    repos without pushes do not go stale.
+    """
+    backend = backend or HARVEST_BACKEND
+    if backend not in HARVEST_BACKENDS:
+        raise ValueError(f"unknown harvest backend {backend!r}")
+    baseline = incremental_mod.load_baseline() if incremental else None
+    if incremental and baseline is None:
+        logger.info("no snapshot found; running a full scrape")
+    journal = run_journal.open_journal(
+        "scrape",
+        {
+            "min_stars": min_stars,
+            "backend": backend,
+            "queries": QUERIES,
+            "since": str(baseline.since) if baseline else None,
+        },
+        resume=resume,
+    )
 
     async def _scrape_async() -> List[Dict[str, Any]]:
-        global RATE_LIMIT_REMAINING
         headers = {"Accept": "application/vnd.github+json"}
         if token:
             headers["Authorization"] = f"token {token}"
         all_repos: Dict[str, Dict[str, Any]] = {}
-        tasks = []
-        for query in QUERIES:
-            params = {
-                "q": f"{query} stars:>={min_stars}",
-                "sort": "stars",
-                "order": "desc",
-                "per_page": 100,
-            }
-            tasks.append(
-                asyncio.to_thread(
-                    _get,
-                    "https://api.github.com/search/repositories",
-                    headers=headers,
-                    params=params,
-                )
+
+        async def _fetch(url: str, params: Dict[str, Any]) -> http_utils.Response:
+            global RATE_LIMIT_REMAINING
+            response = await asyncio.to_thread(
+                _get, url, headers=headers, params=params
             )
+            remaining = int(response.headers.get("X-RateLimit-Remaining", "0"))
+            if RATE_LIMIT_REMAINING is None or remaining < RATE_LIMIT_REMAINING:
+                RATE_LIMIT_REMAINING = remaining
+            return response
+
         try:
-            responses = await asyncio.gather(*tasks)
+            items = [
+                item
+                async for item in search_planner.async_search(
+                    QUERIES,
+                    min_stars=min_stars,
+                    fetch=_fetch,
+                    journal=journal,
+                    pushed_since=baseline.since if baseline else None,
+                )
+            ]
         except Exception as exc:
             logger.warning("request failed: %s", exc)
             raise
-        for response in responses:
-            remaining = int(response.headers.get("X-RateLimit-Remaining", "0"))
-            if RATE_LIMIT_REMAINING is None or remaining < RATE_LIMIT_REMAINING:
-                RATE_LIMIT_REMAINING = remaining
+        if baseline is not None:
+            found = {i["full_name"] for i in items}
+            due = [n for n in baseline.carried(found, min_stars) if baseline.due(n)]
+            responses = await asyncio.gather(
+                *(_fetch(f"{REPO_URL}/{name}", {}) for name in due)
+            )
+            items += [r.json() for r in responses if r.status_code == 200]
+        for item in items:
+            recorded = journal.repo(item["full_name"])
+            if recorded is not None:
+                all_repos[item["full_name"]] = recorded
+            elif baseline is not None and not baseline.changed(item):
+                all_repos[item["full_name"]] = _carry_forward(
+                    baseline.repos[item["full_name"]]
+                )
+        items = [i for i in items if i["full_name"] not in all_repos]
+        if baseline is not None:
+            logger.info("incremental scrape: %s changed repos", len(items))
+        docs: Dict[str, float] = {}
+        if backend == "graphql":
+            names = sorted({i["full_name"] for i in items})
+            snapshots = await graphql_harvest.async_fetch_all(
+                names, readme_text=False, headers=headers
+            )
+            docs = {
+                name: 1.0 if snap.readme_size or snap.has_docs else 0.0
+                for name, snap in snapshots.items()
+            }
+        for item in items:
             try:
-                items = response.json().get("items", [])
-            except ValueError as e:
-                logger.warning("bad JSON skipped: %s", e)
+                data = _extract(item, docs.get(item.get("full_name")))
+            except InvalidRepoError as e:
+                logger.warning("invalid repo skipped: %s", e)
                 continue
-            for item in items:
-                try:
-                    data = _extract(item)
-                except InvalidRepoError as e:
-                    logger.warning("invalid repo skipped: %s", e)
-                    continue
-                all_repos[data["full_name"]] = data
+            journal.record_repo(item["full_name"], data)
+            all_repos[data["full_name"]] = data
+        if baseline is not None:
+            for name in baseline.carried(all_repos, min_stars):
+                all_repos[name] = _carry_forward(baseline.repos[name])
         return list(all_repos.values())
 
-    return asyncio.run(_scrape_async())
+    try:
+        repos = asyncio.run(_scrape_async())
+    finally:
+        journal.close()
+    journal.complete()
+    return repos
 
 
 def main() -> None:
     """CLI wrapper for :func:`scrape`."""
     parser = argparse.ArgumentParser(description="Fetch GitHub repos for Agentic Index")
     parser.add_argument("--min-stars", type=int, default=0, dest="min_stars")
+    parser.add_argument(
+        "--resume", action="store_true", help="continue an interrupted run"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-score repos changed since the last snapshot",
+    )
     args = parser.parse_args()
     token = os.getenv("GITHUB_TOKEN")
-    repos = scrape(min_stars=args.min_stars, token=token)
+    repos = scrape(
+        min_stars=args.min_stars,
+        token=token,
+        resume=args.resume,
+        incremental=args.incremental,
+    )
     path = Path("data/repos.json")
     path.parent.mkdir(parents=True, exist_ok=True)
     save_repos(path, repos)
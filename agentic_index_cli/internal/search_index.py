@@ -0,0 +1,263 @@
+"""BM25 full-text index over repo names, descriptions, topics and READMEs.
+
+The ranking run writes the index next to ``repos.json`` as
+``search_index.npz``, a build artifact kept out of git. Scraped records carry
+topics but no ``readme_excerpt``, so README text is only indexed for records
+that have one, such as harvested metadata.
+
+Postings are kept in compressed sparse row form: the docs and term
+frequencies of vocabulary term ``i`` are ``docs[offsets[i]:offsets[i + 1]]``
+and the same slice of ``tfs``. A query scores only the postings of its
+terms, with numpy, into one dense array. The last term also matches as a
+prefix, so partial input like ``"vector da"`` finds ``database``. Relevance
+can be blended with the repo's :data:`SCORE_KEY`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..constants import SCORE_KEY
+from . import json_codec
+
+INDEX_FILE = "search_index.npz"
+INDEX_VERSION = 1
+# a field's text is indexed this many times, weighting its terms
+FIELD_WEIGHTS = {"name": 3, "topics": 2, "description": 1, "readme_excerpt": 1}
+K1 = 1.2
+B = 0.75
+MAX_EXPANSIONS = 64
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Return the lowercase word tokens of ``text`` minus stopwords."""
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _field_text(repo: Dict[str, Any], field: str) -> str:
+    if field == "name":
+        return f"{repo.get('full_name') or ''} {repo.get('name') or ''}"
+    value = repo.get(field) or ""
+    if isinstance(value, list):
+        # harvested topics are a comma separated string, API ones a list
+        value = " ".join(str(v) for v in value)
+    return str(value)
+
+
+def _terms(repo: Dict[str, Any]) -> Counter:
+    text = " ".join(
+        _field_text(repo, field) for field, w in FIELD_WEIGHTS.items() for _ in range(w)
+    )
+    counts = Counter(_TOKEN.findall(text.lower()))
+    for word in _STOPWORDS.intersection(counts):
+        del counts[word]
+    return counts
+
+
+class SearchIndex:
+    """Inverted index with BM25 scoring."""
+
+    def __init__(
+        self,
+        ids: List[str],
+        scores: np.ndarray,
+        lengths: np.ndarray,
+        vocab: List[str],
+        offsets: np.ndarray,
+        docs: np.ndarray,
+        tfs: np.ndarray,
+    ) -> None:
+        self.ids = ids
+        self.scores = scores
+        self.lengths = lengths
+        self.vocab = vocab
+        self.offsets = offsets
+        self.docs = docs
+        self.tfs = tfs
+        self._term_ids = {term: i for i, term in enumerate(vocab)}
+        self._avgdl = float(lengths.mean()) if len(lengths) else 1.0
+        self._max_score = float(scores.max()) if len(scores) else 0.0
+
+    @classmethod
+    def build(cls, repos: Iterable[Dict[str, Any]]) -> "SearchIndex":
+        ids: List[str] = []
+        scores: List[float] = []
+        lengths: List[int] = []
+        per_doc: List[int] = []
+        term_ids: List[int] = []
+        tfs: List[int] = []
+        seen: Dict[str, int] = {}
+        for repo in repos:
+            ids.append(repo.get("full_name") or repo.get("name") or "")
+            score = repo.get(SCORE_KEY)
+            scores.append(score if isinstance(score, (int, float)) else 0.0)
+            counts = _terms(repo)
+            lengths.append(sum(counts.values()))
+            per_doc.append(len(counts))
+            term_ids += [seen.setdefault(t, len(seen)) for t in counts]
+            tfs += counts.values()
+
+        # renumber terms alphabetically so a prefix is a contiguous range
+        vocab = sorted(seen)
+        rank = np.empty(len(vocab), dtype=np.int64)
+        rank[[seen[t] for t in vocab]] = np.arange(len(vocab))
+        terms = rank[np.asarray(term_ids, dtype=np.int64)]
+        order = np.argsort(terms, kind="stable")
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=len(vocab)), out=offsets[1:])
+        docs = np.repeat(np.arange(len(ids), dtype=np.int32), per_doc)
+        return cls(
+            ids,
+            np.asarray(scores, dtype=np.float64),
+            np.asarray(lengths, dtype=np.float64),
+            vocab,
+            offsets,
+            docs[order],
+            np.asarray(tfs, dtype=np.float32)[order],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # -- persistence -----------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as fh:
+            np.savez_compressed(
+                fh,
+                version=np.array(INDEX_VERSION),
+                ids=np.array(self.ids, dtype=str),
+                scores=self.scores,
+                lengths=self.lengths,
+                vocab=np.array(self.vocab, dtype=str),
+                offsets=self.offsets,
+                docs=self.docs,
+                tfs=self.tfs,
+            )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SearchIndex"]:
+        """Return the index saved at ``path``, ``None`` if missing or outdated."""
+        try:
+            with np.load(path, allow_pickle=False) as raw:
+                if int(raw["version"]) != INDEX_VERSION:
+                    return None
+                return cls(
+                    raw["ids"].tolist(),
+                    raw["scores"],
+                    raw["lengths"],
+                    raw["vocab"].tolist(),
+                    raw["offsets"],
+                    raw["docs"],
+                    raw["tfs"],
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def for_data(
+        cls, data_file: Path, repos: Optional[List[Dict[str, Any]]] = None
+    ) -> "SearchIndex":
+        """Return the index saved beside ``data_file`` if it is current.
+
+        Otherwise build one from ``repos``, or from ``data_file`` itself.
+        """
+        data_file = Path(data_file)
+        path = data_file.parent / INDEX_FILE
+        try:
+            fresh = path.stat().st_mtime_ns >= data_file.stat().st_mtime_ns
+        except OSError:
+            fresh = False
+        index = cls.load(path) if fresh else None
+        if index is not None:
+            return index
+        if repos is None:
+            repos = []
+            if data_file.exists():
+                repos = json_codec.read(data_file).get("repos", [])
+        return cls.build(repos)
+
+    # -- queries ---------------------------------------------------------------
+
+    def _expand(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self.vocab, prefix)
+        stop = bisect.bisect_left(self.vocab, prefix + "\uffff")
+        if stop - start <= MAX_EXPANSIONS:
+            return list(range(start, stop))
+        # keep the terms with the most postings
+        sizes = np.diff(self.offsets[start : stop + 1])
+        keep = np.argsort(-sizes, kind="stable")[:MAX_EXPANSIONS]
+        return [start + int(i) for i in keep]
+
+    def _bm25(self, term: int) -> Tuple[np.ndarray, np.ndarray]:
+        lo, hi = self.offsets[term], self.offsets[term + 1]
+        docs, tfs = self.docs[lo:hi], self.tfs[lo:hi]
+        n = hi - lo
+        idf = np.log1p((len(self.ids) - n + 0.5) / (n + 0.5))
+        norm = K1 * (1 - B + B * self.lengths[docs] / self._avgdl)
+        return docs, idf * tfs * (K1 + 1) / (tfs + norm)
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        prefix: bool = True,
+        blend: float = 0.0,
+    ) -> List[Tuple[str, float, float]]:
+        """Return ``(id, relevance, bm25)`` for the best matches of ``query``.
+
+        With ``prefix`` the last query term also matches longer terms.
+        ``blend`` in ``[0, 1]`` mixes the normalized :data:`SCORE_KEY` of each
+        match into its relevance.
+        """
+        tokens = tokenize(query)
+        if not tokens or not self.ids or limit <= 0:
+            return []
+        totals = np.zeros(len(self.ids))
+        for pos, token in enumerate(tokens):
+            if prefix and pos == len(tokens) - 1:
+                # a doc matching several expansions counts its best one
+                best = np.zeros(len(self.ids))
+                for term in self._expand(token):
+                    docs, values = self._bm25(term)
+                    best[docs] = np.maximum(best[docs], values)
+                totals += best
+            elif token in self._term_ids:
+                docs, values = self._bm25(self._term_ids[token])
+                totals[docs] += values
+        matched = np.flatnonzero(totals)
+        if not len(matched):
+            return []
+        bm25 = totals[matched]
+        relevance = bm25
+        if blend:
+            relevance = (1 - blend) * bm25 / bm25.max()
+            if self._max_score > 0:
+                relevance += blend * self.scores[matched] / self._max_score
+        top = np.arange(len(matched))
+        if len(matched) > limit:
+            top = np.argpartition(-relevance, limit - 1)[:limit]
+        # equal relevance keeps corpus order
+        top = top[np.lexsort((matched[top], -relevance[top]))]
+        return [
+            (
+                self.ids[matched[i]],
+                round(float(relevance[i]), 6),
+                round(float(bm25[i]), 6),
+            )
+            for i in top
+        ]
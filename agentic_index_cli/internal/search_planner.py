@@ -0,0 +1,191 @@
+"""Sharded repository search that reaches past GitHub's 1,000-result cap."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import math
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..github_client import async_get
+from .http_utils import Response
+from .run_journal import RunJournal
+
+logger = logging.getLogger(__name__)
+
+SEARCH_URL = "https://api.github.com/search/repositories"
+RESULT_CAP = 1000
+PER_PAGE = 100
+EARLIEST_PUSH = datetime.date(2008, 1, 1)
+
+Fetch = Callable[[str, Dict[str, Any]], Awaitable[Response]]
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One search term restricted to a star range and optional push window."""
+
+    term: str
+    min_stars: int = 0
+    max_stars: Optional[int] = None
+    pushed_from: Optional[datetime.date] = None
+    pushed_to: Optional[datetime.date] = None
+
+    def query(self) -> str:
+        """Return the ``q`` parameter for this shard."""
+        if self.max_stars is None:
+            parts = [self.term, f"stars:>={self.min_stars}"]
+        else:
+            parts = [self.term, f"stars:{self.min_stars}..{self.max_stars}"]
+        if self.pushed_from is not None and self.pushed_to is not None:
+            parts.append(f"pushed:{self.pushed_from}..{self.pushed_to}")
+        elif self.pushed_from is not None:
+            parts.append(f"pushed:>={self.pushed_from}")
+        return " ".join(parts)
+
+    def split(self, top_stars: int) -> List["Shard"]:
+        """Return two narrower shards, or ``[]`` if this one cannot be split.
+
+        Star ranges are cut at their geometric midpoint since counts fall off
+        sharply with stars. A single star value is split by push date.
+        ``top_stars`` bounds open-ended ranges.
+        """
+        lo = self.min_stars
+        hi = self.max_stars if self.max_stars is not None else max(top_stars, lo)
+        if hi > lo:
+            mid = min(max(math.isqrt((lo + 1) * (hi + 1)) - 1, lo), hi - 1)
+            return [replace(self, max_stars=mid), replace(self, min_stars=mid + 1)]
+        start = self.pushed_from or EARLIEST_PUSH
+        end = self.pushed_to or datetime.datetime.now(datetime.timezone.utc).date()
+        if end > start:
+            mid_day = start + (end - start) // 2
+            return [
+                replace(self, max_stars=hi, pushed_from=start, pushed_to=mid_day),
+                replace(
+                    self,
+                    max_stars=hi,
+                    pushed_from=mid_day + datetime.timedelta(days=1),
+                    pushed_to=end,
+                ),
+            ]
+        return []
+
+
+async def _default_fetch(url: str, params: Dict[str, Any]) -> Response:
+    return await async_get(url, params=params)
+
+
+async def _fetch_page(
+    fetch: Fetch, shard: Shard, page: int, journal: Optional[RunJournal] = None
+) -> Tuple[Shard, int, Dict[str, Any]]:
+    if journal is not None:
+        recorded = journal.page(shard.query(), page)
+        if recorded is not None:
+            return shard, page, recorded
+    params = {
+        "q": shard.query(),
+        "sort": "stars",
+        "order": "desc",
+        "per_page": PER_PAGE,
+        "page": page,
+    }
+    resp = await fetch(SEARCH_URL, params)
+    if resp.status_code != 200:
+        logger.warning(
+            "search %r page %s failed: %s", params["q"], page, resp.status_code
+        )
+        return shard, page, {}
+    try:
+        payload = resp.json()
+    except ValueError as exc:
+        logger.warning("bad JSON skipped: %s", exc)
+        return shard, page, {}
+    if journal is not None:
+        journal.record_page(params["q"], page, payload)
+    return shard, page, payload
+
+
+def _plan(
+    shard: Shard, payload: Dict[str, Any], max_pages: Optional[int]
+) -> List[Tuple[Shard, int]]:
+    """Return the follow-up requests after page 1 of ``shard``."""
+    items = payload.get("items") or []
+    total = payload.get("total_count", len(items))
+    if max_pages is None and total > RESULT_CAP:
+        top = items[0].get("stargazers_count", shard.min_stars) if items else 0
+        children = shard.split(top)
+        if children:
+            return [(child, 1) for child in children]
+        logger.warning(
+            "search %r has %s results; only %s reachable",
+            shard.query(),
+            total,
+            RESULT_CAP,
+        )
+    pages = math.ceil(min(total, RESULT_CAP) / PER_PAGE)
+    if max_pages is not None:
+        pages = min(pages, max_pages)
+    return [(shard, page) for page in range(2, pages + 1)]
+
+
+async def async_search(
+    terms: Iterable[str],
+    *,
+    min_stars: int = 0,
+    max_pages: Optional[int] = None,
+    fetch: Optional[Fetch] = None,
+    journal: Optional[RunJournal] = None,
+    pushed_since: Optional[datetime.date] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield unique repository items matching any of ``terms``.
+
+    Page 1 of every term is requested first; its ``total_count`` decides
+    whether the query is split into star and push-date shards (until each fits
+    under :data:`RESULT_CAP`) or its remaining pages are requested. All pages
+    run concurrently, paced by the shared client, and items are yielded as
+    pages arrive, deduplicated by ``full_name``. ``max_pages`` caps the pages
+    per query and disables sharding. ``fetch`` defaults to
+    :func:`agentic_index_cli.github_client.async_get`. Pages found in
+    ``journal`` are replayed instead of requested and new ones are recorded.
+    ``pushed_since`` restricts every query to repos pushed on or after it.
+    """
+    fetch = fetch or _default_fetch
+    seen: Set[str] = set()
+    pending: Set[asyncio.Future] = set()
+
+    def submit(shard: Shard, page: int) -> None:
+        pending.add(asyncio.ensure_future(_fetch_page(fetch, shard, page, journal)))
+
+    for term in terms:
+        submit(Shard(term, min_stars, pushed_from=pushed_since), 1)
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                shard, page, payload = task.result()
+                if page == 1:
+                    for follow_up in _plan(shard, payload, max_pages):
+                        submit(*follow_up)
+                for item in payload.get("items") or []:
+                    full_name = item.get("full_name")
+                    if not full_name or full_name in seen:
+                        continue
+                    seen.add(full_name)
+                    yield item
+    finally:
+        for task in pending:
+            task.cancel()
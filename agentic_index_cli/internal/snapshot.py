@@ -1,38 +1,51 @@
 from __future__ import annotations
 
 import datetime
-import json
-import shutil
 from pathlib import Path
 
 from agentic_index_cli.constants import SCORE_KEY
-from agentic_index_cli.validate import save_repos
+from agentic_index_cli.internal import json_codec
+from agentic_index_cli.internal.history_index import HistoryIndex
+from agentic_index_cli.internal.history_store import HistoryStore
+from agentic_index_cli.repo_table import RepoTable
 
 __all__ = ["persist_history", "write_by_category"]
 
 
 def persist_history(data_file: Path, repos: list[dict], *, delta_days: int) -> None:
-    """Save ``repos`` snapshot and prune old entries."""
+    """Save today's snapshot of ``data_file`` and prune old entries.
+
+    Snapshots are manifests in a :class:`HistoryStore`. Records only the
+    pruned snapshots referenced are collected; full snapshots left by older
+    versions are converted by ``agentic-index history-compact``. The
+    :class:`HistoryIndex` is brought up to date afterwards.
+    """
     history_dir = data_file.parent / "history"
     history_dir.mkdir(exist_ok=True)
+    store = HistoryStore(history_dir)
     today_iso = datetime.date.today().isoformat()
     snapshot_path = history_dir / f"{today_iso}.json"
-    shutil.copy(data_file, snapshot_path)
+    store.put(snapshot_path, json_codec.read(data_file))
     (data_file.parent / "last_snapshot.txt").write_text(str(snapshot_path))
-    snapshots = sorted(history_dir.glob("*.json"))
-    for old in snapshots[:-delta_days]:
+    pruned = store.snapshots()[:-delta_days]
+    for old in pruned:
         old.unlink()
+    if pruned:
+        store.gc()
+    index = HistoryIndex.load(history_dir)
+    if index.update(history_dir):
+        index.save(history_dir)
 
 
-def write_by_category(data_dir: Path, repos: list[dict]) -> None:
+def write_by_category(data_dir: Path, repos: RepoTable | list[dict]) -> None:
     """Write per-category repo lists under ``data_dir/by_category``."""
     by_cat = data_dir / "by_category"
     by_cat.mkdir(exist_ok=True)
+    table = RepoTable.coerce(repos)
     index: dict[str, str] = {}
-    for cat in sorted({r.get("category") for r in repos if r.get("category")}):
-        cat_repos = [r for r in repos if r.get("category") == cat]
-        cat_repos.sort(key=lambda r: r[SCORE_KEY], reverse=True)
+    for cat in table.categories():
+        cat_repos = table.category(cat).sort_by(SCORE_KEY, reverse=True)
         fname = f"{cat}.json"
-        save_repos(by_cat / fname, cat_repos)
+        cat_repos.save(by_cat / fname, validation="hash")
         index[cat] = fname
-    (by_cat / "index.json").write_text(json.dumps(index, indent=2) + "\n")
+    json_codec.write(by_cat / "index.json", index)
@@ -4,19 +4,24 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 import aiohttp
 import structlog
 
 from .constants import SCORE_KEY
 from .exceptions import APIError
+from .github_client import HARVEST_BACKEND, HARVEST_BACKENDS
 from .github_client import async_get as github_async_get
+from .github_client import client as github_client
 from .github_client import get as github_get
+from .github_client import http_cache_stats, record_cache_hit
+from .github_client import scheduler as github_scheduler
+from .internal import cache_store, graphql_harvest, run_journal, search_planner
 from .internal.http_utils import Response
+from .internal.incremental import Baseline, load_baseline
 from .scoring import categorize, compute_score
 
 logger = structlog.get_logger(__name__).bind(file=__file__)
@@ -28,21 +33,27 @@ CACHE_TTL = 86400  # seconds
 
 SEARCH_TERMS = ["agent framework", "LLM agent"]
 TOPIC_FILTERS = ["agent"]
+HARVEST_WINDOW = 64
 
 
-def _load_cache(path: Path) -> Any | None:
-    if path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL:
-        try:
-            with path.open() as fh:
-                return json.load(fh)
-        except Exception:
-            return None
-    return None
+def _store() -> cache_store.CacheStore:
+    """Return the cache store rooted at :data:`CACHE_DIR`."""
+    return cache_store.open_store(CACHE_DIR)
+
 
+def _cache_key(kind: str, full_name: str, ext: str = "json") -> str:
+    return f"{kind}_{full_name.replace('/', '_')}.{ext}"
 
-def _save_cache(path: Path, data: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n")
+
+def _load_cache(key: str) -> Any | None:
+    data = _store().get(key, max_age=CACHE_TTL)
+    if data is not None:
+        record_cache_hit()
+    return data
+
+
+def _save_cache(key: str, data: Any) -> None:
+    _store().put(key, data)
 
 
 def _get(
@@ -77,8 +88,8 @@ def github_search(query: str, page: int = 1) -> List[Dict]:
 
 def fetch_repo(full_name: str) -> Optional[Dict]:
     """Return repository metadata for ``full_name``."""
-    cache_file = CACHE_DIR / f"repo_{full_name.replace('/', '_')}.json"
-    cached = _load_cache(cache_file)
+    cache_key = _cache_key("repo", full_name)
+    cached = _load_cache(cache_key)
     if cached:
         return cached
     try:
@@ -90,15 +101,16 @@ def fetch_repo(full_name: str) -> Optional[Dict]:
         logger.error("Repo fetch error %s %s", full_name, resp.status_code)
         return None
     data = resp.json()
-    _save_cache(cache_file, data)
+    _save_cache(cache_key, data)
     return data
 
 
 def fetch_readme(full_name: str) -> str:
     """Return decoded README text for ``full_name``."""
-    cache_file = CACHE_DIR / f"readme_{full_name.replace('/', '_')}.txt"
-    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < CACHE_TTL:
-        return cache_file.read_text()
+    cache_key = _cache_key("readme", full_name, "txt")
+    cached = _load_cache(cache_key)
+    if cached is not None:
+        return cached
     try:
         resp = _get(f"{GITHUB_API}/repos/{full_name}/readme")
     except Exception as exc:  # pragma: no cover - network error path
@@ -109,17 +121,73 @@ def fetch_readme(full_name: str) -> str:
     data = resp.json()
     if "content" in data:
         text = base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(text)
+        _save_cache(cache_key, text)
         return text
     return ""
 
 
+def _build_meta(full_name: str, repo: Dict, readme: str) -> Dict:
+    """Return the harvested record for ``repo`` and its ``readme`` text."""
+    score = compute_score(repo, readme)
+    category = categorize(repo.get("description", ""), repo.get("topics", []))
+    first_paragraph = readme.split("\n\n")[0][:200]
+    lic = repo.get("license")
+    license_value = lic if not isinstance(lic, dict) else lic.get("spdx_id")
+    return {
+        "name": full_name,
+        "description": repo.get("description", ""),
+        "stars": repo.get("stargazers_count", 0),
+        "forks": repo.get("forks_count", 0),
+        "open_issues": repo.get("open_issues_count", 0),
+        "closed_issues": repo.get("closed_issues", 0),
+        "last_commit": repo.get("pushed_at", ""),
+        "language": repo.get("language", ""),
+        "license": license_value,
+        "maintainer": repo.get("owner", {}).get("login"),
+        "topics": ",".join(repo.get("topics", [])),
+        "readme_excerpt": first_paragraph,
+        SCORE_KEY: score,
+        "category": category,
+    }
+
+
+# snapshot fields kept as they are when a record is carried forward; the
+# README they were derived from is not in the snapshot
+CARRIED_FIELDS = (
+    SCORE_KEY,
+    "category",
+    "readme_excerpt",
+    "stars",
+    "recency_factor",
+    "issue_health",
+    "doc_completeness",
+    "license_freedom",
+    "ecosystem_integration",
+)
+
+
+def _carry_forward(full_name: str, record: Dict) -> Dict:
+    """Return a harvested record for snapshot ``record`` without new requests.
+
+    The repo fields are mapped as in :func:`_build_meta`; the score, category
+    and derived fields are carried over unchanged instead of recomputed
+    without the README.
+    """
+    repo = dict(record)
+    if isinstance(repo.get("topics"), str):
+        repo["topics"] = [t for t in repo["topics"].split(",") if t]
+    meta = _build_meta(full_name, repo, "")
+    for field in CARRIED_FIELDS:
+        if field in record:
+            meta[field] = record[field]
+    return meta
+
+
 async def async_fetch_repo(
-    full_name: str, session: aiohttp.ClientSession
+    full_name: str, session: aiohttp.ClientSession | None = None
 ) -> Optional[Dict]:
-    cache_file = CACHE_DIR / f"repo_{full_name.replace('/', '_')}.json"
-    cached = _load_cache(cache_file)
+    cache_key = _cache_key("repo", full_name)
+    cached = _load_cache(cache_key)
     if cached:
         return cached
     try:
@@ -134,14 +202,17 @@ async def async_fetch_repo(
         logger.error("Repo fetch error %s %s", full_name, resp.status_code)
         return None
     data = resp.json()
-    _save_cache(cache_file, data)
+    _save_cache(cache_key, data)
     return data
 
 
-async def async_fetch_readme(full_name: str, session: aiohttp.ClientSession) -> str:
-    cache_file = CACHE_DIR / f"readme_{full_name.replace('/', '_')}.txt"
-    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < CACHE_TTL:
-        return cache_file.read_text()
+async def async_fetch_readme(
+    full_name: str, session: aiohttp.ClientSession | None = None
+) -> str:
+    cache_key = _cache_key("readme", full_name, "txt")
+    cached = _load_cache(cache_key)
+    if cached is not None:
+        return cached
     try:
         resp = await github_async_get(
             f"{GITHUB_API}/repos/{full_name}/readme",
@@ -155,148 +226,329 @@ async def async_fetch_readme(full_name: str, session: aiohttp.ClientSession) ->
     data = resp.json()
     if "content" in data:
         text = base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(text)
+        _save_cache(cache_key, text)
         return text
     return ""
 
 
 async def async_harvest_repo(
-    full_name: str, session: aiohttp.ClientSession
+    full_name: str, session: aiohttp.ClientSession | None = None
 ) -> Optional[Dict]:
-    cache_file = CACHE_DIR / f"meta_{full_name.replace('/', '_')}.json"
-    cached = _load_cache(cache_file)
+    cache_key = _cache_key("meta", full_name)
+    cached = _load_cache(cache_key)
     if cached:
         return cached
     repo = await async_fetch_repo(full_name, session)
     if not repo:
         return None
     readme = await async_fetch_readme(full_name, session)
-    score = compute_score(repo, readme)
-    category = categorize(repo.get("description", ""), repo.get("topics", []))
-    first_paragraph = readme.split("\n\n")[0][:200]
-    lic = repo.get("license")
-    license_value = lic if not isinstance(lic, dict) else lic.get("spdx_id")
-    data = {
-        "name": full_name,
-        "description": repo.get("description", ""),
-        "stars": repo.get("stargazers_count", 0),
-        "forks": repo.get("forks_count", 0),
-        "open_issues": repo.get("open_issues_count", 0),
-        "closed_issues": repo.get("closed_issues", 0),
-        "last_commit": repo.get("pushed_at", ""),
-        "language": repo.get("language", ""),
-        "license": license_value,
-        "maintainer": repo.get("owner", {}).get("login"),
-        "topics": ",".join(repo.get("topics", [])),
-        "readme_excerpt": first_paragraph,
-        SCORE_KEY: score,
-        "category": category,
-    }
-    _save_cache(cache_file, data)
+    data = _build_meta(full_name, repo, readme)
+    _save_cache(cache_key, data)
     return data
 
 
 def harvest_repo(full_name: str) -> Optional[Dict]:
-    cache_file = CACHE_DIR / f"meta_{full_name.replace('/', '_')}.json"
-    cached = _load_cache(cache_file)
+    cache_key = _cache_key("meta", full_name)
+    cached = _load_cache(cache_key)
     if cached:
         return cached
     repo = fetch_repo(full_name)
     if not repo:
         return None
     readme = fetch_readme(full_name)
-    score = compute_score(repo, readme)
-    category = categorize(repo.get("description", ""), repo.get("topics", []))
-    first_paragraph = readme.split("\n\n")[0][:200]
-    lic = repo.get("license")
-    license_value = lic if not isinstance(lic, dict) else lic.get("spdx_id")
-    data = {
-        "name": full_name,
-        "description": repo.get("description", ""),
-        "stars": repo.get("stargazers_count", 0),
-        "forks": repo.get("forks_count", 0),
-        "open_issues": repo.get("open_issues_count", 0),
-        "closed_issues": repo.get("closed_issues", 0),
-        "last_commit": repo.get("pushed_at", ""),
-        "language": repo.get("language", ""),
-        "license": license_value,
-        "maintainer": repo.get("owner", {}).get("login"),
-        "topics": ",".join(repo.get("topics", [])),
-        "readme_excerpt": first_paragraph,
-        SCORE_KEY: score,
-        "category": category,
-    }
-    _save_cache(cache_file, data)
+    data = _build_meta(full_name, repo, readme)
+    _save_cache(cache_key, data)
     return data
 
 
-async def async_search_and_harvest(
-    min_stars: int = 0, max_pages: int = 1
-) -> List[Dict]:
-    seen = set()
+async def async_graphql_harvest(names: List[str]) -> List[Dict]:
+    """Harvest ``names`` with batched GraphQL queries.
+
+    Repositories missing from the GraphQL response fall back to
+    :func:`async_harvest_repo`.
+    """
+    keys = {name: _cache_key("meta", name) for name in names}
+    cached = _store().get_many(keys.values(), max_age=CACHE_TTL)
     results: List[Dict] = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for term in SEARCH_TERMS:
-            for page in range(1, max_pages + 1):
-                query = f"{term} stars:>={min_stars}"
-                resp = await github_async_get(
-                    f"{GITHUB_API}/search/repositories",
-                    params={
-                        "q": query,
-                        "sort": "stars",
-                        "order": "desc",
-                        "per_page": 100,
-                        "page": page,
-                    },
-                    session=session,
-                )
-                for repo in resp.json().get("items", []):
-                    full_name = repo["full_name"]
-                    if full_name in seen:
-                        continue
-                    seen.add(full_name)
-                    tasks.append(
-                        asyncio.create_task(async_harvest_repo(full_name, session))
-                    )
-
-        for topic in TOPIC_FILTERS:
-            for page in range(1, max_pages + 1):
-                query = f"topic:{topic} stars:>={min_stars}"
-                resp = await github_async_get(
-                    f"{GITHUB_API}/search/repositories",
-                    params={
-                        "q": query,
-                        "sort": "stars",
-                        "order": "desc",
-                        "per_page": 100,
-                        "page": page,
-                    },
-                    session=session,
-                )
-                for repo in resp.json().get("items", []):
-                    full_name = repo["full_name"]
-                    if full_name in seen:
-                        continue
-                    seen.add(full_name)
-                    tasks.append(
-                        asyncio.create_task(async_harvest_repo(full_name, session))
-                    )
-
-        for fut in asyncio.as_completed(tasks):
-            try:
-                meta = await fut
-            except Exception as exc:  # pragma: no cover - worker error path
-                logger.error("harvest failed: %s", exc)
-                continue
-            if meta:
+    pending: List[str] = []
+    for full_name in names:
+        meta = cached.get(keys[full_name])
+        if meta:
+            record_cache_hit()
+            results.append(meta)
+        else:
+            pending.append(full_name)
+    # the legacy score and the excerpt are computed from the README text
+    snapshots = await graphql_harvest.async_fetch_all(pending, readme_text=True)
+    fallback = []
+    fresh: Dict[str, Dict] = {}
+    for full_name in pending:
+        snap = snapshots.get(full_name)
+        if snap is None:
+            fallback.append(full_name)
+            continue
+        data = _build_meta(full_name, snap.repo, snap.readme)
+        fresh[keys[full_name]] = data
+        results.append(data)
+    if fresh:
+        _store().put_many(fresh)
+    if fallback:
+        logger.warning("GraphQL fallback for %s repos", len(fallback))
+        for meta in await asyncio.gather(
+            *(async_harvest_repo(n) for n in fallback), return_exceptions=True
+        ):
+            if isinstance(meta, dict):
                 results.append(meta)
+            elif isinstance(meta, BaseException):  # pragma: no cover - worker error
+                logger.error("harvest failed: %s", meta)
     return results
 
 
-def search_and_harvest(min_stars: int = 0, max_pages: int = 1) -> List[Dict]:
+def _invalidate(full_name: str) -> None:
+    """Drop cached metadata so ``full_name`` is fetched again."""
+    for kind, ext in (("repo", "json"), ("readme", "txt"), ("meta", "json")):
+        _store().delete(_cache_key(kind, full_name, ext))
+
+
+async def async_iter_search_and_harvest(
+    min_stars: int = 0,
+    max_pages: int | None = 1,
+    backend: str | None = None,
+    journal: run_journal.RunJournal | None = None,
+    baseline: Baseline | None = None,
+) -> AsyncIterator[Dict]:
+    """Yield harvested records for :data:`SEARCH_TERMS` and :data:`TOPIC_FILTERS`.
+
+    Harvesting starts while search pages are still arriving and each record
+    is yielded as soon as it is ready. At most :data:`HARVEST_WINDOW` repos
+    are in flight, so a slow consumer holds back the search instead of
+    buffering every result. At most ``max_pages`` pages per query are read,
+    one by default; with ``max_pages=None`` every query is sharded until all
+    matches are reachable. Search pages and records already in ``journal`` are
+    replayed without new requests, and new ones are added to it.
+
+    With a ``baseline`` snapshot only repos pushed since it are searched.
+    Hits that differ from the snapshot are harvested afresh, as is the daily
+    slice of the other snapshot repos picked by :meth:`Baseline.due`, since
+    their counts change without pushes. Unchanged hits and the rest of the
+    snapshot are carried forward from it with their scores; a cached record
+    of any age is preferred.
+    """
+    backend = backend or HARVEST_BACKEND
+    if backend not in HARVEST_BACKENDS:
+        raise ValueError(f"unknown harvest backend {backend!r}")
+    queries = list(SEARCH_TERMS) + [f"topic:{topic}" for topic in TOPIC_FILTERS]
+    queue: asyncio.Queue = asyncio.Queue(maxsize=HARVEST_WINDOW)
+    window = asyncio.Semaphore(HARVEST_WINDOW)
+    done = object()
+
+    async def _fetch(url: str, params: Dict[str, Any]) -> Response:
+        return await github_async_get(url, params=params)
+
+    async def _harvest(names: List[str]) -> None:
+        try:
+            metas: List[Optional[Dict]]
+            if backend == "graphql":
+                metas = list(await async_graphql_harvest(names))
+            else:
+                metas = [await async_harvest_repo(names[0])]
+            for meta in metas:
+                if meta:
+                    if journal is not None:
+                        journal.record_repo(meta["name"], meta)
+                    await queue.put(meta)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - worker error path
+            logger.error("harvest failed: %s", exc)
+        finally:
+            window.release()
+
+    async def _produce() -> None:
+        tasks: set = set()
+
+        async def _spawn(names: List[str]) -> None:
+            await window.acquire()
+            task = asyncio.create_task(_harvest(names))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        batch: List[str] = []
+        size = graphql_harvest.BATCH_SIZE if backend == "graphql" else 1
+        seen: set = set()
+
+        async def _add(full_name: str, refresh: bool = False) -> None:
+            nonlocal batch
+            recorded = journal.repo(full_name) if journal else None
+            if recorded is None and baseline is not None and not refresh:
+                recorded = _store().get(_cache_key("meta", full_name))
+                if recorded is None and full_name in baseline.repos:
+                    recorded = _carry_forward(full_name, baseline.repos[full_name])
+            if recorded is not None:
+                await queue.put(recorded)
+                return
+            if refresh:
+                _invalidate(full_name)
+            batch.append(full_name)
+            if len(batch) >= size:
+                await _spawn(batch)
+                batch = []
+
+        try:
+            async for repo in search_planner.async_search(
+                queries,
+                min_stars=min_stars,
+                max_pages=max_pages,
+                fetch=_fetch,
+                journal=journal,
+                pushed_since=baseline.since if baseline else None,
+            ):
+                seen.add(repo["full_name"])
+                changed = baseline is not None and baseline.changed(repo)
+                await _add(repo["full_name"], refresh=changed)
+            if baseline is not None:
+                for full_name in baseline.carried(seen, min_stars):
+                    await _add(full_name, refresh=baseline.due(full_name))
+            if batch:
+                await _spawn(batch)
+            await asyncio.gather(*tasks)
+        except BaseException as exc:
+            for task in tasks:
+                task.cancel()
+            if not isinstance(exc, asyncio.CancelledError):
+                await queue.put(exc)
+            raise
+        await queue.put(done)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def async_search_and_harvest(
+    min_stars: int = 0,
+    max_pages: int | None = 1,
+    backend: str | None = None,
+    journal: run_journal.RunJournal | None = None,
+    baseline: Baseline | None = None,
+) -> List[Dict]:
+    """Return every record from :func:`async_iter_search_and_harvest`."""
+    return [
+        meta
+        async for meta in async_iter_search_and_harvest(
+            min_stars, max_pages, backend, journal, baseline
+        )
+    ]
+
+
+def _load_baseline(incremental: bool) -> Baseline | None:
+    if not incremental:
+        return None
+    baseline = load_baseline()
+    if baseline is None:
+        logger.info("no snapshot found; running a full harvest")
+    return baseline
+
+
+def _open_journal(
+    min_stars: int,
+    max_pages: int | None,
+    backend: str | None,
+    resume: bool,
+    baseline: Baseline | None = None,
+) -> run_journal.RunJournal:
+    params = {
+        "min_stars": min_stars,
+        "max_pages": max_pages,
+        "backend": backend or HARVEST_BACKEND,
+        "queries": list(SEARCH_TERMS) + [f"topic:{t}" for t in TOPIC_FILTERS],
+        "since": str(baseline.since) if baseline else None,
+    }
+    return run_journal.open_journal("harvest", params, resume=resume)
+
+
+def _log_stats() -> None:
+    logger.info("http-pool", **github_client().stats())
+    stats = http_cache_stats()
+    if stats is not None:
+        logger.info("http-cache", **stats)
+    logger.info("rate-budget", budgets=github_scheduler().metrics())
+
+
+def search_and_harvest(
+    min_stars: int = 0,
+    max_pages: int | None = 1,
+    backend: str | None = None,
+    resume: bool = False,
+    incremental: bool = False,
+) -> List[Dict]:
+    """Search GitHub and harvest metadata using the ``rest`` or ``graphql`` backend.
+
+    ``backend`` defaults to the ``HARVEST_BACKEND`` environment variable.
+    Progress is journaled under ``state/``; with ``resume`` an interrupted
+    run with the same parameters continues from its last checkpoint. With
+    ``incremental`` only repos changed since the newest ``data/history``
+    snapshot are re-harvested.
+    """
     start = time.perf_counter()
-    results = asyncio.run(async_search_and_harvest(min_stars, max_pages))
+    baseline = _load_baseline(incremental)
+    journal = _open_journal(min_stars, max_pages, backend, resume, baseline)
+    try:
+        results = asyncio.run(
+            async_search_and_harvest(min_stars, max_pages, backend, journal, baseline)
+        )
+    finally:
+        journal.close()
+    journal.complete()
     logger.info("search_and_harvest completed in %.2fs", time.perf_counter() - start)
+    _log_stats()
     return results
+
+
+def stream_search_and_harvest(
+    sink: Callable[[Dict], None],
+    min_stars: int = 0,
+    max_pages: int | None = 1,
+    backend: str | None = None,
+    resume: bool = False,
+    incremental: bool = False,
+) -> int:
+    """Pass each harvested record to ``sink`` as it arrives.
+
+    Records are never collected in memory; return how many were produced.
+    ``resume`` and ``incremental`` work as in :func:`search_and_harvest`.
+    """
+
+    async def _consume() -> int:
+        count = 0
+        async for meta in async_iter_search_and_harvest(
+            min_stars, max_pages, backend, journal, baseline
+        ):
+            sink(meta)
+            count += 1
+        return count
+
+    start = time.perf_counter()
+    baseline = _load_baseline(incremental)
+    journal = _open_journal(min_stars, max_pages, backend, resume, baseline)
+    try:
+        count = asyncio.run(_consume())
+    finally:
+        journal.close()
+    journal.complete()
+    logger.info(
+        "stream_search_and_harvest produced %s repos in %.2fs",
+        count,
+        time.perf_counter() - start,
+    )
+    _log_stats()
+    return count
@@ -15,7 +15,14 @@ main = rank_main
 @click.command(help="Rank repositories")
 @click.argument("path", default="data/repos.json")
 @config_option
-def _cli(path: str, config: str | None) -> None:
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Score and categorize large repo sets in this many processes",
+)
+def _cli(path: str, config: str | None, workers: int) -> None:
     """Wrapper for the ranking CLI."""
     try:
         cfg = load_config(config)
@@ -23,7 +30,7 @@ def _cli(path: str, config: str | None) -> None:
         click.echo(f"Config error: {exc}", err=True)
         raise SystemExit(1)
 
-    main(path, config=cfg)
+    main(path, config=cfg, workers=workers)
 
 
 def cli(argv: list[str] | None = None) -> None:
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import csv
+import heapq
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 from jinja2 import Template
 
 from agentic_index_cli.constants import SCORE_KEY
+from agentic_index_cli.internal import json_codec
 
 
 def save_csv(repos: List[Dict], path: Path) -> None:
@@ -47,6 +49,64 @@ def save_markdown(repos: List[Dict], path: Path) -> None:
     path.write_text(tmpl.render(rows=rows))
 
 
+class JsonlSink:
+    """Append records to ``path`` as JSON Lines, one flushed line each.
+
+    Lines written before a crash stay readable with :func:`load_jsonl`.
+    """
+
+    def __init__(self, path: Path, *, append: bool = False) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._fh = path.open("a" if append else "w")
+
+    def write(self, record: Dict) -> None:
+        self._fh.write(json_codec.dumps(record, compact=True) + "\n")
+        self._fh.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_jsonl(path: Path) -> Iterator[Dict]:
+    """Yield records from a JSON Lines file, skipping a truncated last line."""
+    with path.open() as f:
+        for line in f:
+            try:
+                yield json_codec.loads(line)
+            except ValueError:
+                continue
+
+
+class TopN:
+    """Keep the ``limit`` highest-scoring records seen so far."""
+
+    def __init__(self, limit: int = 100) -> None:
+        self.limit = limit
+        self._heap: List[Tuple[float, int, Dict]] = []
+        self._seq = 0
+
+    def add(self, record: Dict) -> None:
+        # ties keep the earlier record, matching a stable descending sort
+        entry = (record[SCORE_KEY], -self._seq, record)
+        self._seq += 1
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heappushpop(self._heap, entry)
+
+    def items(self) -> List[Dict]:
+        return [r for _, _, r in sorted(self._heap, reverse=True)]
+
+
 def load_previous(path: Path) -> List[str]:
     """Load previously ranked repository names from ``path``."""
     if not path.exists():
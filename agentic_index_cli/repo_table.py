@@ -0,0 +1,215 @@
+"""Columnar in-memory view of repository records shared between stages."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from .validate import load_repos, save_repos
+
+
+class _Store:
+    """Records plus lazily extracted columns, shared by a table and its views."""
+
+    def __init__(self, records: List[dict]) -> None:
+        self.records = records
+        self.columns: Dict[tuple, np.ndarray] = {}
+
+    def column(
+        self, field: str, default: Any, dtype: Any, coerce: bool = False
+    ) -> np.ndarray:
+        key = (field, default, dtype, coerce)
+        if key not in self.columns:
+            values = [repo.get(field, default) for repo in self.records]
+            if coerce:
+                values = [v if isinstance(v, (int, float)) else None for v in values]
+            if dtype is object:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            else:
+                column = np.array(values, dtype=dtype)
+            column.flags.writeable = False
+            self.columns[key] = column
+        return self.columns[key]
+
+    def invalidate(self, field: Optional[str] = None) -> None:
+        if field is None:
+            self.columns.clear()
+            return
+        for key in [k for k in self.columns if k[0] == field]:
+            del self.columns[key]
+
+
+class RepoTable:
+    """Repository records with cached typed columns and zero-copy views.
+
+    A table wraps the list of repo dicts produced by
+    :func:`~agentic_index_cli.validate.load_repos`. Each field is extracted
+    once into a NumPy column (``float64`` for :meth:`column`, ``object`` for
+    :meth:`values`) that all views of the table share. :meth:`where`,
+    :meth:`sort_by` and :meth:`head` return views holding only an index
+    array into the same records, so stages can hand a table to each other
+    without copying or re-serializing it. Iterating yields the underlying
+    dicts; edits made through :meth:`set` keep the columns in sync, other
+    in-place edits need :meth:`invalidate`.
+    """
+
+    def __init__(
+        self, records: Iterable[dict] = (), *, _store=None, _rows=None
+    ) -> None:
+        self._store = _store if _store is not None else _Store(list(records))
+        if _rows is None:
+            _rows = np.arange(len(self._store.records), dtype=np.intp)
+        self._rows = _rows
+
+    # -- construction and persistence ---------------------------------------
+
+    @classmethod
+    def load(cls, path: Path, **kwargs: Any) -> "RepoTable":
+        """Load and validate a v3 ``repos.json`` file."""
+        return cls(load_repos(Path(path), **kwargs))
+
+    def save(self, path: Path, **kwargs: Any) -> None:
+        """Write the rows of this view to ``path`` in the v3 schema."""
+        save_repos(Path(path), self.to_list(), **kwargs)
+
+    @classmethod
+    def coerce(cls, repos: Union["RepoTable", Iterable[dict]]) -> "RepoTable":
+        """Return ``repos`` as a table without copying an existing one."""
+        return repos if isinstance(repos, cls) else cls(repos)
+
+    def _view(self, rows: np.ndarray) -> "RepoTable":
+        return type(self)(_store=self._store, _rows=rows)
+
+    # -- sequence protocol ---------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[dict]:
+        records = self._store.records
+        return (records[i] for i in self._rows.tolist())
+
+    @overload
+    def __getitem__(self, index: int) -> dict: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RepoTable": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(self._rows[index])
+        return self._store.records[self._rows[index]]
+
+    def __repr__(self) -> str:
+        return f"<RepoTable {len(self)} of {len(self._store.records)} repos>"
+
+    def to_list(self) -> List[dict]:
+        """Return the rows of this view as a list of the underlying dicts."""
+        records = self._store.records
+        return [records[i] for i in self._rows.tolist()]
+
+    # -- columns -------------------------------------------------------------
+
+    def column(
+        self, field: str, default: float = np.nan, *, coerce: bool = False
+    ) -> np.ndarray:
+        """Return ``field`` as ``float64``; ``None`` and missing become NaN.
+
+        Missing fields use ``default`` instead. Raises ``ValueError`` or
+        ``TypeError`` if a value is not numeric, unless ``coerce`` is set,
+        which turns such values into NaN.
+        """
+        return self._store.column(field, default, float, coerce)[self._rows]
+
+    def values(self, field: str, default: Any = None) -> np.ndarray:
+        """Return ``field`` as an ``object`` array."""
+        return self._store.column(field, default, object)[self._rows]
+
+    def set(self, field: str, values: Sequence[Any]) -> None:
+        """Assign ``values`` to ``field`` of each row in this view."""
+        if len(values) != len(self):
+            raise ValueError(f"expected {len(self)} values, got {len(values)}")
+        for repo, value in zip(self, values):
+            repo[field] = value
+        self._store.invalidate(field)
+
+    def invalidate(self, field: Optional[str] = None) -> None:
+        """Drop cached columns after editing records in place."""
+        self._store.invalidate(field)
+
+    # -- views ---------------------------------------------------------------
+
+    def where(
+        self,
+        field_or_mask: Union[str, np.ndarray, Callable[[dict], bool]],
+        value: Any = None,
+    ) -> "RepoTable":
+        """Return rows where ``field == value``, or a mask or predicate holds."""
+        if isinstance(field_or_mask, str):
+            mask = self.values(field_or_mask) == value
+        elif callable(field_or_mask):
+            mask = np.fromiter(
+                (bool(field_or_mask(repo)) for repo in self), bool, len(self)
+            )
+        else:
+            mask = np.asarray(field_or_mask, dtype=bool)
+        return self._view(self._rows[mask])
+
+    def category(self, name: str) -> "RepoTable":
+        """Return the rows whose ``category`` is ``name``."""
+        return self.where("category", name)
+
+    def sort_by(
+        self,
+        field: str,
+        *,
+        reverse: bool = False,
+        default: Any = 0,
+        key: Optional[Callable[[Any], Any]] = None,
+    ) -> "RepoTable":
+        """Return a view sorted by ``field``, keeping ties in their order.
+
+        Numeric fields are sorted with a stable ``argsort`` (NaN last);
+        anything else, or a ``key`` function, falls back to :func:`sorted` and
+        matches ``list.sort(key=..., reverse=...)`` exactly.
+        """
+        if key is None:
+            try:
+                column = self.column(field, default=default)
+            except (TypeError, ValueError):
+                pass
+            else:
+                order = np.argsort(-column if reverse else column, kind="stable")
+                return self._view(self._rows[order])
+            key = _identity
+        values = self.values(field, default=default)
+        order = sorted(
+            range(len(values)), key=lambda i: key(values[i]), reverse=reverse
+        )
+        return self._view(self._rows[np.asarray(order, dtype=np.intp)])
+
+    def head(self, n: int) -> "RepoTable":
+        """Return the first ``n`` rows."""
+        return self._view(self._rows[:n])
+
+    def categories(self) -> List[str]:
+        """Return the sorted distinct non-empty categories."""
+        return sorted({c for c in self.values("category").tolist() if c})
+
+
+def _identity(value: Any) -> Any:
+    return value
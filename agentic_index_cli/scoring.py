@@ -11,6 +11,7 @@ from typing import Dict, List, Optional
 import structlog
 
 from agentic_index_cli.constants import SCORE_KEY
+from agentic_index_cli.internal.classifier import default_classifier
 
 logger = structlog.get_logger(__name__).bind(file=__file__)
 
@@ -78,18 +79,8 @@ def ecosystem_integration(topics: List[str], readme: str) -> float:
 
 def categorize(description: str, topics: List[str]) -> str:
     """Return a coarse category for a project."""
-    text = (description or "").lower() + " " + " ".join(topics).lower()
-    if "rag" in text or "retrieval" in text:
-        return "RAG-centric"
-    if "multi-agent" in text or "crew" in text or "team" in text:
-        return "Multi-Agent"
-    if "dev" in text or "tool" in text or "test" in text:
-        return "DevTools"
-    if any(domain in text for domain in ["video", "game", "finance", "security"]):
-        return "Domain-Specific"
-    if "experimental" in text or "research" in text:
-        return "Experimental"
-    return "General-purpose"
+    text = (description or "") + " " + " ".join(topics)
+    return default_classifier().classify(text, "topic_category")
 
 
 def compute_score(repo: Dict, readme: str) -> float:
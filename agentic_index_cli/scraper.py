@@ -22,10 +22,23 @@ def main(argv: Optional[List[str]] = None) -> None:
         default=Path("data/repos.json"),
         help="Output file path",
     )
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue an interrupted run"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-score repos changed since the last snapshot",
+    )
     args = parser.parse_args(argv)
 
     token = os.getenv("GITHUB_TOKEN")
-    repos = scrape_mod.scrape(min_stars=args.min_stars, token=token)
+    repos = scrape_mod.scrape(
+        min_stars=args.min_stars,
+        token=token,
+        resume=args.resume,
+        incremental=args.incremental,
+    )
     path = args.output
     path.parent.mkdir(parents=True, exist_ok=True)
     scrape_mod.save_repos(path, repos)
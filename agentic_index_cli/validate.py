@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import os
+import random
 import sys
+import typing
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
+from .internal import history_store, json_codec
 from .internal.json_utils import load_json
 
+logger = logging.getLogger(__name__)
+
+VALIDATION_MODES = ("full", "sampled", "hash", "off")
+SAMPLE_SIZE = 50
+# anchored to the checkout, not the working directory of the caller
+VALIDATED_HASHES = (
+    Path(__file__).resolve().parents[1] / "state" / "validated_hashes.json"
+)
+MAX_VALIDATED_HASHES = 256
+
 
 class License(BaseModel):
     """Model for the ``license`` block."""
@@ -77,6 +93,22 @@ class RepoFile(BaseModel):
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
+_REPO_LIST = TypeAdapter(List[Repo])
+# (output name, accepted input names, coerce ints to float)
+_FIELDS: List[Tuple[str, Tuple[str, ...], bool]] = [
+    (
+        name,
+        (name,) if field.alias is None else (field.alias, name),
+        float in typing.get_args(field.annotation),
+    )
+    for name, field in Repo.model_fields.items()
+]
+_KNOWN_KEYS = frozenset(key for _, keys, _ in _FIELDS for key in keys)
+_SCHEMA_FINGERPRINT = hashlib.sha256(
+    json.dumps(RepoFile.model_json_schema(), sort_keys=True).encode()
+).hexdigest()
+
+
 def _migrate_item(item: dict) -> dict:
     item = dict(item)
     if "AgentOpsScore" in item:
@@ -86,11 +118,151 @@ def _migrate_item(item: dict) -> dict:
     return item
 
 
+def _trusted_item(item: dict) -> dict:
+    """Return migrated ``item`` shaped like ``Repo(**item).model_dump(...)``.
+
+    Only field order, aliases, ``None`` values and int-to-float coercion are
+    handled; other values are returned as stored. Unknown keys are skipped
+    here and rejected by :func:`_reject_unknown`.
+    """
+    out = {}
+    for name, keys, is_float in _FIELDS:
+        value = None
+        for key in keys:
+            value = item.get(key)
+            if value is not None:
+                break
+        if value is None:
+            continue
+        if is_float and type(value) is int:
+            value = float(value)
+        elif name == "owner" and isinstance(value, dict):
+            login = value.get("login")
+            value = {} if login is None else {"login": login}
+        out[name] = value
+    return out
+
+
+def _reject_unknown(items: List[dict]) -> None:
+    """Raise like :class:`Repo` does if an item has a key it does not define."""
+    errors: List[Any] = [
+        {"type": "extra_forbidden", "loc": (i, key), "input": item[key]}
+        for i, item in enumerate(items)
+        for key in item.keys() - _KNOWN_KEYS
+    ]
+    if errors:
+        raise ValidationError.from_exception_data("list[Repo]", errors)
+
+
+def _same(trusted: List[dict], validated: List[dict]) -> bool:
+    # compared as JSON so that e.g. ``1`` and ``True`` differ
+    return json.dumps(trusted) == json.dumps(validated)
+
+
+def _validation_mode(validation: Optional[str]) -> str:
+    mode = validation or os.getenv("REPOS_VALIDATION") or "full"
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"unknown validation mode {mode!r}; expected one of {VALIDATION_MODES}"
+        )
+    return mode
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(_SCHEMA_FINGERPRINT.encode() + data).hexdigest()
+
+
+def _validated_hashes() -> List[str]:
+    try:
+        return json.loads(VALIDATED_HASHES.read_text())
+    except (OSError, ValueError):
+        return []
+
+
+def _is_validated(digest: str) -> bool:
+    return digest in _validated_hashes()
+
+
+def _mark_validated(digest: str) -> None:
+    hashes = [h for h in _validated_hashes() if h != digest]
+    hashes.append(digest)
+    try:
+        VALIDATED_HASHES.parent.mkdir(parents=True, exist_ok=True)
+        VALIDATED_HASHES.write_text(json.dumps(hashes[-MAX_VALIDATED_HASHES:]))
+    except OSError as exc:
+        logger.warning("could not record validated hash: %s", exc)
+
+
+def _validate_items(items: List[Any], mode: str) -> List[dict]:
+    """Return normalised copies of ``items`` checked according to ``mode``."""
+    migrated = [_migrate_item(item) for item in items]
+    if mode == "full":
+        return _full(migrated)
+    _reject_unknown(migrated)
+    trusted = [_trusted_item(item) for item in migrated]
+    if mode == "sampled" and migrated:
+        picks = {0, len(migrated) - 1}
+        count = min(SAMPLE_SIZE, len(migrated))
+        picks.update(random.sample(range(len(migrated)), count))
+        order = sorted(picks)
+        checked = _full([migrated[i] for i in order])
+        if not _same([trusted[i] for i in order], checked):
+            # the file is not stored normalised, so other items may need it too
+            return _full(migrated)
+    return trusted
+
+
+def _full(migrated: List[dict]) -> List[dict]:
+    return _REPO_LIST.dump_python(
+        _REPO_LIST.validate_python(migrated), exclude_none=True
+    )
+
+
 def load_repos(
-    path: Path, *, use_cache: bool = False, use_stream: bool = False
+    path: Path,
+    *,
+    use_cache: bool = False,
+    use_stream: bool = False,
+    validation: Optional[str] = None,
 ) -> List[dict]:
-    """Validate and load repository JSON data."""
-    raw = load_json(path, cache=use_cache, stream=use_stream)
+    """Validate and load repository JSON data.
+
+    ``validation`` selects how much checking is done, defaulting to the
+    ``REPOS_VALIDATION`` environment variable or ``"full"``:
+
+    ``full``
+        validate every item against :class:`Repo`;
+    ``sampled``
+        validate the first, last and :data:`SAMPLE_SIZE` random items, and
+        every item if one of those was not stored in normalised form;
+    ``hash``
+        skip validation if the file content (and schema) was fully validated
+        before and stored in normalised form, otherwise validate fully and
+        remember its hash if it was;
+    ``off``
+        trust the file.
+
+    ``full`` and ``hash`` return exactly what :class:`Repo` validation
+    returns. ``sampled`` and ``off`` apply the field order, alias, ``None``
+    and int-to-float normalisation of :func:`_trusted_item` to unchecked
+    items but do not coerce other types, so they suit files written by
+    :func:`save_repos`. Every mode rejects unknown fields and duplicates.
+    """
+    mode = _validation_mode(validation)
+    digest = None
+    if mode == "hash":
+        data = Path(path).read_bytes()
+        digest = _digest(data)
+        raw = json_codec.loads(data)
+        if _is_validated(digest):
+            mode = "off"
+            digest = None
+        else:
+            mode = "full"
+    else:
+        raw = load_json(path, cache=use_cache, stream=use_stream)
+    if history_store.is_manifest(raw):
+        raw = history_store.HistoryStore(Path(path).parent).expand(raw)
     if isinstance(raw, list):
         items = raw
     elif isinstance(raw, dict):
@@ -102,29 +274,57 @@ def load_repos(
             raise ValidationError('"repos" must be a list')
     else:
         raise ValidationError("Invalid JSON structure")
+    normalised = _validate_items(items, mode)
+    if digest is not None and not _same(
+        [_trusted_item(_migrate_item(item)) for item in items], normalised
+    ):
+        # a later ``hash`` load would skip validation and miss the coercion
+        digest = None
     seen: set[str] = set()
     repos: List[dict] = []
     duplicates: List[str] = []
-    for item in items:
-        item = _migrate_item(item)
-        repo = Repo(**item)
-        name = repo.full_name or repo.name or ""
+    for repo in normalised:
+        name = repo.get("full_name") or repo.get("name") or ""
         if name in seen:
             duplicates.append(name)
             continue
         seen.add(name)
-        repos.append(repo.model_dump(exclude_none=True))
+        repos.append(repo)
     if duplicates:
         dup = ", ".join(duplicates)
         raise ValidationError(f"duplicate entries: {dup}")
+    if digest is not None:
+        _mark_validated(digest)
     return repos
 
 
-def save_repos(path: Path, repos: List[dict]) -> None:
-    """Write validated ``repos`` to ``path``."""
-    repo_objs = [Repo(**_migrate_item(r)) for r in repos]
-    payload = RepoFile(repos=repo_objs).model_dump(exclude_none=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n")
+def _dump_payload(repos: List[dict]) -> str:
+    payload: Dict[str, Any] = {"schema_version": 3, "repos": repos}
+    return json_codec.dumps(payload) + "\n"
+
+
+def save_repos(
+    path: Path, repos: List[dict], *, validation: Optional[str] = None
+) -> None:
+    """Write validated ``repos`` to ``path``.
+
+    ``validation`` works as for :func:`load_repos`. In ``hash`` mode the
+    output is skipped over validation when identical content was validated
+    before; otherwise it is validated and its hash recorded so the next
+    ``hash`` load or save of it is free.
+    """
+    mode = _validation_mode(validation)
+    record = mode == "hash"
+    if record:
+        text = _dump_payload([_trusted_item(_migrate_item(r)) for r in repos])
+        if _is_validated(_digest(text.encode())):
+            path.write_text(text)
+            return
+        mode = "full"
+    text = _dump_payload(_validate_items(repos, mode))
+    path.write_text(text)
+    if record:
+        _mark_validated(_digest(text.encode()))
 
 
 def validate_file(path: str) -> List[dict]:
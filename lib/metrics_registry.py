@@ -2,7 +2,61 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from importlib import metadata
-from typing import Callable, Dict, Iterable, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+
+class RepoColumns:
+    """Column-wise view of a list of repo dicts for batch metrics.
+
+    Columns are extracted on first use and cached, so metrics sharing an
+    input only walk the repo list once.
+    """
+
+    def __init__(self, repos: Sequence[dict]) -> None:
+        self.repos = repos
+        self._cache: Dict[tuple, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.repos)
+
+    def values(self, *keys: str, default: Any = None) -> List[Any]:
+        """Return raw values of the first of ``keys`` present in each repo."""
+        cache_key = ("values", keys, default)
+        if cache_key not in self._cache:
+            values = [repo.get(keys[0], _MISSING) for repo in self.repos]
+            for key in keys[1:]:
+                values = [
+                    repo.get(key, _MISSING) if value is _MISSING else value
+                    for value, repo in zip(values, self.repos)
+                ]
+            self._cache[cache_key] = [
+                default if value is _MISSING else value for value in values
+            ]
+        return self._cache[cache_key]
+
+    def column(self, *keys: str, default: float = np.nan) -> np.ndarray:
+        """Return a float array of the first of ``keys`` present in each repo.
+
+        Repos without any of ``keys`` get ``default``; ``None`` and other
+        values that are not numbers, numeric strings included, become NaN.
+        """
+        cache_key = ("column", keys, default)
+        if cache_key not in self._cache:
+            values = self.values(*keys, default=default)
+            self._cache[cache_key] = np.array(
+                [v if is_number(v) else np.nan for v in values], dtype=float
+            )
+        return self._cache[cache_key]
+
+
+_MISSING = object()
+
+
+def is_number(value: Any) -> bool:
+    """Return whether ``value`` is a real number, ``bool`` included."""
+    return isinstance(value, (int, float, np.integer, np.floating))
 
 
 class MetricProvider(Protocol):
@@ -14,17 +68,37 @@ class MetricProvider(Protocol):
     def score(self, repo: dict) -> float: ...
 
 
+class BatchMetricProvider(MetricProvider, Protocol):
+    """Metric provider that can also score many repos at once.
+
+    ``score_batch`` returns one value per repo in ``columns``; NaN marks a
+    repo the metric could not score. Raising ``NotImplementedError`` falls
+    back to per-repo :meth:`score` calls.
+    """
+
+    def score_batch(self, columns: RepoColumns) -> Sequence[float]: ...
+
+
 @dataclass
 class FunctionMetric:
-    """Simple callable-based metric provider."""
+    """Simple callable-based metric provider.
+
+    ``batch`` optionally computes the metric for a whole :class:`RepoColumns`.
+    """
 
     name: str
     weight: float
     func: Callable[[dict], float]
+    batch: Optional[Callable[[RepoColumns], Sequence[float]]] = None
 
     def score(self, repo: dict) -> float:  # type: ignore[override]
         return self.func(repo)
 
+    def score_batch(self, columns: RepoColumns) -> Sequence[float]:
+        if self.batch is None:
+            raise NotImplementedError(self.name)
+        return self.batch(columns)
+
 
 _REGISTRY: Dict[str, MetricProvider] = {}
 _LOADED = False
@@ -36,6 +110,20 @@ def register(metric: MetricProvider) -> None:
     _REGISTRY[metric.name] = metric
 
 
+def set_metrics(metrics: Iterable[MetricProvider]) -> None:
+    """Replace all registered metrics with ``metrics``, skipping plugins.
+
+    Worker processes use this to score with exactly the parent's metrics,
+    including ones the parent registered at runtime.
+    """
+
+    global _LOADED
+    _REGISTRY.clear()
+    for metric in metrics:
+        register(metric)
+    _LOADED = True
+
+
 def get_metrics() -> Iterable[MetricProvider]:
     """Return all registered metrics, loading plugins if needed."""
 
@@ -8,7 +8,10 @@ A 0.0–1.0 scale.
 from __future__ import annotations
 
 import math
-from typing import Iterable
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+import numpy as np
 
 from agentic_index_cli.scoring import (
     compute_issue_health,
@@ -16,7 +19,7 @@ from agentic_index_cli.scoring import (
     license_freedom,
 )
 
-from .metrics_registry import FunctionMetric, register
+from .metrics_registry import FunctionMetric, RepoColumns, is_number, register
 
 
 def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
@@ -82,13 +85,18 @@ def ecosystem_tag(
 # ---------------------------------------------------------------------------
 
 
+def _missing(value: object) -> bool:
+    """Match the batch columns, where NaN marks a value to derive instead."""
+    return not is_number(value) or math.isnan(value)
+
+
 def _stars_metric(repo: dict) -> float:
     return math.log2(repo.get("stars", repo.get("stargazers_count", 0)) + 1)
 
 
 def _recency_metric(repo: dict) -> float:
     recency = repo.get("recency_factor")
-    if recency is None:
+    if _missing(recency):
         pushed = repo.get("pushed_at", "1970-01-01T00:00:00Z")
         recency = compute_recency_factor(pushed)
     return recency
@@ -96,7 +104,7 @@ def _recency_metric(repo: dict) -> float:
 
 def _issues_metric(repo: dict) -> float:
     issue_health = repo.get("issue_health")
-    if issue_health is None:
+    if _missing(issue_health):
         issue_health = compute_issue_health(
             repo.get("open_issues_count", 0), repo.get("closed_issues", 0)
         )
@@ -109,7 +117,7 @@ def _docs_metric(repo: dict) -> float:
 
 def _license_metric(repo: dict) -> float:
     license_free = repo.get("license_freedom")
-    if license_free is None:
+    if _missing(license_free):
         lic = repo.get("license")
         if isinstance(lic, dict):
             lic = lic.get("spdx_id")
@@ -121,10 +129,97 @@ def _ecosystem_metric(repo: dict) -> float:
     return repo.get("ecosystem_integration", 0.0)
 
 
+# ---------------------------------------------------------------------------
+# Vectorized counterparts; NaN marks repos the per-repo metric would reject
+# ---------------------------------------------------------------------------
+
+
+def _parse_pushed_at(stamps: Sequence[object]) -> np.ndarray:
+    """Return ``datetime64[us]`` values for ``%Y-%m-%dT%H:%M:%SZ`` stamps."""
+    stripped = [
+        stamp[:-1] if isinstance(stamp, str) and stamp[-1:] == "Z" else "NaT"
+        for stamp in stamps
+    ]
+    try:
+        return np.array(stripped, dtype="datetime64[us]")
+    except ValueError:
+        parsed = []
+        for stamp in stripped:
+            try:
+                parsed.append(np.datetime64(stamp, "us"))
+            except ValueError:
+                parsed.append(np.datetime64("NaT", "us"))
+        return np.array(parsed, dtype="datetime64[us]")
+
+
+def recency_factors(stamps: Sequence[object]) -> np.ndarray:
+    """Vectorized :func:`compute_recency_factor` over ``pushed_at`` stamps."""
+    now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "us")
+    days = np.floor((now - _parse_pushed_at(stamps)) / np.timedelta64(1, "D"))
+    with np.errstate(invalid="ignore"):
+        return np.where(
+            days <= 30,
+            1.0,
+            np.where(days >= 365, 0.0, np.maximum(0.0, 1 - (days - 30) / 335)),
+        )
+
+
+def _stars_batch(columns: RepoColumns) -> np.ndarray:
+    stars = columns.column("stars", "stargazers_count", default=0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.log2(stars + 1)
+
+
+def _recency_batch(columns: RepoColumns) -> np.ndarray:
+    recency = columns.column("recency_factor").copy()
+    missing = np.flatnonzero(np.isnan(recency))
+    if missing.size:
+        pushed = columns.values("pushed_at", default="1970-01-01T00:00:00Z")
+        recency[missing] = recency_factors([pushed[i] for i in missing])
+    return recency
+
+
+def _issues_batch(columns: RepoColumns) -> np.ndarray:
+    health = columns.column("issue_health").copy()
+    missing = np.isnan(health)
+    if missing.any():
+        open_issues = columns.column("open_issues_count", default=0.0)[missing]
+        closed = columns.column("closed_issues", default=0.0)[missing]
+        health[missing] = 1 - open_issues / (open_issues + closed + 1e-6)
+    return health
+
+
+def _docs_batch(columns: RepoColumns) -> np.ndarray:
+    return columns.column("doc_completeness", default=0.0)
+
+
+def _license_batch(columns: RepoColumns) -> np.ndarray:
+    free = columns.column("license_freedom").copy()
+    missing = np.flatnonzero(np.isnan(free))
+    if missing.size:
+        licenses = columns.values("license")
+        known: dict = {}
+        for i in missing:
+            lic = licenses[i]
+            if isinstance(lic, dict):
+                lic = lic.get("spdx_id")
+            try:
+                if lic not in known:
+                    known[lic] = license_freedom(lic)
+                free[i] = known[lic]
+            except Exception:
+                pass
+    return free
+
+
+def _ecosystem_batch(columns: RepoColumns) -> np.ndarray:
+    return columns.column("ecosystem_integration", default=0.0)
+
+
 # register built-in metrics
-register(FunctionMetric("stars", 0.30, _stars_metric))
-register(FunctionMetric("recency", 0.25, _recency_metric))
-register(FunctionMetric("issue_health", 0.20, _issues_metric))
-register(FunctionMetric("docs", 0.15, _docs_metric))
-register(FunctionMetric("license", 0.07, _license_metric))
-register(FunctionMetric("ecosystem", 0.03, _ecosystem_metric))
+register(FunctionMetric("stars", 0.30, _stars_metric, _stars_batch))
+register(FunctionMetric("recency", 0.25, _recency_metric, _recency_batch))
+register(FunctionMetric("issue_health", 0.20, _issues_metric, _issues_batch))
+register(FunctionMetric("docs", 0.15, _docs_metric, _docs_batch))
+register(FunctionMetric("license", 0.07, _license_metric, _license_batch))
+register(FunctionMetric("ecosystem", 0.03, _ecosystem_metric, _ecosystem_batch))
@@ -1,6 +1,5 @@
 """Create beautiful, comprehensive trend visualizations for repository data."""
 
-import json
 import math
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +14,9 @@ import numpy as np
 import seaborn as sns
 from matplotlib.patches import Rectangle
 
+from agentic_index_cli.internal.history_index import HistoryIndex
+from agentic_index_cli.internal.history_store import read_snapshot
+
 # Set up beautiful styling
 try:
     plt.style.use("seaborn-v0_8-darkgrid")
@@ -38,35 +40,21 @@ class BeautifulTrendsGenerator:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_snapshots(self) -> Tuple[List[datetime], List[Any]]:
-        """Load and parse all historical snapshots."""
-        files = sorted(self.history_dir.glob("*.json"))
-        dates = []
-        snapshots = []
-
-        for f in files:
-            try:
-                date = datetime.strptime(f.stem, "%Y-%m-%d")
-            except ValueError:
-                continue
-
-            with f.open() as fh:
-                try:
-                    data = json.load(fh)
-                    # Handle different schema formats
-                    if isinstance(data, dict) and "repos" in data:
-                        snap = data["repos"]
-                    elif isinstance(data, list):
-                        snap = data
-                    else:
-                        snap = []
-                except json.JSONDecodeError:
-                    snap = []
-
-            dates.append(date)
-            snapshots.append(snap)
-
-        return dates, snapshots
+    def load_index(self) -> Tuple[List[datetime], HistoryIndex]:
+        """Load the per-repo time series of all historical snapshots."""
+        index = HistoryIndex.build(self.history_dir)
+        dates = [datetime.strptime(day, "%Y-%m-%d") for day in index.dates]
+        return dates, index
+
+    def load_latest_snapshot(self, index: HistoryIndex) -> List[Any]:
+        """Load the full records of the newest snapshot."""
+        try:
+            data = read_snapshot(self.history_dir / f"{index.dates[-1]}.json")
+        except (OSError, ValueError):
+            return []
+        if isinstance(data, dict) and "repos" in data:
+            return data["repos"]
+        return data if isinstance(data, list) else []
 
     def normalize_repo_data(self, repo: Dict) -> Dict:
         """Normalize repository data across different schema versions."""
@@ -87,61 +75,27 @@ class BeautifulTrendsGenerator:
         return normalized
 
     def build_comprehensive_timeseries(
-        self, dates: List[datetime], snapshots: List[Any]
+        self, dates: List[datetime], index: HistoryIndex
     ) -> Dict:
         """Build comprehensive time series data for all metrics."""
-        if not snapshots:
+        if not dates:
             return {}
 
-        # Get all unique repositories across all snapshots
-        all_repos = set()
-        for snap in snapshots:
-            for repo in snap:
-                if isinstance(repo, dict):
-                    norm_repo = self.normalize_repo_data(repo)
-                    all_repos.add(norm_repo["name"])
-
-        # Build time series for each repository
         series_data = {}
-        for repo_name in all_repos:
-            series_data[repo_name] = {
-                "dates": [],
-                "stars": [],
-                "forks": [],
-                "issues": [],
-                "score": [],
-                "language": None,
-                "category": None,
-                "latest_stars": 0,
+        for key, entry in index.repos.items():
+            stars = index.aligned(key, "stars")
+            latest_stars = next((s for s in reversed(stars) if s is not None), 0)
+            series_data[entry.get("name", key)] = {
+                "dates": list(dates),
+                "stars": stars,
+                "forks": index.aligned(key, "forks"),
+                "issues": index.aligned(key, "issues"),
+                "score": index.aligned(key, "score"),
+                "language": entry.get("language", "Unknown"),
+                "category": entry.get("category", "Uncategorized"),
+                "latest_stars": latest_stars,
             }
 
-        # Populate time series data
-        for date, snap in zip(dates, snapshots):
-            repo_lookup = {}
-            for repo in snap:
-                if isinstance(repo, dict):
-                    norm_repo = self.normalize_repo_data(repo)
-                    repo_lookup[norm_repo["name"]] = norm_repo
-
-            for repo_name in all_repos:
-                if repo_name in repo_lookup:
-                    repo = repo_lookup[repo_name]
-                    series_data[repo_name]["dates"].append(date)
-                    series_data[repo_name]["stars"].append(repo["stars"])
-                    series_data[repo_name]["forks"].append(repo["forks"])
-                    series_data[repo_name]["issues"].append(repo["issues"])
-                    series_data[repo_name]["score"].append(repo["score"])
-                    series_data[repo_name]["language"] = repo["language"]
-                    series_data[repo_name]["category"] = repo["category"]
-                    series_data[repo_name]["latest_stars"] = repo["stars"]
-                else:
-                    # Repository not present in this snapshot
-                    series_data[repo_name]["dates"].append(date)
-                    series_data[repo_name]["stars"].append(None)
-                    series_data[repo_name]["forks"].append(None)
-                    series_data[repo_name]["issues"].append(None)
-                    series_data[repo_name]["score"].append(None)
-
         return series_data
 
     def plot_repository_evolution_timeline(self, series_data: Dict, top_n: int = 10):
@@ -488,25 +442,25 @@ class BeautifulTrendsGenerator:
         print("🎨 Generating beautiful trend visualizations...")
 
         # Load historical data
-        dates, snapshots = self.load_snapshots()
+        dates, index = self.load_index()
 
-        if not snapshots:
+        if not dates:
             print("❌ No historical data found. Please check data/history directory.")
             return
 
         print(
-            f"📊 Found {len(snapshots)} historical snapshots from {dates[0].date()} to {dates[-1].date()}"
+            f"📊 Found {len(dates)} historical snapshots from {dates[0].date()} to {dates[-1].date()}"
         )
 
         # Build comprehensive time series
-        series_data = self.build_comprehensive_timeseries(dates, snapshots)
+        series_data = self.build_comprehensive_timeseries(dates, index)
 
         # Generate charts
         print("📈 Creating repository evolution timeline...")
         self.plot_repository_evolution_timeline(series_data)
 
         print("📊 Creating current state dashboard...")
-        latest_snapshot = snapshots[-1] if snapshots else []
+        latest_snapshot = self.load_latest_snapshot(index)
         self.plot_current_state_dashboard(latest_snapshot)
 
         print(f"✅ Beautiful charts generated in {self.output_dir}")
@@ -12,6 +12,8 @@ matplotlib.use("Agg")  # Use non-interactive backend
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 
+from agentic_index_cli.internal.history_store import read_snapshot
+
 # Set up beautiful styling without seaborn
 plt.rcParams.update(
     {
@@ -55,18 +57,17 @@ class TrendsGenerator:
             except ValueError:
                 continue
 
-            with f.open() as fh:
-                try:
-                    data = json.load(fh)
-                    # Handle different schema formats
-                    if isinstance(data, dict) and "repos" in data:
-                        snap = data["repos"]
-                    elif isinstance(data, list):
-                        snap = data
-                    else:
-                        snap = []
-                except json.JSONDecodeError:
+            try:
+                data = read_snapshot(f)
+                # Handle different schema formats
+                if isinstance(data, dict) and "repos" in data:
+                    snap = data["repos"]
+                elif isinstance(data, list):
+                    snap = data
+                else:
                     snap = []
+            except json.JSONDecodeError:
+                snap = []
 
             dates.append(date)
             snapshots.append(snap)
@@ -1,9 +1,10 @@
 """Generate beautiful text-based trend visualizations without matplotlib dependency."""
 
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Dict, List, Tuple
+
+from agentic_index_cli.internal.history_index import HistoryIndex
 
 
 class TextTrendsGenerator:
@@ -18,46 +19,22 @@ class TextTrendsGenerator:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_snapshots(self) -> Tuple[List[datetime], List[Any]]:
-        """Load and parse all historical snapshots."""
-        files = sorted(self.history_dir.glob("*.json"))
-        dates = []
-        snapshots = []
-
-        for f in files:
-            try:
-                date = datetime.strptime(f.stem, "%Y-%m-%d")
-            except ValueError:
-                continue
-
-            with f.open() as fh:
-                try:
-                    data = json.load(fh)
-                    if isinstance(data, dict) and "repos" in data:
-                        snap = data["repos"]
-                    elif isinstance(data, list):
-                        snap = data
-                    else:
-                        snap = []
-                except json.JSONDecodeError:
-                    snap = []
-
-            dates.append(date)
-            snapshots.append(snap)
-
-        return dates, snapshots
-
-    def normalize_repo_data(self, repo: Dict) -> Dict:
-        """Normalize repository data across different schema versions."""
+    def load_index(self) -> Tuple[List[datetime], HistoryIndex]:
+        """Load the per-repo time series of all historical snapshots."""
+        index = HistoryIndex.build(self.history_dir)
+        dates = [datetime.strptime(day, "%Y-%m-%d") for day in index.dates]
+        return dates, index
+
+    def normalize_index_entry(self, entry: Dict) -> Dict:
+        """Normalize a :meth:`HistoryIndex.latest` entry like a repo record."""
         return {
-            "name": repo.get("name", repo.get("full_name", "unknown")),
-            "full_name": repo.get("full_name", repo.get("name", "unknown")),
-            "stars": repo.get("stargazers_count", 0),
-            "forks": repo.get("forks_count", 0),
-            "issues": repo.get("open_issues_count", 0),
-            "score": repo.get("AgenticIndexScore", repo.get("AgentOpsScore", 0)),
-            "language": repo.get("language", "Unknown"),
-            "category": repo.get("category", "Uncategorized"),
+            "name": entry["name"],
+            "stars": entry["stars"] or 0,
+            "forks": entry["forks"] or 0,
+            "issues": entry["issues"] or 0,
+            "score": entry["score"] or 0,
+            "language": entry["language"] or "Unknown",
+            "category": entry["category"] or "Uncategorized",
         }
 
     def create_ascii_bar_chart(
@@ -122,20 +99,20 @@ class TextTrendsGenerator:
 
         return sparkline
 
-    def generate_evolution_report(self, dates: List[datetime], snapshots: List[Any]):
+    def generate_evolution_report(self, dates: List[datetime], index: HistoryIndex):
         """Generate a comprehensive text-based evolution report."""
-        if not snapshots:
+        if not dates:
             return
 
         # Get latest snapshot to identify top repos
-        latest = snapshots[-1]
         latest_repos = {}
+        keys = {}
 
-        for repo in latest:
-            if isinstance(repo, dict):
-                norm_repo = self.normalize_repo_data(repo)
-                if norm_repo["score"] > 0:
-                    latest_repos[norm_repo["name"]] = norm_repo
+        for key, entry in index.latest().items():
+            norm_repo = self.normalize_index_entry(entry)
+            if norm_repo["score"] > 0:
+                latest_repos[norm_repo["name"]] = norm_repo
+                keys[norm_repo["name"]] = key
 
         # Get top 10 repositories by score
         top_repos = sorted(
@@ -145,32 +122,14 @@ class TextTrendsGenerator:
         # Build evolution data
         evolution_data = {}
         for repo_name, _ in top_repos:
+            key = keys[repo_name]
             evolution_data[repo_name] = {
-                "dates": [],
-                "stars": [],
-                "scores": [],
-                "forks": [],
+                "dates": list(dates),
+                "stars": index.aligned(key, "stars"),
+                "scores": index.aligned(key, "score"),
+                "forks": index.aligned(key, "forks"),
             }
 
-        for date, snap in zip(dates, snapshots):
-            snapshot_lookup = {}
-            for repo in snap:
-                if isinstance(repo, dict):
-                    norm_repo = self.normalize_repo_data(repo)
-                    snapshot_lookup[norm_repo["name"]] = norm_repo
-
-            for repo_name in evolution_data.keys():
-                evolution_data[repo_name]["dates"].append(date)
-                if repo_name in snapshot_lookup:
-                    repo_data = snapshot_lookup[repo_name]
-                    evolution_data[repo_name]["stars"].append(repo_data["stars"])
-                    evolution_data[repo_name]["scores"].append(repo_data["score"])
-                    evolution_data[repo_name]["forks"].append(repo_data["forks"])
-                else:
-                    evolution_data[repo_name]["stars"].append(None)
-                    evolution_data[repo_name]["scores"].append(None)
-                    evolution_data[repo_name]["forks"].append(None)
-
         # Generate the report
         report_content = f"""
 🚀 AGENTIC INDEX - BEAUTIFUL TRENDS ANALYSIS
@@ -178,7 +137,7 @@ class TextTrendsGenerator:
 
 📊 OVERVIEW
 {'-'*20}
-Historical snapshots: {len(snapshots)}
+Historical snapshots: {len(dates)}
 Date range: {dates[0].date()} → {dates[-1].date()}
 Total tracked repositories: {len(latest_repos)}
 
@@ -251,14 +210,14 @@ Total tracked repositories: {len(latest_repos)}
 
 🔍 INSIGHTS & OBSERVATIONS
 {'-'*40}
-• Data spans {(dates[-1] - dates[0]).days} days across {len(snapshots)} snapshots
+• Data spans {(dates[-1] - dates[0]).days} days across {len(dates)} snapshots
 • Average repository has {sum(r['stars'] for r in all_repos)/len(all_repos):,.0f} stars
 • Most active category: {max(categories.items(), key=lambda x: x[1])[0]}
 • Most popular language: {max(languages.items(), key=lambda x: x[1])[0] if languages else 'N/A'}
 
 📋 DATA RETENTION RECOMMENDATION
 {'-'*40}
-⚠️  Currently only {len(snapshots)} snapshots available
+⚠️  Currently only {len(dates)} snapshots available
 ✅ Increased retention to 365 days in config.yaml
 🔄 Future data collection will provide richer trend analysis
 
@@ -272,26 +231,40 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
         return report_content, report_path
 
-    def generate_csv_export(self, dates: List[datetime], snapshots: List[Any]):
-        """Generate CSV exports for external visualization tools."""
-        if not snapshots:
+    def generate_csv_export(self, dates: List[datetime], index: HistoryIndex):
+        """Generate CSV exports for external visualization tools.
+
+        Language and category come from each repository's newest snapshot.
+        """
+        if not dates:
             return
 
+        rows = []
+        for key, entry in index.repos.items():
+            language = entry.get("language") or "Unknown"
+            category = entry.get("category") or "Uncategorized"
+            for point in index.points(key):
+                if (point["score"] or 0) > 0:
+                    rows.append(
+                        (
+                            point["date"],
+                            entry.get("name", key),
+                            point["stars"] or 0,
+                            point["forks"] or 0,
+                            point["issues"] or 0,
+                            point["score"],
+                            language,
+                            category,
+                        )
+                    )
+        rows.sort(key=lambda row: row[0])
+
         csv_path = self.output_dir / "repository_trends.csv"
 
         with open(csv_path, "w") as f:
             f.write("date,repository,stars,forks,issues,score,language,category\n")
-
-            for date, snap in zip(dates, snapshots):
-                for repo in snap:
-                    if isinstance(repo, dict):
-                        norm_repo = self.normalize_repo_data(repo)
-                        if norm_repo["score"] > 0:
-                            f.write(
-                                f"{date.date()},{norm_repo['name']},{norm_repo['stars']},"
-                                f"{norm_repo['forks']},{norm_repo['issues']},{norm_repo['score']},"
-                                f"{norm_repo['language']},{norm_repo['category']}\n"
-                            )
+            for row in rows:
+                f.write(",".join(str(value) for value in row) + "\n")
 
         print(f"📊 CSV export generated: {csv_path}")
 
@@ -299,21 +272,21 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """Generate all text-based trend visualizations."""
         print("🎨 Generating beautiful text-based trend visualizations...")
 
-        dates, snapshots = self.load_snapshots()
+        dates, index = self.load_index()
 
-        if not snapshots:
+        if not dates:
             print("❌ No historical data found. Please check data/history directory.")
             return
 
         print(
-            f"📊 Found {len(snapshots)} historical snapshots from {dates[0].date()} to {dates[-1].date()}"
+            f"📊 Found {len(dates)} historical snapshots from {dates[0].date()} to {dates[-1].date()}"
         )
 
         # Generate comprehensive report
-        report_content, report_path = self.generate_evolution_report(dates, snapshots)
+        report_content, report_path = self.generate_evolution_report(dates, index)
 
         # Generate CSV export
-        self.generate_csv_export(dates, snapshots)
+        self.generate_csv_export(dates, index)
 
         print("\n✅ Beautiful trend visualizations generated!")
         print(f"📊 Main report: {report_path}")
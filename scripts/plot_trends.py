@@ -9,6 +9,9 @@ import matplotlib
 matplotlib.use("Agg")  # Use non-interactive backend
 import matplotlib.pyplot as plt
 
+from agentic_index_cli.internal.history_index import HistoryIndex
+from agentic_index_cli.internal.history_store import read_snapshot
+
 
 def load_snapshots(history_dir: Path):
     """Return parsed snapshot data and corresponding dates."""
@@ -21,11 +24,10 @@ def load_snapshots(history_dir: Path):
         except ValueError:
             # skip files that don't match date pattern
             continue
-        with f.open() as fh:
-            try:
-                snap = json.load(fh)
-            except json.JSONDecodeError:
-                snap = []
+        try:
+            snap = read_snapshot(f)
+        except json.JSONDecodeError:
+            snap = []
         dates.append(date)
         snapshots.append(snap)
     return dates, snapshots
@@ -60,6 +62,19 @@ def build_timeseries(dates, snapshots):
     return series, repos
 
 
+def index_timeseries(index: HistoryIndex, top_n: int = 5):
+    """Return score series for the top repositories from a history index."""
+    latest = index.latest()
+    top = sorted(
+        latest,
+        key=lambda k: latest[k]["score"] if latest[k]["score"] is not None else -1,
+        reverse=True,
+    )[:top_n]
+    repos = [latest[key]["name"] for key in top]
+    series = {latest[key]["name"]: index.aligned(key, "score") for key in top}
+    return series, repos
+
+
 def plot(series, dates, output: Path):
     """Render a line plot for ``series`` and save to ``output``."""
     if not series:
@@ -78,9 +93,9 @@ def plot(series, dates, output: Path):
 
 def main():
     """CLI wrapper for generating the trend graph."""
-    history_dir = Path("data/history")
-    dates, snapshots = load_snapshots(history_dir)
-    series, _ = build_timeseries(dates, snapshots)
+    index = HistoryIndex.build(Path("data/history"))
+    dates = [datetime.strptime(day, "%Y-%m-%d") for day in index.dates]
+    series, _ = index_timeseries(index)
     plot(series, dates, Path("docs/trends/top5_scores.png"))
 
 
@@ -36,11 +36,10 @@ def refresh(category: str, out_dir: Path) -> None:
     data_path = out_dir / "repos.json"
     data_path.write_text(json.dumps({"repos": repos}, indent=2) + "\n")
 
-    enrich(data_path)
-    rank(str(data_path))
+    ranked = rank(str(data_path), table=enrich(data_path))
 
     by_cat = out_dir / "by_category"
-    inj.write_category_readme(category, force=True, repos_path=data_path)
+    inj.write_category_readme(category, force=True, repos_path=data_path, table=ranked)
 
     index_file = by_cat / "index.json"
     try:
@@ -16,7 +16,8 @@ from typing import Any, Dict, List
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from agentic_index_cli.internal import http_utils
+from agentic_index_cli.internal import http_utils, json_codec
+from agentic_index_cli.internal.history_store import HistoryStore
 from agentic_index_cli.validate import save_repos
 
 logger = logging.getLogger(__name__)
@@ -227,7 +228,7 @@ def main(argv: List[str] | None = None) -> None:
     hist_dir.mkdir(parents=True, exist_ok=True)
     today = _dt.date.today().isoformat()
     snapshot_path = hist_dir / f"{today}.json"
-    save_repos(snapshot_path, repos)
+    HistoryStore(hist_dir).put(snapshot_path, json_codec.read(out_path))
     (out_path.parent / "last_snapshot.txt").write_text(str(snapshot_path))
     logger.info("Saved snapshot to %s", snapshot_path)
 
@@ -96,3 +96,31 @@ def data_fixture_dir() -> Path:
     if not path.exists():
         pytest.xfail("Data fixtures missing")
     return path
+
+
+@pytest.fixture(autouse=True)
+def _isolated_run_journal(monkeypatch, tmp_path):
+    """Keep scrape run journals out of the working tree."""
+    from agentic_index_cli.internal import run_journal
+
+    monkeypatch.setattr(run_journal, "STATE_DIR", tmp_path / "state")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_validated_hashes(monkeypatch, tmp_path):
+    """Keep the validated-hash ledger out of the working tree."""
+    from agentic_index_cli import validate
+
+    monkeypatch.setattr(
+        validate, "VALIDATED_HASHES", tmp_path / "state" / "validated_hashes.json"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(monkeypatch, tmp_path):
+    """Keep the harvest and conditional request caches out of the working tree."""
+    from agentic_index_cli import github_client, network
+
+    monkeypatch.setattr(network, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(github_client, "HTTP_CACHE_DIR", tmp_path / "http_cache")
+    monkeypatch.setattr(github_client, "_http_cache", None)
@@ -125,7 +125,9 @@ def test_search_topics_duplicate(monkeypatch):
     monkeypatch.setattr(ai, "SEARCH_TERMS", [])
     monkeypatch.setattr(ai, "TOPIC_FILTERS", ["topic"])
 
-    async def fake_async_search(min_stars=0, max_pages=1):
+    async def fake_async_search(
+        min_stars=0, max_pages=1, backend=None, journal=None, baseline=None
+    ):
         return [{"name": "dupe"}]
 
     monkeypatch.setattr(ai, "async_search_and_harvest", fake_async_search)
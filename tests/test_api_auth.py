@@ -45,10 +45,12 @@ def test_auth_valid(monkeypatch, tmp_path, mode):
     dummy = types.SimpleNamespace(main=lambda *a, **k: None)
     monkeypatch.setitem(sys.modules, "agentic_index_cli.generate_outputs", dummy)
     monkeypatch.setattr(mod.issue_logger, "create_issue", lambda *a, **k: {})
+    monkeypatch.setattr(mod.jobs, "state_dir", tmp_path / "jobs")
     client = TestClient(app)
-    for path in ["/sync", "/score", "/render"]:
+    for path, status in [("/sync", 202), ("/score", 200), ("/render", 202)]:
         resp = client.post(path, headers=headers)
-        assert resp.status_code == 200
+        assert resp.status_code == status
+    mod.jobs.shutdown()  # finish the queued jobs while the fakes are in place
     resp = client.post("/issue", json={"repo": "o/r", "title": "t"}, headers=headers)
     assert resp.status_code == 200
 
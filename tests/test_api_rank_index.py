@@ -0,0 +1,90 @@
+import json
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_index_api.snapshot import SnapshotManager
+
+
+def _write(path, repos, mtime):
+    path.write_text(json.dumps({"schema_version": 3, "repos": repos}))
+    os.utime(path, (mtime, mtime))
+
+
+def _repo(name, score, category):
+    return {
+        "name": name,
+        "full_name": f"o/{name}",
+        "AgenticIndexScore": score,
+        "category": category,
+    }
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    try:
+        from agentic_index_api import main as api_main
+    except Exception as exc:  # pragma: no cover - optional deps
+        pytest.skip(f"Could not load API main module: {exc}")
+    manager = SnapshotManager(tmp_path / "repos.json", interval=0.0)
+    monkeypatch.setattr(api_main, "manager", manager)
+    monkeypatch.setattr(api_main, "DATA_FILE", manager.data_file)
+    yield api_main
+    manager.stop()
+
+
+def test_ranks_and_percentiles(api):
+    repos = [
+        _repo("a", 1.0, "RAG-centric"),
+        _repo("b", 3.0, "DevTools"),
+        _repo("c", 2.0, "RAG-centric"),
+        _repo("d", 0.5, "RAG-centric"),
+    ]
+    _write(api.DATA_FILE, repos, 1_000_000)
+    client = TestClient(api.app)
+    data = client.get("/repo/a").json()
+    assert (data["rank"], data["category_rank"]) == (3, 2)
+    assert data["percentile"] == 25.0
+    assert data["category_percentile"] == pytest.approx(33.33)
+    assert client.get("/repo/b").json()["category_rank"] == 1
+
+    before = api.current_snapshot()
+    _write(api.DATA_FILE, repos + [_repo("e", 9.0, "RAG-centric")], 2_000_000)
+    data = client.get("/repo/a").json()
+    assert (data["rank"], data["category_rank"]) == (4, 3)
+    assert api.current_snapshot() is not before
+    assert api.REPOS is api.current_snapshot().repos
+    assert before.position(before.name_map["a"]) == (3, 2)
+
+
+def test_position_survives_in_place_edits(api):
+    _write(api.DATA_FILE, [_repo("a", 1.0, "x"), _repo("b", 2.0, "x")], 1_000_000)
+    snapshot = api.current_snapshot()
+    snapshot.ranked.reverse()
+    assert snapshot.position(snapshot.name_map["a"]) == (1, 1)
+
+
+def test_status_and_background_reload(api):
+    _write(api.DATA_FILE, [_repo("a", 1.0, "x")], 1_000_000)
+    assert api.manager.status() == {"loaded": False, "watching": False}
+    with TestClient(api.app) as client:
+        assert api.manager.running
+        first = api.current_snapshot()
+        status = client.get("/status").json()["snapshot"]
+        assert status["loaded"] and status["watching"]
+        assert (status["version"], status["repos"]) == (1, 1)
+        assert status["build_seconds"] >= 0
+        assert status["age_seconds"] >= 0
+
+        _write(api.DATA_FILE, [_repo("a", 1.0, "x"), _repo("b", 2.0, "x")], 2_000_000)
+        for _ in range(200):
+            if api.current_snapshot() is not first:
+                break
+            time.sleep(0.01)
+        assert client.get("/repo/a").json()["rank"] == 2
+        assert client.get("/status").json()["snapshot"]["version"] == 2
+        # the old view is untouched by the swap
+        assert [r["name"] for r in first.ranked] == ["a"]
+    assert not api.manager.running
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_index_api.repo_index import SortIndex, decode_cursor, encode_cursor
+from agentic_index_api.snapshot import SnapshotManager
+
+
+def _repo(name, score, stars, category, **extra):
+    return {
+        "name": name,
+        "full_name": f"o/{name}",
+        "AgenticIndexScore": score,
+        "stargazers_count": stars,
+        "category": category,
+        "language": "Python",
+        "license": "MIT",
+        "pushed_at": "2025-06-01T00:00:00Z",
+        "stars_delta": 0,
+        **extra,
+    }
+
+
+REPOS = [
+    _repo("a", 5.0, 5000, "RAG-centric", stars_delta=40),
+    _repo("b", 4.0, 800, "RAG-centric", stars_delta=90),
+    _repo("c", 3.0, 2000, "RAG-centric", stars_delta="+new"),
+    _repo("d", 2.0, 9000, "DevTools", language="Go", stars_delta=10),
+    _repo("e", 1.0, 1500, "RAG-centric", license="Apache-2.0", stars_delta=5),
+    _repo("f", 0.5, 3000, "RAG-centric", pushed_at="2024-01-01T00:00:00Z"),
+]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    try:
+        from agentic_index_api import main as api_main
+    except Exception as exc:  # pragma: no cover - optional deps
+        pytest.skip(f"Could not load API main module: {exc}")
+    path = tmp_path / "repos.json"
+    path.write_text(json.dumps({"schema_version": 3, "repos": REPOS}))
+    monkeypatch.setattr(api_main, "manager", SnapshotManager(path))
+    return TestClient(api_main.app)
+
+
+def _names(data):
+    return [r["name"] for r in data["items"]]
+
+
+def test_filters_sort_and_projection(client):
+    data = client.get(
+        "/repos",
+        params={
+            "category": "RAG-centric",
+            "min_stars": 1000,
+            "sort": "stars_delta",
+            "fields": "name,rank,stargazers_count",
+        },
+    ).json()
+    # "+new" has no numeric delta and sorts last
+    assert _names(data) == ["a", "e", "f", "c"]
+    assert data["items"][0] == {"name": "a", "rank": 1, "stargazers_count": 5000}
+    assert data["next_cursor"] is None
+
+    params = {"license": "mit", "language": "python", "sort": "name", "order": "asc"}
+    assert _names(client.get("/repos", params=params).json()) == ["a", "b", "c", "f"]
+    params = {"pushed_after": "2025-01-01", "min_score": 2, "max_score": 4.5}
+    assert _names(client.get("/repos", params=params).json()) == ["b", "c", "d"]
+    params = {"pushed_before": "2025-01-01"}
+    assert _names(client.get("/repos", params=params).json()) == ["f"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": "score"},
+        {"sort": "stars", "order": "asc"},
+        {"sort": "stars_delta"},
+        {"sort": "stars", "min_stars": 1000, "max_stars": 5000},
+        {"category": "RAG-centric", "sort": "stars_delta", "order": "asc"},
+    ],
+)
+def test_cursor_pages_cover_full_listing(client, params):
+    full = _names(client.get("/repos", params={**params, "limit": 500}).json())
+    seen = []
+    cursor = None
+    while True:
+        query = {**params, "limit": 2, **({"cursor": cursor} if cursor else {})}
+        data = client.get("/repos", params=query).json()
+        assert len(data["items"]) <= 2
+        seen += _names(data)
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == full
+
+
+def test_bad_requests(client):
+    assert client.get("/repos", params={"cursor": "!!"}).status_code == 400
+    other = encode_cursor("stars", "desc", (5, "o/a"))
+    assert client.get("/repos", params={"cursor": other}).status_code == 400
+    assert client.get("/repos", params={"sort": "nope"}).status_code == 422
+    assert client.get("/repos", params={"limit": 0}).status_code == 422
+
+
+def test_sort_index_bounds():
+    index = SortIndex(REPOS, lambda r: r["stargazers_count"])
+    rows = index.scan(descending=False, low=1500, high=3000)
+    assert [r["name"] for _, r in rows] == ["e", "c", "f"]
+    cursor = encode_cursor("stars", "asc", (1500, "o/e"))
+    after = decode_cursor(cursor, "stars", "asc")
+    rows = index.scan(descending=False, after=after, high=3000)
+    assert [r["name"] for _, r in rows] == ["c", "f"]
@@ -2,6 +2,8 @@ import json
 
 from fastapi.testclient import TestClient
 
+import lib.quality_metrics  # noqa: F401  registers the scoring metrics
+from agentic_index_api.scoreboard import Scoreboard
 from agentic_index_cli.internal.scoring import compute_score
 
 from .test_api_auth import load_app
@@ -95,3 +97,76 @@ def test_score_returns_top_five(tmp_path, monkeypatch):
 
     assert len(returned) == 5
     assert returned == expected[:5]
+
+
+def test_score_top_n_and_category(tmp_path, monkeypatch):
+    base = {
+        "open_issues_count": 0,
+        "closed_issues": 10,
+        "pushed_at": "2025-06-01T00:00:00Z",
+        "license": {"spdx_id": "MIT"},
+        "doc_completeness": 0.5,
+    }
+    data = [
+        {**base, "name": "a", "stargazers_count": 1, "category": "RAG-centric"},
+        {**base, "name": "b", "stargazers_count": 1000, "category": "DevTools"},
+        {**base, "name": "c", "stargazers_count": 100, "category": "RAG-centric"},
+        {**base, "name": "d", "stargazers_count": 100, "category": "RAG-centric"},
+    ]
+    client, headers = make_client(monkeypatch, tmp_path, data)
+    resp = client.post("/score", params={"n": 2}, headers=headers)
+    assert resp.json()["top_scores"] == [
+        {"name": "b", "score": compute_score(data[1])},
+        {"name": "c", "score": compute_score(data[2])},
+    ]
+    resp = client.get(
+        "/score", params={"n": 10, "category": "RAG-centric"}, headers=headers
+    )
+    assert [r["name"] for r in resp.json()["top_scores"]] == ["c", "d", "a"]
+    resp = client.get("/score", params={"category": "nope"}, headers=headers)
+    assert resp.json() == {"top_scores": []}
+    assert client.get("/score", params={"n": 0}, headers=headers).status_code == 422
+
+
+def test_score_ignores_legacy_score_of_harvested_record(tmp_path, monkeypatch):
+    from agentic_index_cli import network
+
+    repo = {
+        "stargazers_count": 120,
+        "forks_count": 8,
+        "open_issues_count": 3,
+        "closed_issues": 12,
+        "pushed_at": "2025-06-01T00:00:00Z",
+        "license": {"spdx_id": "MIT"},
+        "description": "agent toolkit",
+        "topics": ["agents"],
+        "owner": {"login": "o"},
+    }
+    record = network._build_meta("o/r", repo, "# r\n\nAn agent toolkit.")
+    client, headers = make_client(monkeypatch, tmp_path, [record])
+    resp = client.get("/score", headers=headers)
+    assert resp.json()["top_scores"] == [
+        {"name": "o/r", "score": compute_score(record)}
+    ]
+    assert compute_score(record) != record["AgenticIndexScore"]
+
+
+def test_scoreboard_scores_every_repo_and_caches_top_lists():
+    calls = []
+
+    def scorer(repos):
+        calls.append([r["name"] for r in repos])
+        return [1.0 if r["name"] == "a" else 5.0 for r in repos]
+
+    board = Scoreboard(
+        [{"name": "a", "AgenticIndexScore": 9.0}, {"name": "b"}, {"name": "c"}],
+        scorer=scorer,
+    )
+    assert calls == [["a", "b", "c"]]
+    assert board.top(1) == [{"name": "b", "score": 5.0}]
+    first = board._top[None]
+    assert board.top(1) and board._top[None] is first
+    assert [r["name"] for r in board.top(5)] == ["b", "c", "a"]
+    whole = board._top[None]
+    assert [r["name"] for r in board.top(9)] == ["b", "c", "a"]
+    assert board._top[None] is whole
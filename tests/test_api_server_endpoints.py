@@ -2,30 +2,45 @@
 
 import importlib
 import sys
+import threading
+import time
 import types
 
 import pytest
 from fastapi.testclient import TestClient
 
+from agentic_index_api.jobs import JobQueue
 
-def load_app(monkeypatch):
+
+def load_app(monkeypatch, tmp_path=None):
     monkeypatch.setenv("API_KEY", "k")
     monkeypatch.setenv("IP_WHITELIST", "")
     try:
         import agentic_index_api.server as srv
 
         module = importlib.reload(srv)
+        if tmp_path is not None:
+            monkeypatch.setattr(module.jobs, "state_dir", tmp_path / "jobs")
         return TestClient(module.app), module
     except Exception as e:
         pytest.skip(f"Could not load API server: {e}")
 
 
+def _finished(client, job_id):
+    for _ in range(500):
+        state = client.get(f"/jobs/{job_id}", headers={"X-API-KEY": "k"}).json()
+        if state["status"] not in ("queued", "running"):
+            return state
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
 def test_sync_endpoint(monkeypatch, tmp_path):
-    client, mod = load_app(monkeypatch)
+    client, mod = load_app(monkeypatch, tmp_path)
 
     called = {}
 
-    def fake_scrape(min_stars=0, token=None):
+    def fake_scrape(min_stars=0, token=None, incremental=False):
         called["min_stars"] = min_stars
         return [{"name": "r"}]
 
@@ -37,20 +52,69 @@ def test_sync_endpoint(monkeypatch, tmp_path):
     monkeypatch.setattr(mod, "save_repos", fake_save)
 
     resp = client.post("/sync", headers={"X-API-KEY": "k"}, json={"min_stars": 1})
-    assert resp.status_code == 200
-    assert resp.json() == {"repos": 1}
+    assert resp.status_code == 202
+    state = _finished(client, resp.json()["job_id"])
+    assert state["status"] == "succeeded"
+    assert state["result"] == {"repos": 1}
+    assert state["params"] == {"min_stars": 1, "incremental": False}
     assert called["min_stars"] == 1
     assert called["repos"] == [{"name": "r"}]
 
+    resp = client.post(
+        "/sync", headers={"X-API-KEY": "k"}, json={"min_stars": 1, "wait": True}
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"repos": 1}
 
-def test_render_endpoint(monkeypatch):
-    client, mod = load_app(monkeypatch)
+
+def test_sync_coalesces_and_reports_progress(monkeypatch, tmp_path):
+    client, mod = load_app(monkeypatch, tmp_path)
+    release = threading.Event()
+    runs = []
+
+    def slow_scrape(min_stars=0, token=None, incremental=False):
+        runs.append(min_stars)
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(mod, "scrape", slow_scrape)
+    monkeypatch.setattr(mod, "save_repos", lambda *a, **k: None)
+    headers = {"X-API-KEY": "k"}
+    first = client.post("/sync", headers=headers, json={}).json()
+    second = client.post("/sync", headers=headers, json={}).json()
+    assert second == {**first, "coalesced": True, "status": second["status"]}
+    state = client.get(f"/jobs/{first['job_id']}", headers=headers).json()
+    assert state["kind"] == "sync"
+    assert {"repos_harvested", "api_budget"} <= set(state["progress"])
+    release.set()
+    assert _finished(client, first["job_id"])["status"] == "succeeded"
+    assert runs == [0]
+    assert (tmp_path / "jobs" / f"{first['job_id']}.json").exists()
+    assert client.get("/jobs/nope", headers=headers).status_code == 404
+    assert client.get(f"/jobs/{first['job_id']}").status_code == 401
+
+
+def test_jobs_survive_restart(tmp_path):
+    queue = JobQueue(tmp_path, workers=1)
+    job, _ = queue.submit("render", {}, lambda: {"status": "ok"})
+    assert queue.wait(job.id, timeout=5)
+    queue.shutdown()
+    assert JobQueue(tmp_path).get(job.id)["result"] == {"status": "ok"}
+
+    stuck = tmp_path / "abc.json"
+    stuck.write_text('{"id": "abc", "status": "running"}')
+    assert JobQueue(tmp_path).get("abc")["status"] == "failed"
+
+
+def test_render_endpoint(monkeypatch, tmp_path):
+    client, mod = load_app(monkeypatch, tmp_path)
 
     called = {}
     dummy = types.SimpleNamespace(main=lambda: called.setdefault("ran", True))
     monkeypatch.setitem(sys.modules, "agentic_index_cli.generate_outputs", dummy)
 
     resp = client.post("/render", headers={"X-API-KEY": "k"})
-    assert resp.status_code == 200
-    assert resp.json() == {"status": "ok"}
+    assert resp.status_code == 202
+    state = _finished(client, resp.json()["job_id"])
+    assert state["result"] == {"status": "ok"}
     assert called.get("ran") is True
@@ -0,0 +1,112 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import lib.metrics_registry as mr
+import lib.quality_metrics as qm
+from agentic_index_cli.internal.scoring import compute_score, compute_scores
+
+
+def _stamp(days_ago):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return (now - datetime.timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+REPOS = [
+    {
+        "stargazers_count": 1200,
+        "open_issues_count": 4,
+        "closed_issues": 36,
+        "pushed_at": _stamp(3),
+        "license": {"spdx_id": "MIT"},
+    },
+    {
+        "stars": 50,
+        "recency_factor": 0.4,
+        "issue_health": 0.9,
+        "doc_completeness": 1.0,
+        "license_freedom": 0.5,
+        "ecosystem_integration": 1.0,
+    },
+    {"stargazers_count": 7, "pushed_at": _stamp(200), "license": "GPL-3.0"},
+    {"stargazers_count": 7, "pushed_at": "yesterday", "license": None},
+    {"stars": None, "recency_factor": None, "pushed_at": _stamp(400)},
+    {"open_issues_count": None, "license": {"spdx_id": None}},
+    {},
+]
+
+
+@pytest.fixture
+def registry():
+    original = mr._REGISTRY.copy()
+    yield mr
+    mr._REGISTRY = original
+
+
+def test_compute_scores_matches_per_repo():
+    assert compute_scores(REPOS) == [compute_score(r) for r in REPOS]
+    assert compute_scores([]) == []
+
+
+def test_recency_factors_boundaries():
+    stamps = [_stamp(10), _stamp(200), _stamp(400), None, "2025-01-01"]
+    values = qm.recency_factors(stamps)
+    assert values[0] == 1.0
+    assert values[1] == pytest.approx(1 - (200 - 30) / 335)
+    assert values[2] == 0.0
+    assert np.isnan(values[3]) and np.isnan(values[4])
+
+
+class PerRepoMetric:
+    name = "per_repo"
+    weight = 1.0
+
+    def score(self, repo):
+        if "boom" in repo:
+            raise ValueError("boom")
+        return repo.get("extra", 0.0)
+
+
+class BrokenBatchMetric(PerRepoMetric):
+    name = "broken_batch"
+
+    def score_batch(self, columns):
+        return [1.0]  # wrong length
+
+
+def test_plugins_fall_back_to_score(registry):
+    registry._REGISTRY = {}
+    registry.register(PerRepoMetric())
+    registry.register(BrokenBatchMetric())
+    repos = [{"extra": 2.0}, {"boom": True}, {}]
+    assert compute_scores(repos) == [4.0, 0.0, 0.0]
+    assert compute_scores(repos) == [compute_score(r) for r in repos]
+
+
+def test_repo_columns_caches_and_chains_keys():
+    columns = mr.RepoColumns([{"stars": 3}, {"stargazers_count": 5}, {"stars": None}])
+    stars = columns.column("stars", "stargazers_count", default=0.0)
+    assert stars[:2].tolist() == [3.0, 5.0] and np.isnan(stars[2])
+    assert columns.column("stars", "stargazers_count", default=0.0) is stars
+    assert columns.column("missing", default=0.0).tolist() == [0.0, 0.0, 0.0]
+
+
+FIELDS = [
+    "stars",
+    "recency_factor",
+    "issue_health",
+    "doc_completeness",
+    "license_freedom",
+    "ecosystem_integration",
+]
+
+
+@pytest.mark.parametrize("field", FIELDS)
+@pytest.mark.parametrize(
+    "value", [None, float("nan"), float("inf"), "x", "0.5", True, np.float32(0.5)]
+)
+def test_scalar_and_batch_agree_on_odd_values(field, value):
+    repo = dict(REPOS[1], pushed_at=_stamp(60), license={"spdx_id": "MIT"})
+    repo[field] = value
+    assert compute_scores([repo, REPOS[0]])[0] == compute_score(repo)
@@ -0,0 +1,80 @@
+import json
+import os
+import time
+
+import pytest
+
+import agentic_index_cli.__main__ as main
+from agentic_index_cli.internal import cache_store
+
+
+@pytest.fixture(params=["sqlite", "files"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        s = cache_store.SQLiteCacheStore(tmp_path / "cache.sqlite3")
+        yield s
+        s.close()
+    else:
+        yield cache_store.FileCacheStore(tmp_path)
+
+
+def test_get_put_roundtrip(store):
+    store.put("repo_a_b.json", {"id": 1})
+    store.put("readme_a_b.txt", "hello")
+    assert store.get("repo_a_b.json") == {"id": 1}
+    assert store.get("readme_a_b.txt") == "hello"
+    assert store.get("missing.json") is None
+
+
+def test_bulk_and_max_age(store):
+    store.put_many({"a.json": 1, "b.json": 2})
+    store.put_many({"old.json": 3}, updated=time.time() - 100)
+    assert store.get_many(["a.json", "b.json", "old.json", "x.json"]) == {
+        "a.json": 1,
+        "b.json": 2,
+        "old.json": 3,
+    }
+    assert "old.json" not in store.get_many(["old.json"], max_age=50)
+    assert store.evict(max_age=50) == 1
+    assert sorted(store.keys()) == ["a.json", "b.json"]
+
+
+def test_evict_by_size_keeps_newest(store):
+    now = time.time()
+    for i in range(5):
+        store.put_many({f"k{i}.json": "x" * 100}, updated=now - 10 + i)
+    store.evict(max_bytes=250)
+    assert sorted(store.keys()) == ["k3.json", "k4.json"]
+
+
+def test_sqlite_ttl(tmp_path):
+    store = cache_store.SQLiteCacheStore(tmp_path / "cache.sqlite3")
+    store.put("a.json", 1, ttl=-1)
+    assert store.get("a.json") is None
+    assert store.evict() == 1
+    store.close()
+
+
+def test_migrate_directory(tmp_path):
+    (tmp_path / "repo_o_r.json").write_text(json.dumps({"id": 7}))
+    (tmp_path / "readme_o_r.txt").write_text("text")
+    (tmp_path / "http").mkdir()
+    (tmp_path / "http" / "abc.json").write_text(json.dumps({"etag": "x"}))
+    old = time.time() - 1000
+    os.utime(tmp_path / "repo_o_r.json", (old, old))
+    store = cache_store.SQLiteCacheStore(tmp_path / "cache.sqlite3")
+    assert cache_store.migrate_directory(tmp_path, store, remove=True) == 3
+    assert store.get("repo_o_r.json") == {"id": 7}
+    assert store.get("repo_o_r.json", max_age=500) is None
+    assert store.get("readme_o_r.txt") == "text"
+    assert store.get("http_abc.json") == {"etag": "x"}
+    assert not (tmp_path / "repo_o_r.json").exists()
+    store.close()
+
+
+def test_cache_migrate_cli(tmp_path, capsys):
+    (tmp_path / "meta_o_r.json").write_text(json.dumps({"name": "o/r"}))
+    main.main(["cache-migrate", "--cache-dir", str(tmp_path)])
+    store = cache_store.open_store(tmp_path, "sqlite")
+    assert store.get("meta_o_r.json") == {"name": "o/r"}
+    assert "Imported 1" in capsys.readouterr().out
@@ -0,0 +1,81 @@
+import pytest
+
+from agentic_index_cli.internal import rank
+from agentic_index_cli.internal.classifier import Match, default_classifier, load_rules
+from agentic_index_cli.internal.scoring import infer_category
+from agentic_index_cli.internal.scrape import get_ecosystem_integration
+
+RULES = """
+schemes:
+  kind:
+    default: other
+    labels:
+      - label: low
+        priority: 1
+        keywords: [team]
+      - label: high
+        priority: 5
+        keywords: [Multi Agent, dev]
+      - label: tie
+        priority: 5
+        keywords: [devtool]
+  eco:
+    labels:
+      - label: tool
+        keywords: [tool]
+"""
+
+
+@pytest.fixture
+def classifier(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text(RULES)
+    return load_rules(path)
+
+
+def test_all_labels_in_one_scan(classifier):
+    # "devtool" contains "dev" and "tool"; "multi agent" starts inside "team"
+    assert classifier.matches("A DevTool for the teaMulti agent crowd") == (
+        Match("kind", "high", 5),
+        Match("kind", "tie", 5),
+        Match("kind", "low", 1),
+        Match("eco", "tool", 0),
+    )
+    assert classifier.labels("devtool", "kind") == ["high", "tie"]
+    assert classifier.classify("team", "kind") == "low"
+    assert classifier.classify("nothing here", "kind") == "other"
+    assert classifier.classify("nothing here", "eco") is None
+
+
+def test_results_are_cached_per_text(classifier):
+    classifier.classify("dev team", "kind")
+    classifier.labels("dev team", "eco")
+    info = classifier._matches.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_invalid_rules_raise_value_error(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text("schemes:\n  kind:\n    labels:\n      - label: x\n")
+    with pytest.raises(ValueError, match="keywords"):
+        load_rules(path)
+
+
+def test_bundled_rules_keep_categories():
+    repo = {"name": "crew-kit", "description": "Runtime", "topics": ["storage"]}
+    # "storage" contains "rag", the highest priority ranking label
+    assert infer_category(repo) == "RAG-centric"
+    repo = {"name": "x", "description": "A multi agent runtime"}
+    assert rank.infer_category(repo) == "Multi-Agent Coordination"
+    assert infer_category({"name": "x", "description": "toolkit"}) == "DevTools"
+    assert infer_category({"name": "x", "description": ""}) == "General-purpose"
+    assert get_ecosystem_integration("Rapid prototyping", []) == 1.0
+    assert get_ecosystem_integration(None, ["agents"]) == 0.0
+    assert default_classifier() is default_classifier()
+
+
+def test_rules_path_from_env(classifier, tmp_path, monkeypatch):
+    monkeypatch.setenv("AGENTIC_INDEX_CATEGORIES", str(tmp_path / "rules.yaml"))
+    assert default_classifier().classify("team", "kind") == "low"
+    monkeypatch.delenv("AGENTIC_INDEX_CATEGORIES")
+    assert default_classifier().classify("team", "topic_category") == "Multi-Agent"
@@ -14,7 +14,7 @@ from agentic_index_cli.internal import inject_readme
 def test_scrape_cli(monkeypatch, tmp_path):
     called = {}
 
-    def fake_scrape(min_stars=0, token=None):
+    def fake_scrape(min_stars=0, token=None, resume=False, incremental=False):
         called["scrape"] = (min_stars, token)
         return [{"full_name": "owner/repo"}]
 
@@ -24,14 +24,18 @@ def test_scraper_cli(monkeypatch):
 def test_ranker_cli(monkeypatch, tmp_path):
     called = {}
 
-    def fake_main(path, *, config=None):
+    def fake_main(path, *, config=None, workers=1):
         called["path"] = path
         called["config"] = config
+        called["workers"] = workers
 
     monkeypatch.setattr(ranker, "main", fake_main)
     ranker.cli([str(tmp_path / "repos.json")])
     assert called["path"].endswith("repos.json")
     assert isinstance(called["config"], dict)
+    assert called["workers"] == 1
+    ranker.cli([str(tmp_path / "repos.json"), "--workers", "4"])
+    assert called["workers"] == 4
 
 
 def test_inject_cli(monkeypatch):
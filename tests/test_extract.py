@@ -1,4 +1,5 @@
 import agentic_index_cli.internal.scrape as scrape
+from agentic_index_cli.internal.search_index import SearchIndex
 
 
 def test_extract():
@@ -19,3 +20,22 @@ def test_extract():
     data = scrape._extract(item)
     assert data["full_name"] == "owner/repo"
     assert data["license"]["spdx_id"] == "MIT"
+
+
+def test_extract_keeps_topics_for_search():
+    item = {
+        "name": "repo",
+        "full_name": "owner/repo",
+        "html_url": "url",
+        "stargazers_count": 1,
+        "forks_count": 0,
+        "open_issues_count": 0,
+        "archived": False,
+        "pushed_at": "2025-01-01T00:00:00Z",
+        "owner": {"login": "owner"},
+        "topics": ["vector-database"],
+    }
+    data = scrape._extract(item, doc_completeness=0.0)
+    assert data["topics"] == ["vector-database"]
+    index = SearchIndex.build([data])
+    assert [hit[0] for hit in index.search("vector")] == ["owner/repo"]
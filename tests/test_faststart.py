@@ -67,3 +67,20 @@ def test_faststart(tmp_path):
         else:
             value = float(stars)
         assert value >= 5000
+
+
+def test_faststart_tolerates_non_numeric_doc_completeness(tmp_path):
+    from agentic_index_cli import faststart
+    from agentic_index_cli.repo_table import RepoTable
+
+    base = {"last_commit": "2024-01-01", "category": "A", "one_liner": "desc"}
+    repos = [
+        {**base, "full_name": "o/a", "stars": 6000, "doc_completeness": "yes"},
+        {**base, "full_name": "o/b", "stars": 7000, "doc_completeness": None},
+        {**base, "full_name": "o/c", "stars": 9000, "doc_completeness": 1},
+    ]
+    out = tmp_path / "FAST_START.md"
+    faststart.run(5, tmp_path / "unused.json", output_path=out, table=RepoTable(repos))
+    text = out.read_text()
+    assert "o/c" in text
+    assert "o/a" not in text and "o/b" not in text
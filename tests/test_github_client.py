@@ -37,3 +37,18 @@ def test_async_get(monkeypatch):
 
     result = run_async(gc.async_get("http://x", session=DummySession()))
     assert result is resp
+
+
+def test_async_get_uses_shared_client(monkeypatch):
+    captured = {}
+
+    async def fake_async_get(url, *, session, **kwargs):
+        captured["session"] = session
+        captured["kwargs"] = kwargs
+        return http_utils.Response(200, {}, "ok")
+
+    monkeypatch.setattr(gc.http_utils, "async_get", fake_async_get)
+    result = run_async(gc.async_get("http://x"))
+    assert result.text == "ok"
+    assert captured["session"] is gc.client()._session
+    assert "client" not in captured["kwargs"]
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import re
+
+import agentic_index_cli.internal.scrape as scrape
+import agentic_index_cli.network as net
+from agentic_index_cli.internal import graphql_harvest as gh
+from agentic_index_cli.internal import http_utils
+
+ALIAS_RE = re.compile(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)')
+
+
+class StubGraphQL:
+    """Answer batched repository queries from an in-memory table."""
+
+    def __init__(self, repos):
+        self.repos = repos
+        self.queries = []
+
+    async def __call__(self, query, *, variables=None, headers=None):
+        self.queries.append(query)
+        data = {}
+        for alias, owner, name in ALIAS_RE.findall(query):
+            node = self.repos.get(f"{owner}/{name}")
+            data[alias] = node
+        return http_utils.Response(200, {}, json.dumps({"data": data}))
+
+
+def _node(full_name, readme="Intro\n\nMore", docs=False):
+    owner, name = full_name.split("/")
+    node = {
+        "nameWithOwner": full_name,
+        "name": name,
+        "url": f"https://github.com/{full_name}",
+        "description": "agent framework",
+        "stargazerCount": 42,
+        "forkCount": 3,
+        "isArchived": False,
+        "pushedAt": "2025-01-01T00:00:00Z",
+        "owner": {"login": owner},
+        "licenseInfo": {"spdxId": "MIT"},
+        "primaryLanguage": {"name": "Python"},
+        "openIssues": {"totalCount": 2},
+        "closedIssues": {"totalCount": 5},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "agent"}}]},
+        "readme0": {"byteSize": len(readme), "text": readme} if readme else None,
+        "doc0": {"__typename": "Blob"} if docs else None,
+    }
+    return node
+
+
+def test_build_query_escapes_names():
+    query = gh.build_query(['o/a"b', "x/y"], readme_text=False)
+    assert 'r0: repository(owner: "o", name: "a\\"b")' in query
+    assert 'r1: repository(owner: "x", name: "y")' in query
+    assert "text" not in query.split("fragment")[0]
+
+
+def test_readme_text_is_opt_in_with_smaller_batches(monkeypatch):
+    assert "text" not in gh.build_query(["o/r"]).split("fragment")[0]
+    names = [f"o/r{i}" for i in range(gh.TEXT_BATCH_SIZE + 1)]
+    stub = StubGraphQL({n: _node(n) for n in names})
+    monkeypatch.setattr(gh, "async_graphql", stub)
+    asyncio.run(gh.async_fetch_all(names))
+    assert len(stub.queries) == 1
+    stub.queries.clear()
+    asyncio.run(gh.async_fetch_all(names, readme_text=True))
+    assert len(stub.queries) == 2
+    assert "byteSize text" in stub.queries[0]
+
+
+def test_fetch_all_batches(monkeypatch):
+    stub = StubGraphQL({f"o/r{i}": _node(f"o/r{i}") for i in range(3)})
+    monkeypatch.setattr(gh, "async_graphql", stub)
+    res = asyncio.run(gh.async_fetch_all(["o/r0", "o/r1", "o/r2"], batch_size=2))
+    assert len(stub.queries) == 2
+    snap = res["o/r1"]
+    assert snap.repo["stargazers_count"] == 42
+    assert snap.repo["topics"] == ["agent"]
+    assert snap.repo["license"] == {"spdx_id": "MIT"}
+    assert snap.readme == "Intro\n\nMore"
+    assert not snap.has_docs
+
+
+def test_graphql_harvest_falls_back(monkeypatch, tmp_path):
+    stub = StubGraphQL({"o/found": _node("o/found")})
+    monkeypatch.setattr(gh, "async_graphql", stub)
+    monkeypatch.setattr(net, "CACHE_DIR", tmp_path)
+    fallback = []
+
+    async def fake_harvest(name, session=None):
+        fallback.append(name)
+        return {"name": name}
+
+    monkeypatch.setattr(net, "async_harvest_repo", fake_harvest)
+    res = asyncio.run(net.async_graphql_harvest(["o/found", "o/missing"]))
+    names = sorted(r["name"] for r in res)
+    assert names == ["o/found", "o/missing"]
+    assert fallback == ["o/missing"]
+    assert net._store().get("meta_o_found.json")["name"] == "o/found"
+
+
+def test_scrape_graphql_backend(monkeypatch):
+    item = {
+        "name": "repo",
+        "full_name": "owner/repo",
+        "html_url": "https://example.com/repo",
+        "description": "test repo",
+        "stargazers_count": 1,
+        "forks_count": 0,
+        "open_issues_count": 0,
+        "archived": False,
+        "license": {"spdx_id": "MIT"},
+        "language": "Python",
+        "pushed_at": "2025-01-01T00:00:00Z",
+        "owner": {"login": "owner"},
+    }
+    urls = []
+
+    def fake_get(url, params=None, headers=None):
+        urls.append(url)
+        return http_utils.Response(
+            200, {"X-RateLimit-Remaining": "99"}, json.dumps({"items": [item]})
+        )
+
+    stub = StubGraphQL({"owner/repo": _node("owner/repo", readme="", docs=True)})
+    monkeypatch.setattr(scrape, "QUERIES", ["q"])
+    monkeypatch.setattr(scrape, "github_get", fake_get)
+    monkeypatch.setattr(gh, "async_graphql", stub)
+    repos = scrape.scrape(min_stars=0, token=None, backend="graphql")
+    assert repos[0]["doc_completeness"] == 1.0
+    assert len(stub.queries) == 1
+    assert not any("raw.githubusercontent" in u for u in urls)
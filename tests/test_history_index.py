@@ -0,0 +1,101 @@
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_index_cli.internal import history_index as hi
+from agentic_index_cli.internal.history_store import HistoryStore
+
+
+def _snapshot(history, day, repos):
+    raw = {"schema_version": 3, "repos": repos}
+    HistoryStore(history).put(history / f"{day}.json", raw)
+
+
+def _repo(name, stars, score, **extra):
+    return {
+        "name": name,
+        "full_name": f"o/{name}",
+        "stars": stars,
+        "AgenticIndexScore": score,
+        **extra,
+    }
+
+
+def test_index_tracks_snapshots(tmp_path):
+    _snapshot(tmp_path, "2025-01-01", [_repo("a", 1, 1.0), _repo("b", 5, 2.0)])
+    _snapshot(tmp_path, "2025-01-02", [_repo("a", 2, 1.5, category="RAG-centric")])
+    index = hi.HistoryIndex.build(tmp_path)
+    assert index.dates == ["2025-01-01", "2025-01-02"]
+    assert index.lookup("a") == index.lookup("o/a") == ["o/a"]
+    assert [p["stars"] for p in index.points("o/a")] == [1, 2]
+    assert index.aligned("o/b", "score") == [2.0, None]
+    assert index.latest() == {
+        "o/a": {
+            "name": "a",
+            "language": None,
+            "category": "RAG-centric",
+            "stars": 2,
+            "forks": None,
+            "issues": None,
+            "score": 1.5,
+        }
+    }
+    index.save(tmp_path)
+
+    (tmp_path / "2025-01-01.json").unlink()
+    _snapshot(tmp_path, "2025-01-03", [_repo("a", 3, 1.7)])
+    reloaded = hi.HistoryIndex.load(tmp_path)
+    assert reloaded.update(tmp_path)
+    assert reloaded.dates == ["2025-01-02", "2025-01-03"]
+    assert "o/b" not in reloaded.repos
+    assert [p["date"] for p in reloaded.points("o/a")] == ["2025-01-02", "2025-01-03"]
+    assert not reloaded.update(tmp_path)
+
+
+def test_update_reads_only_new_snapshots(tmp_path, monkeypatch):
+    _snapshot(tmp_path, "2025-01-01", [_repo("a", 1, 1.0)])
+    hi.HistoryIndex.build(tmp_path).save(tmp_path)
+    _snapshot(tmp_path, "2025-01-02", [_repo("a", 2, 1.0)])
+    read = []
+    original = HistoryStore.read
+
+    def tracking_read(self, path):
+        read.append(path.name)
+        return original(self, path)
+
+    monkeypatch.setattr(HistoryStore, "read", tracking_read)
+    index = hi.HistoryIndex.build(tmp_path)
+    assert read == ["2025-01-02.json"]
+    assert index.aligned("o/a", "stars") == [1, 2]
+
+
+def test_checkout_mtimes_do_not_reindex(tmp_path):
+    _snapshot(tmp_path, "2025-01-01", [_repo("a", 1, 1.0)])
+    index = hi.HistoryIndex.build(tmp_path)
+    index.save(tmp_path)
+    path = tmp_path / "2025-01-01.json"
+    os.utime(path, ns=(1, 1))
+    assert not hi.HistoryIndex.load(tmp_path).update(tmp_path)
+    path.write_text(path.read_text().replace("{", "{ ", 1))
+    assert hi.HistoryIndex.load(tmp_path).update(tmp_path)
+
+
+def test_history_endpoint_uses_index(tmp_path, monkeypatch):
+    try:
+        from agentic_index_api import main as api_main
+    except Exception as exc:  # pragma: no cover - optional deps
+        pytest.skip(f"Could not load API main module: {exc}")
+    legacy = [{"name": "a", "AgentOpsScore": 0.5}]
+    (tmp_path / "2024-12-31.json").write_text(json.dumps(legacy))
+    _snapshot(tmp_path, "2025-01-01", [_repo("a", 1, 1.0)])
+    monkeypatch.setattr(api_main, "HISTORY_DIR", tmp_path)
+    monkeypatch.setattr(api_main, "_HISTORY", {"sources": None, "index": None})
+    client = TestClient(api_main.app)
+    history = client.get("/history/a").json()["history"]
+    assert [(p["date"], p["score"]) for p in history] == [
+        ("2024-12-31", 0.5),
+        ("2025-01-01", 1.0),
+    ]
+    assert client.get("/history/missing").status_code == 404
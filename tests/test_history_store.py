@@ -0,0 +1,92 @@
+import datetime
+import json
+import types
+
+from agentic_index_cli import enricher
+from agentic_index_cli.internal import snapshot as snap
+from agentic_index_cli.internal.history_store import HistoryStore, read_snapshot
+from agentic_index_cli.validate import load_repos, save_repos
+
+REPOS = [
+    {"name": "a", "full_name": "o/a", "stars": 10, "description": "héllo"},
+    {"name": "b", "full_name": "o/b", "stars": 3},
+]
+
+
+def _objects(history):
+    return sorted(p.name for p in (history / "objects").rglob("*.json"))
+
+
+def test_manifests_share_records(tmp_path):
+    store = HistoryStore(tmp_path)
+    first = {"schema_version": 3, "repos": REPOS}
+    second = {"schema_version": 3, "repos": [REPOS[0], dict(REPOS[1], stars=4)]}
+    store.put(tmp_path / "2025-01-01.json", first)
+    store.put(tmp_path / "2025-01-02.json", second)
+    assert len(_objects(tmp_path)) == 3
+    assert store.read(tmp_path / "2025-01-01.json") == first
+    assert read_snapshot(tmp_path / "2025-01-02.json") == second
+    assert load_repos(tmp_path / "2025-01-02.json")[1]["stars"] == 4
+
+    (tmp_path / "2025-01-01.json").unlink()
+    assert store.gc() == 1
+    assert read_snapshot(tmp_path / "2025-01-02.json") == second
+
+
+def test_migrate_keeps_legacy_content(tmp_path):
+    legacy = [{"name": "x", "AgentOpsScore": 1.5}]
+    (tmp_path / "2024-01-01.json").write_text(json.dumps(legacy))
+    full = tmp_path / "2025-01-01.json"
+    save_repos(full, REPOS)
+    expected = json.loads(full.read_text())
+    store = HistoryStore(tmp_path)
+    assert store.migrate() == 2
+    assert store.migrate() == 0
+    assert "objects" in json.loads(full.read_text())
+    assert read_snapshot(full) == expected
+    assert read_snapshot(tmp_path / "2024-01-01.json") == legacy
+
+
+def test_persist_history_deduplicates(tmp_path, monkeypatch):
+    data_file = tmp_path / "repos.json"
+    history = tmp_path / "history"
+    for day in (1, 2, 3):
+        today = datetime.date(2025, 1, day)
+        monkeypatch.setattr(
+            snap,
+            "datetime",
+            types.SimpleNamespace(date=types.SimpleNamespace(today=lambda: today)),
+        )
+        repos = [REPOS[0], dict(REPOS[1], stars=day)]
+        save_repos(data_file, repos)
+        snap.persist_history(data_file, repos, delta_days=2)
+    assert [p.name for p in HistoryStore(history).snapshots()] == [
+        "2025-01-02.json",
+        "2025-01-03.json",
+    ]
+    assert len(_objects(history)) == 3
+    previous = enricher._previous_map(data_file)
+    assert previous["o/b"]["stars"] == 3
+
+
+def test_persist_history_leaves_legacy_snapshots_to_compact(tmp_path):
+    from typer.testing import CliRunner
+
+    from agentic_index_cli.__main__ import app as cli_app
+
+    history = tmp_path / "history"
+    history.mkdir()
+    legacy = history / "2000-01-01.json"
+    legacy.write_text(json.dumps(REPOS))
+    data_file = tmp_path / "repos.json"
+    save_repos(data_file, REPOS)
+    snap.persist_history(data_file, REPOS, delta_days=5)
+    assert json.loads(legacy.read_text()) == REPOS
+
+    result = CliRunner().invoke(
+        cli_app, ["history-compact", "--history-dir", str(history)]
+    )
+    assert result.exit_code == 0
+    assert "Converted 1 snapshots" in result.output
+    assert read_snapshot(legacy) == REPOS
+    assert "objects" in json.loads(legacy.read_text())
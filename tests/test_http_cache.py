@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_index_api.http_cache import (
+    CACHE_CONTROL,
+    PRIVATE_CACHE_CONTROL,
+    ResponseCache,
+    make_entry,
+)
+
+from .test_api_auth import load_app
+
+
+def test_lru_keeps_hottest_entries():
+    cache = ResponseCache(maxsize=2)
+    builds = []
+
+    def build(value):
+        def _build():
+            builds.append(value)
+            return {"v": value}
+
+        return _build
+
+    first = cache.get("a", build(1))
+    cache.get("b", build(2))
+    assert cache.get("a", build(99)) is first
+    cache.get("c", build(3))  # evicts "b", the least recently used
+    cache.get("b", build(4))
+    assert builds == [1, 2, 3, 4]
+    assert cache.get("missing", lambda: None) is None
+    assert len(cache) == 2
+    assert make_entry({"v": 1}).etag == first.etag
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    try:
+        from agentic_index_api import main as api_main
+        from agentic_index_api.snapshot import SnapshotManager
+    except Exception as exc:  # pragma: no cover - optional deps
+        pytest.skip(f"Could not load API main module: {exc}")
+    data = tmp_path / "repos.json"
+    repos = [{"name": "a", "full_name": "o/a", "AgenticIndexScore": 1.0}]
+    data.write_text(json.dumps({"schema_version": 3, "repos": repos}))
+    os.utime(data, (1_000_000, 1_000_000))
+    monkeypatch.setattr(api_main, "manager", SnapshotManager(data, interval=0.0))
+    monkeypatch.setattr(api_main, "responses", ResponseCache())
+    return api_main, data
+
+
+def test_repo_etag_and_304(api):
+    api_main, data = api
+    client = TestClient(api_main.app)
+    resp = client.get("/repo/a")
+    etag = resp.headers["etag"]
+    assert resp.headers["cache-control"] == CACHE_CONTROL
+    assert resp.json()["rank"] == 1
+
+    again = client.get("/repo/a", headers={"If-None-Match": f'"x", W/{etag}'})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    assert api_main.responses.hits == 1
+
+    repos = [
+        {"name": "a", "full_name": "o/a", "AgenticIndexScore": 1.0},
+        {"name": "b", "full_name": "o/b", "AgenticIndexScore": 2.0},
+    ]
+    data.write_text(json.dumps({"schema_version": 3, "repos": repos}))
+    os.utime(data, (2_000_000, 2_000_000))
+    changed = client.get("/repo/a", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["rank"] == 2
+    assert changed.headers["etag"] != etag
+    assert client.get("/repo/missing").status_code == 404
+
+
+def test_score_cached_until_sync_data_changes(tmp_path, monkeypatch):
+    path = tmp_path / "sync.json"
+    path.write_text(json.dumps([{"name": "A", "stargazers_count": 10}]))
+    app, mod = load_app(monkeypatch, key="k")
+    monkeypatch.setattr(mod, "SYNC_DATA_PATH", path)
+    calls = []
+    original = mod.compute_scores
+
+    def counting(repos):
+        calls.append(len(repos))
+        return original(repos)
+
+    monkeypatch.setattr(mod, "compute_scores", counting)
+    client = TestClient(app)
+    headers = {"X-API-KEY": "k"}
+    first = client.post("/score", json={}, headers=headers)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == PRIVATE_CACHE_CONTROL
+    revalidated = client.get("/score", headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == PRIVATE_CACHE_CONTROL
+    assert calls == [1]
+
+    path.write_text(json.dumps([{"name": "A"}, {"name": "B"}]))
+    os.utime(path, (2_000_000, 2_000_000))
+    rescored = client.post("/score", json={}, headers=headers).json()
+    assert len(rescored["top_scores"]) == 2
+    assert calls == [1, 2]
@@ -5,7 +5,7 @@ from unittest import mock
 import aiohttp
 import pytest
 
-from agentic_index_cli.internal import http_utils
+from agentic_index_cli.internal import cache_store, http_utils
 
 
 class DummyResponse:
@@ -95,16 +95,155 @@ def test_sync_get(monkeypatch):
         return http_utils.Response(201, {"A": "B"}, '{"v": 1}')
 
     monkeypatch.setattr(http_utils, "async_get", fake_async_get)
-
-    class CS:
-        async def __aenter__(self):
-            return object()
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
-    monkeypatch.setattr(aiohttp, "ClientSession", CS)
-    resp = http_utils.sync_get("http://x")
+    client = http_utils.SharedClient()
+    try:
+        resp = http_utils.sync_get("http://x", client=client)
+    finally:
+        client.close()
     assert resp.status_code == 201
     assert resp.headers["A"] == "B"
     assert resp.json() == {"v": 1}
+    assert client.stats()["requests"] == 1
+
+
+def test_shared_client_reuses_session(monkeypatch):
+    sessions = []
+
+    async def fake_async_get(url, *, session, **kw):
+        sessions.append(session)
+        return http_utils.Response(200, {}, "ok")
+
+    monkeypatch.setattr(http_utils, "async_get", fake_async_get)
+    client = http_utils.SharedClient(limit=7, limit_per_host=3)
+    try:
+        client.get("http://x")
+        run_async(client.async_get("http://y"))
+        run_async(client.async_get("http://z"))
+    finally:
+        client.close()
+    assert len(sessions) == 3
+    assert sessions[0] is sessions[1] is sessions[2]
+    stats = client.stats()
+    assert stats["pool_size"] == 7
+    assert stats["limit_per_host"] == 3
+    assert stats["requests"] == 3
+
+
+def test_get_client_singleton():
+    http_utils.close_client()
+    try:
+        first = http_utils.get_client(limit=11)
+        assert http_utils.get_client() is first
+        assert first.limit == 11
+    finally:
+        http_utils.close_client()
+
+
+def test_request_class():
+    assert http_utils.request_class("https://api.github.com/search/repositories") == (
+        "search"
+    )
+    assert http_utils.request_class("https://api.github.com/repos/o/r") == "core"
+    assert (
+        http_utils.request_class("https://raw.githubusercontent.com/o/r/HEAD/README.md")
+        == "raw"
+    )
+
+
+def test_limiter_semaphore_per_loop():
+    limiter = http_utils.ConcurrencyLimiter({"search": 1})
+
+    async def grab():
+        return limiter.semaphore("https://api.github.com/search/repositories")
+
+    first = run_async(grab())
+    second = run_async(grab())
+    assert first is not second
+    assert first._value == 1
+
+
+def test_async_get_across_loops():
+    # a module-wide semaphore would fail once bound to a closed loop
+    for _ in range(2):
+        session = DummySession([DummyResponse(status=200)])
+        result = run_async(http_utils.async_get("http://x", session=session, retries=1))
+        assert result.status_code == 200
+
+
+def test_shared_client_concurrency_stats():
+    client = http_utils.SharedClient(concurrency={"search": 1, "core": 8})
+    try:
+        stats = client.stats()
+    finally:
+        client.close()
+    assert stats["concurrency_search"] == 1
+    assert stats["concurrency_core"] == 8
+    assert stats["concurrency_raw"] == http_utils.DEFAULT_CONCURRENCY["raw"]
+
+
+class RecordingSession(DummySession):
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.calls = []
+
+    def get(self, *a, **k):
+        self.calls.append(k)
+        return super().get(*a, **k)
+
+
+def test_conditional_cache_revalidates(tmp_path):
+    store = cache_store.SQLiteCacheStore(tmp_path / "cache.sqlite3")
+    cache = http_utils.ConditionalCache(store)
+    session = RecordingSession(
+        [
+            DummyResponse(status=200, headers={"ETag": '"abc"'}, text="body"),
+            DummyResponse(status=304, headers={"X-RateLimit-Remaining": "9"}),
+        ]
+    )
+    first = run_async(
+        http_utils.async_get("http://x", session=session, retries=1, cache=cache)
+    )
+    second = run_async(
+        http_utils.async_get("http://x", session=session, retries=1, cache=cache)
+    )
+    assert first.text == second.text == "body"
+    assert second.status_code == 200
+    assert second.headers["X-RateLimit-Remaining"] == "9"
+    assert "If-None-Match" not in (session.calls[0]["headers"] or {})
+    assert session.calls[1]["headers"]["If-None-Match"] == '"abc"'
+    assert cache.stats() == {"hits": 0, "misses": 1, "not_modified": 1}
+
+
+def test_conditional_cache_expires_entries(tmp_path):
+    store = cache_store.SQLiteCacheStore(tmp_path / "cache.sqlite3")
+    cache = http_utils.ConditionalCache(store, max_age=60)
+    resp = http_utils.Response(200, {"ETag": '"abc"'}, "body")
+    cache.update("http://x", None, resp, None)
+    assert cache.load("http://x")["etag"] == '"abc"'
+    store.put("meta_o_r.json", {"name": "o/r"})
+    expired = http_utils.ConditionalCache(store, max_age=0)
+    assert expired.load("http://x") is None
+    assert cache.prune() == 0
+    expired.update("http://y", None, resp, None)
+    assert expired.prune() == 1
+    assert sorted(store.keys()) == sorted(
+        ["meta_o_r.json", cache._key("http://x", None)]
+    )
+
+
+def test_disabled_conditional_cache_opens_no_store(monkeypatch, tmp_path):
+    from agentic_index_cli import github_client
+
+    monkeypatch.setattr(github_client, "CONDITIONAL_CACHE", False)
+    github_client.record_cache_hit()
+    assert github_client.http_cache_stats() is None
+    assert github_client._http_cache is None
+
+
+def test_conditional_cache_skips_unvalidated(tmp_path):
+    store = cache_store.FileCacheStore(tmp_path)
+    cache = http_utils.ConditionalCache(store)
+    session = DummySession([DummyResponse(status=200, text="body")])
+    run_async(http_utils.async_get("http://x", session=session, retries=1, cache=cache))
+    assert cache.load("http://x") is None
+    assert store.keys() == []
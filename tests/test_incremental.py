@@ -0,0 +1,219 @@
+import asyncio
+import datetime
+import json
+
+import agentic_index_cli.internal.scrape as scrape
+import agentic_index_cli.network as net
+from agentic_index_cli.internal import incremental, search_planner
+
+
+def _item(name, stars=10, pushed="2025-01-01T00:00:00Z"):
+    owner, repo = name.split("/")
+    return {
+        "name": repo,
+        "full_name": name,
+        "html_url": f"https://github.com/{name}",
+        "description": "agent",
+        "stargazers_count": stars,
+        "forks_count": 0,
+        "open_issues_count": 0,
+        "archived": False,
+        "license": {"spdx_id": "MIT"},
+        "language": "Python",
+        "pushed_at": pushed,
+        "owner": {"login": owner},
+    }
+
+
+def _write_snapshot(path, items):
+    snap = []
+    for item in items:
+        rec = dict(item, license="MIT", recency_factor=0.5, doc_completeness=1.0)
+        rec.update(stars=rec["stargazers_count"], stars_delta="+new")
+        snap.append(rec)
+    path.write_text(json.dumps({"schema_version": 3, "repos": snap}))
+
+
+def test_load_baseline_picks_newest(tmp_path):
+    _write_snapshot(tmp_path / "2025-01-01.json", [_item("o/old")])
+    _write_snapshot(tmp_path / "2025-02-01.json", [_item("o/a"), _item("o/b")])
+    (tmp_path / "notes.json").write_text("{}")
+    base = incremental.load_baseline(tmp_path)
+    assert base.day == datetime.date(2025, 2, 1)
+    assert base.since == datetime.date(2025, 1, 31)
+    assert sorted(base.repos) == ["o/a", "o/b"]
+    assert not base.changed(_item("o/a"))
+    assert base.changed(_item("o/a", stars=11))
+    assert base.changed(_item("o/new"))
+    assert base.carried({"o/a"}) == ["o/b"]
+    assert base.carried(set(), min_stars=11) == []
+    assert incremental.load_baseline(tmp_path / "missing") is None
+
+
+def test_scrape_incremental(monkeypatch, tmp_path):
+    old = [_item("o/same"), _item("o/bumped"), _item("o/quiet", stars=3)]
+    _write_snapshot(tmp_path / "2025-02-01.json", old)
+    monkeypatch.setattr(incremental, "HISTORY_DIR", tmp_path)
+    monkeypatch.setattr(incremental, "REFRESH_DAYS", 0)
+    hits = [_item("o/same"), _item("o/bumped", stars=99), _item("o/new")]
+    queries = []
+    probed = []
+
+    def fake_get(url, params=None, headers=None):
+        queries.append(params["q"])
+        body = {"total_count": len(hits), "items": hits}
+        return scrape.http_utils.Response(200, {}, json.dumps(body))
+
+    def fake_docs(full_name):
+        probed.append(full_name)
+        return 0.0
+
+    monkeypatch.setattr(scrape, "QUERIES", ["q"])
+    monkeypatch.setattr(scrape, "RATE_LIMIT_REMAINING", None)
+    monkeypatch.setattr(scrape, "github_get", fake_get)
+    monkeypatch.setattr(scrape, "get_doc_completeness", fake_docs)
+    repos = {
+        r["full_name"]: r
+        for r in scrape.scrape(min_stars=0, token=None, incremental=True)
+    }
+    assert queries == ["q stars:>=0 pushed:>=2025-01-31"]
+    assert sorted(probed) == ["o/bumped", "o/new"]
+    assert sorted(repos) == ["o/bumped", "o/new", "o/quiet", "o/same"]
+    assert repos["o/bumped"]["stargazers_count"] == 99
+    assert repos["o/quiet"]["doc_completeness"] == 1.0
+    assert repos["o/quiet"]["license"] == {"spdx_id": "MIT"}
+    assert repos["o/quiet"]["recency_factor"] == 0.0
+
+
+def test_scrape_incremental_refetches_due_repos(monkeypatch, tmp_path):
+    _write_snapshot(tmp_path / "2025-02-01.json", [_item("o/quiet"), _item("o/idle")])
+    monkeypatch.setattr(incremental, "HISTORY_DIR", tmp_path)
+    monkeypatch.setattr(
+        incremental.Baseline, "due", lambda self, name, today=None: name == "o/quiet"
+    )
+    urls = []
+
+    def fake_get(url, params=None, headers=None):
+        urls.append(url)
+        if url.startswith(scrape.REPO_URL):
+            body = _item("o/quiet", stars=77)
+        else:
+            body = {"total_count": 0, "items": []}
+        return scrape.http_utils.Response(200, {}, json.dumps(body))
+
+    monkeypatch.setattr(scrape, "QUERIES", ["q"])
+    monkeypatch.setattr(scrape, "RATE_LIMIT_REMAINING", None)
+    monkeypatch.setattr(scrape, "github_get", fake_get)
+    monkeypatch.setattr(scrape, "get_doc_completeness", lambda name: 0.0)
+    repos = {
+        r["full_name"]: r
+        for r in scrape.scrape(min_stars=0, token=None, incremental=True)
+    }
+    assert urls.count(f"{scrape.REPO_URL}/o/quiet") == 1
+    assert len(urls) == 2
+    assert repos["o/quiet"]["stargazers_count"] == 77
+    assert repos["o/idle"]["stargazers_count"] == 10
+
+
+def test_harvest_incremental_reuses_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(net, "CACHE_DIR", tmp_path)
+    baseline = incremental.Baseline(
+        day=datetime.date(2025, 2, 1),
+        repos={n: _item(n) for n in ("o/same", "o/bumped", "o/quiet", "o/gone")},
+    )
+    store = net._store()
+    for name in ("o/same", "o/bumped", "o/quiet"):
+        store.put(net._cache_key("meta", name), {"name": name, "cached": True})
+
+    async def fake_search(terms, **kw):
+        assert kw["pushed_since"] == datetime.date(2025, 1, 31)
+        yield _item("o/same")
+        yield _item("o/bumped", stars=50)
+
+    harvested = []
+
+    async def fake_harvest(name, session=None):
+        harvested.append(name)
+        return {"name": name, "cached": False}
+
+    monkeypatch.setattr(search_planner, "async_search", fake_search)
+    monkeypatch.setattr(net, "async_harvest_repo", fake_harvest)
+    res = asyncio.run(net.async_search_and_harvest(backend="rest", baseline=baseline))
+    by_name = {r["name"]: r for r in res}
+    assert harvested == ["o/bumped"]
+    assert by_name["o/same"]["cached"] and by_name["o/quiet"]["cached"]
+    assert by_name["o/gone"]["stars"] == 10
+    assert by_name["o/gone"]["maintainer"] == "o"
+    assert store.get(net._cache_key("meta", "o/bumped")) is None
+
+
+def test_harvest_incremental_carries_snapshot_without_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(net, "CACHE_DIR", tmp_path)
+    derived = {
+        "AgenticIndexScore": 42.5,
+        "category": "RAG-centric",
+        "doc_completeness": 1.0,
+        "ecosystem_integration": 1.0,
+        "recency_factor": 0.5,
+    }
+    snapshot = {n: dict(_item(n), **derived) for n in ("o/same", "o/quiet")}
+    baseline = incremental.Baseline(day=datetime.date(2025, 2, 1), repos=snapshot)
+
+    async def fake_search(terms, **kw):
+        yield _item("o/same")
+        yield _item("o/new")
+
+    harvested = []
+
+    async def fake_harvest(name, session=None):
+        harvested.append(name)
+        return {"name": name}
+
+    monkeypatch.setattr(search_planner, "async_search", fake_search)
+    monkeypatch.setattr(net, "async_harvest_repo", fake_harvest)
+    res = asyncio.run(net.async_search_and_harvest(backend="rest", baseline=baseline))
+    by_name = {r["name"]: r for r in res}
+    assert harvested == ["o/new"]
+    assert sorted(by_name) == ["o/new", "o/quiet", "o/same"]
+    for name in ("o/same", "o/quiet"):
+        assert {k: by_name[name][k] for k in derived} == derived
+        assert by_name[name]["stars"] == 10
+        assert by_name[name]["maintainer"] == "o"
+
+
+def test_due_slices_cover_every_repo_once():
+    names = [f"o/r{i}" for i in range(50)]
+    baseline = incremental.Baseline(
+        day=datetime.date(2025, 2, 1), repos={n: _item(n) for n in names}
+    )
+    assert not any(baseline.due(n) for n in names)
+    baseline.refresh_days = 7
+    start = datetime.date(2025, 2, 2)
+    days = [start + datetime.timedelta(days=d) for d in range(7)]
+    hits = [[n for n in names if baseline.due(n, day)] for day in days]
+    assert sorted(n for day in hits for n in day) == sorted(names)
+
+
+def test_harvest_incremental_refreshes_due_carried_repos(monkeypatch, tmp_path):
+    monkeypatch.setattr(net, "CACHE_DIR", tmp_path)
+    snapshot = {n: _item(n) for n in ("o/stale", "o/quiet")}
+    baseline = incremental.Baseline(day=datetime.date(2025, 2, 1), repos=snapshot)
+    monkeypatch.setattr(
+        incremental.Baseline, "due", lambda self, name, today=None: name == "o/stale"
+    )
+
+    async def fake_search(terms, **kw):
+        return
+        yield
+
+    harvested = []
+
+    async def fake_harvest(name, session=None):
+        harvested.append(name)
+        return {"name": name, "stars": 99}
+
+    monkeypatch.setattr(search_planner, "async_search", fake_search)
+    monkeypatch.setattr(net, "async_harvest_repo", fake_harvest)
+    res = asyncio.run(net.async_search_and_harvest(backend="rest", baseline=baseline))
+    assert harvested == ["o/stale"]
+    assert {r["name"]: r["stars"] for r in res} == {"o/stale": 99, "o/quiet": 10}
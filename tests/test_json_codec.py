@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from agentic_index_cli.internal import json_codec
+
+SAMPLE = {
+    "name": "héllo 😀",
+    "tiny": 1e-7,
+    "small": -0.00001,
+    "big": 2**70,
+    "nested": [[], {}, {"x": None, "y": True}],
+    "score": 3.25,
+}
+
+
+@pytest.fixture(params=json_codec.BACKENDS)
+def backend(request, monkeypatch):
+    if request.param == "orjson" and json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_codec, "BACKEND", request.param)
+    return request.param
+
+
+def test_indented_output_matches_stdlib(backend, tmp_path):
+    assert json_codec.dumps(SAMPLE) == json.dumps(SAMPLE, indent=2)
+    path = tmp_path / "out.json"
+    json_codec.write(path, SAMPLE)
+    assert path.read_text() == json.dumps(SAMPLE, indent=2) + "\n"
+    assert json_codec.read(path) == SAMPLE
+
+
+def test_compact_round_trip(backend):
+    text = json_codec.dumps(SAMPLE, compact=True)
+    assert "\n" not in text and "😀" in text
+    assert json_codec.loads(text) == SAMPLE
+    assert json_codec.loads(text.encode()) == SAMPLE
+    assert json_codec.dumps({"b": 1, "a": 2}, compact=True, sort_keys=True) == (
+        '{"a":2,"b":1}'
+    )
+
+
+def test_loads_accepts_stdlib_extensions(backend):
+    assert json_codec.loads("[NaN, 1]")[1] == 1
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("{not json")
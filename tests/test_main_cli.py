@@ -10,14 +10,30 @@ import agentic_index_cli.prune as prune
 def test_main_scrape(monkeypatch, tmp_path):
     called = {}
 
-    def fake_run_index(min_stars, iterations, output):
+    def fake_run_index(
+        min_stars,
+        iterations,
+        output,
+        stream=False,
+        resume=False,
+        incremental=False,
+        max_pages=1,
+    ):
         called["args"] = (min_stars, iterations, output)
+        called["stream"] = stream
+        called["resume"] = resume
+        called["max_pages"] = max_pages
 
     monkeypatch.setattr(ai, "run_index", fake_run_index)
     main.main(
         ["scrape", "--min-stars", "1", "--iterations", "2", "--output", str(tmp_path)]
     )
     assert called["args"] == (1, 2, Path(tmp_path))
+    assert called["stream"] is False
+    assert called["resume"] is False
+    assert called["max_pages"] == 1
+    main.main(["scrape", "--all-pages", "--output", str(tmp_path)])
+    assert called["max_pages"] is None
 
 
 def _patch_common(monkeypatch):
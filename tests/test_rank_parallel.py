@@ -0,0 +1,82 @@
+import json
+import logging
+
+import lib.metrics_registry as mr
+from agentic_index_cli.internal import rank_main as rank_mod
+
+
+def _repos(count):
+    repos = []
+    for i in range(count):
+        repo = {
+            "name": f"repo{i}",
+            "full_name": f"o/repo{i}",
+            "stargazers_count": (i * 37) % 500,
+            "forks_count": i % 7,
+            "open_issues_count": i % 5,
+            "closed_issues": i % 11,
+            "pushed_at": f"2025-0{1 + i % 9}-01T00:00:00Z",
+            "description": ["rag toolkit", "multi-agent crew", "research", ""][i % 4],
+            "topics": ["agents"],
+        }
+        if i % 3 == 0:
+            repo["license"] = {"spdx_id": "MIT"}
+        if i % 4 == 0:
+            repo["doc_completeness"] = 0.5
+        if i % 10 == 0:
+            repo["AgentOpsScore"] = 1.0
+        if i % 13 == 0:
+            del repo["pushed_at"]
+        repos.append(repo)
+    return repos
+
+
+def _forks(repo):
+    return float(repo.get("forks_count", 0))
+
+
+def _rank(data_dir, **kwargs):
+    data_dir.mkdir()
+    repo_file = data_dir / "repos.json"
+    repo_file.write_text(json.dumps({"schema_version": 3, "repos": _repos(120)}))
+    rank_mod.main(str(repo_file), **kwargs)
+    return repo_file.read_bytes(), (data_dir / "ranked.json").read_bytes()
+
+
+def test_parallel_rank_is_byte_identical(tmp_path, monkeypatch):
+    monkeypatch.setattr(rank_mod, "MIN_CHUNK", 10)
+    serial = _rank(tmp_path / "serial")
+    calls = []
+    real = rank_mod._prepare_parallel
+
+    def spy(repos, workers):
+        calls.append(workers)
+        real(repos, workers)
+
+    monkeypatch.setattr(rank_mod, "_prepare_parallel", spy)
+    parallel = _rank(tmp_path / "parallel", workers=3)
+    assert calls == [3]
+    assert parallel == serial
+
+
+def test_small_input_logs_serial_fallback(tmp_path, monkeypatch, caplog):
+    def fail(repos, workers):
+        raise AssertionError("ran in parallel")
+
+    monkeypatch.setattr(rank_mod, "_prepare_parallel", fail)
+    with caplog.at_level(logging.INFO, logger=rank_mod.__name__):
+        _rank(tmp_path / "small", workers=3)
+    assert "serially" in caplog.text
+
+
+def test_workers_use_runtime_metrics(tmp_path, monkeypatch):
+    monkeypatch.setattr(rank_mod, "MIN_CHUNK", 10)
+    monkeypatch.setattr(mr, "_REGISTRY", dict(mr._REGISTRY))
+    mr.register(mr.FunctionMetric("forks", 2.0, _forks))
+    serial = _rank(tmp_path / "serial")
+    parallel = _rank(tmp_path / "parallel", workers=3)
+    assert parallel == serial
+    monkeypatch.setattr(mr, "_REGISTRY", dict(mr._REGISTRY))
+    mr.register(mr.FunctionMetric("forks", 2.0, lambda repo: _forks(repo) + 1))
+    # a lambda cannot be pickled for the workers, so ranking runs serially
+    assert _rank(tmp_path / "lambda", workers=3) == _rank(tmp_path / "lambda1")
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from agentic_index_cli.internal import http_utils, rate_limit
+
+CORE = "https://api.github.com/repos/o/r"
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clk = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "time", clk.time)
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", clk.sleep)
+    return clk
+
+
+def _headers(remaining, reset, limit=100, **extra):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+        **extra,
+    }
+
+
+def test_resource_for():
+    assert rate_limit.resource_for(CORE) == "core"
+    assert rate_limit.resource_for("https://api.github.com/search/repos") == "search"
+    assert rate_limit.resource_for("https://api.github.com/graphql") == "graphql"
+    assert rate_limit.resource_for("https://raw.githubusercontent.com/x") is None
+
+
+def test_paces_full_fetches_below_low_water(clock):
+    sched = rate_limit.RateLimitScheduler(low_water=0.1)
+    sched.update(CORE, 200, _headers(5, clock.now + 50))
+    asyncio.run(sched.acquire(CORE))
+    asyncio.run(sched.acquire(CORE))
+    assert clock.sleeps == [10.0]
+    assert sched.metrics()["core"]["remaining"] == 3
+    assert sched.metrics()["core"]["paced"]
+
+
+def test_conditional_requests_skip_pacing(clock):
+    sched = rate_limit.RateLimitScheduler(low_water=0.1)
+    sched.update(CORE, 200, _headers(5, clock.now + 50))
+    asyncio.run(sched.acquire(CORE))
+    asyncio.run(sched.acquire(CORE, conditional=True))
+    assert clock.sleeps == []
+
+
+def test_full_fetch_yields_to_waiting_conditional(clock):
+    sched = rate_limit.RateLimitScheduler(low_water=0.1)
+    sched.update(CORE, 200, _headers(5, clock.now + 50))
+    sched._budgets["core"].waiting_conditional = 1
+    assert sched._reserve("core", conditional=False) == rate_limit.POLL_INTERVAL
+    assert sched._reserve("core", conditional=True) == 0.0
+
+
+def test_empty_bucket_waits_for_reset(clock):
+    sched = rate_limit.RateLimitScheduler()
+    sched.update(CORE, 200, _headers(0, clock.now + 30, limit=60))
+    assert sched.eta("core", 1) == pytest.approx(30)
+    asyncio.run(sched.acquire(CORE))
+    assert clock.sleeps == [30]
+    assert sched.metrics()["core"]["remaining"] == 59
+
+
+def test_retry_after_blocks(clock):
+    sched = rate_limit.RateLimitScheduler()
+    sched.update(CORE, 403, {"Retry-After": "7"})
+    assert sched.metrics()["core"]["blocked_for"] == 7
+    asyncio.run(sched.acquire(CORE))
+    assert clock.sleeps == [7]
+
+
+class FakeGitHub:
+    """Session emitting GitHub rate-limit headers from a fixed budget."""
+
+    def __init__(self, clock, limit=3, window=60):
+        self.clock = clock
+        self.limit = limit
+        self.remaining = limit
+        self.reset = clock.now + window
+        self.window = window
+        self.exhausted = 0
+
+    def get(self, url, **kw):
+        fake = self
+        if fake.clock.now >= fake.reset:
+            fake.remaining = fake.limit
+            fake.reset = fake.clock.now + fake.window
+        if fake.remaining == 0:
+            fake.exhausted += 1
+            status = 403
+        else:
+            fake.remaining -= 1
+            status = 200
+
+        class Resp:
+            def __init__(self):
+                self.status = status
+                self.headers = _headers(fake.remaining, fake.reset, limit=fake.limit)
+
+            async def text(self):
+                return "{}"
+
+        class CM:
+            async def __aenter__(self):
+                return Resp()
+
+            async def __aexit__(self, *exc):
+                pass
+
+        return CM()
+
+
+def test_scheduler_never_hits_wall(clock, monkeypatch):
+    monkeypatch.setattr(http_utils.asyncio, "sleep", clock.sleep)
+    session = FakeGitHub(clock)
+    sched = rate_limit.RateLimitScheduler(low_water=0.0)
+
+    async def run():
+        for _ in range(7):
+            resp = await http_utils.async_get(
+                CORE, session=session, retries=2, scheduler=sched
+            )
+            assert resp.status_code == 200
+
+    asyncio.run(run())
+    assert session.exhausted == 0
+    assert sum(clock.sleeps) == pytest.approx(120)
+
+
+def test_retry_logs_scheduler_wait(clock, monkeypatch, caplog):
+    monkeypatch.setattr(http_utils.asyncio, "sleep", clock.sleep)
+    session = FakeGitHub(clock)
+    session.remaining, session.reset = 0, 1060
+    sched = rate_limit.RateLimitScheduler(low_water=0.0)
+    resp = asyncio.run(
+        http_utils.async_get(CORE, session=session, retries=2, scheduler=sched)
+    )
+    assert resp.status_code == 200
+    assert "Rate limit hit, waiting 60.0 seconds" in caplog.text
@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import pytest
+
+from agentic_index_cli.repo_table import RepoTable
+
+REPOS = [
+    {"name": "a", "full_name": "o/a", "stars": 10, "category": "RAG-centric"},
+    {"name": "b", "full_name": "o/b", "stars": 30, "category": "DevTools"},
+    {"name": "c", "full_name": "o/c", "stars": 20, "category": "RAG-centric"},
+    {"name": "d", "full_name": "o/d", "stars": 30},
+]
+
+
+def test_views_share_records():
+    table = RepoTable(REPOS)
+    rag = table.category("RAG-centric")
+    assert [r["name"] for r in rag] == ["a", "c"]
+    assert rag[0] is REPOS[0]
+    assert rag.to_list()[1] is REPOS[2]
+    assert table.categories() == ["DevTools", "RAG-centric"]
+    assert len(table[1:3]) == 2 and table[1:3][0] is REPOS[1]
+
+
+def test_sort_matches_list_sort():
+    table = RepoTable(REPOS)
+    expected = sorted(REPOS, key=lambda r: r["stars"], reverse=True)
+    assert table.sort_by("stars", reverse=True).to_list() == expected
+    assert [r["name"] for r in table.sort_by("stars").head(2)] == ["a", "c"]
+    by_name = table.sort_by("full_name", reverse=True)
+    assert [r["name"] for r in by_name] == ["d", "c", "b", "a"]
+    assert [r["name"] for r in table.sort_by("category", default="")] == [
+        "d",
+        "b",
+        "a",
+        "c",
+    ]
+
+
+def test_columns_and_masks():
+    table = RepoTable(REPOS)
+    stars = table.column("stars")
+    assert stars.dtype == np.float64
+    assert stars.tolist() == [10, 30, 20, 30]
+    assert np.isnan(table.column("missing")).all()
+    popular = table.where(stars >= 20)
+    assert [r["name"] for r in popular.where(lambda r: "category" in r)] == ["b", "c"]
+    assert popular.column("stars").tolist() == [30, 20, 30]
+
+
+def test_set_refreshes_columns():
+    records = [dict(r) for r in REPOS]
+    table = RepoTable(records)
+    view = table.category("RAG-centric")
+    assert table.column("score", default=0).tolist() == [0, 0, 0, 0]
+    view.set("score", [1.5, 2.5])
+    assert records[2]["score"] == 2.5
+    assert table.column("score", default=0).tolist() == [1.5, 0, 2.5, 0]
+    with pytest.raises(ValueError):
+        view.set("score", [1.0])
+
+
+def test_load_and_save_round_trip(tmp_path):
+    path = tmp_path / "repos.json"
+    path.write_text(json.dumps({"schema_version": 3, "repos": REPOS}))
+    table = RepoTable.load(path)
+    table.category("RAG-centric").save(tmp_path / "rag.json")
+    saved = json.loads((tmp_path / "rag.json").read_text())
+    assert saved["schema_version"] == 3
+    assert [r["name"] for r in saved["repos"]] == ["a", "c"]
@@ -15,7 +15,7 @@ def test_run_index_creates_outputs(tmp_path, monkeypatch):
             "description": "desc",
         }
     ]
-    monkeypatch.setattr(ai, "search_and_harvest", lambda min_stars: data)
+    monkeypatch.setattr(ai, "search_and_harvest", lambda min_stars, **kw: data)
     ai.run_index(min_stars=0, iterations=1, output=tmp_path)
 
     assert (tmp_path / "top100.csv").exists()
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+
+import agentic_index_cli.internal.scrape as scrape
+import agentic_index_cli.network as net
+from agentic_index_cli.internal import run_journal, search_planner
+
+
+def _item(i):
+    return {
+        "name": f"r{i}",
+        "full_name": f"o/r{i}",
+        "html_url": f"https://example.com/o/r{i}",
+        "description": "agent",
+        "stargazers_count": 10 - i,
+        "forks_count": 0,
+        "open_issues_count": 0,
+        "archived": False,
+        "license": {"spdx_id": "MIT"},
+        "language": "Python",
+        "pushed_at": "2025-01-01T00:00:00Z",
+        "owner": {"login": "o"},
+    }
+
+
+def test_journal_replays_on_resume(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = run_journal.RunJournal(path, {"min_stars": 1, "terms": ("a",)})
+    journal.record_page("a stars:>=1", 1, {"items": [{"full_name": "o/r"}]})
+    journal.record_repo("o/r", {"name": "o/r"})
+    journal.close()
+    with path.open("a") as fh:
+        fh.write('{"event": "repo", "name": "o/x"')  # torn write from a crash
+
+    resumed = run_journal.RunJournal(
+        path, {"min_stars": 1, "terms": ["a"]}, resume=True
+    )
+    assert resumed.resumed
+    assert resumed.page("a stars:>=1", 1) == {"items": [{"full_name": "o/r"}]}
+    assert resumed.repo("o/r") == {"name": "o/r"}
+    assert resumed.repo("o/x") is None
+    resumed.complete()
+    assert not path.exists()
+
+
+def test_journal_restarts_for_other_params(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = run_journal.RunJournal(path, {"min_stars": 1})
+    journal.record_repo("o/r", {"name": "o/r"})
+    journal.close()
+    fresh = run_journal.RunJournal(path, {"min_stars": 2}, resume=True)
+    assert not fresh.resumed
+    assert fresh.repo("o/r") is None
+    fresh.close()
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["start"]
+
+
+@pytest.mark.parametrize("header", ["", '{"event": "start", "par', '{"event": "page"}'])
+def test_journal_restarts_without_a_valid_header(tmp_path, header):
+    path = tmp_path / "run.jsonl"
+    repo = {"event": "repo", "name": "o/r", "record": {"name": "o/r"}}
+    path.write_text(f"{header}\n{json.dumps(repo)}\n")
+    fresh = run_journal.RunJournal(path, {"min_stars": 1}, resume=True)
+    assert not fresh.resumed
+    assert fresh.repo("o/r") is None
+    fresh.close()
+
+
+def test_scrape_resume_skips_completed_work(monkeypatch):
+    items = [_item(i) for i in range(3)]
+    searches = []
+    probed = []
+
+    def fake_get(url, params=None, headers=None):
+        searches.append(params["q"])
+        body = {"total_count": 3, "items": items}
+        return scrape.http_utils.Response(200, {}, json.dumps(body))
+
+    def flaky_docs(full_name):
+        probed.append(full_name)
+        if full_name == "o/r1" and probed.count(full_name) == 1:
+            raise RuntimeError("network dropped")
+        return 1.0
+
+    monkeypatch.setattr(scrape, "QUERIES", ["q"])
+    monkeypatch.setattr(scrape, "github_get", fake_get)
+    monkeypatch.setattr(scrape, "get_doc_completeness", flaky_docs)
+
+    with pytest.raises(RuntimeError):
+        scrape.scrape(min_stars=0, token=None, backend="rest")
+    assert searches == ["q stars:>=0"]
+
+    repos = scrape.scrape(min_stars=0, token=None, backend="rest", resume=True)
+    assert searches == ["q stars:>=0"]
+    assert probed == ["o/r0", "o/r1", "o/r1", "o/r2"]
+    assert sorted(r["full_name"] for r in repos) == ["o/r0", "o/r1", "o/r2"]
+    assert not list(run_journal.STATE_DIR.glob("*.jsonl"))
+
+
+def test_harvest_replays_journaled_repos(monkeypatch, tmp_path):
+    async def fake_search(terms, **kw):
+        for name in ("o/done", "o/new"):
+            yield {"full_name": name}
+
+    harvested = []
+
+    async def fake_harvest(name, session=None):
+        harvested.append(name)
+        return {"name": name}
+
+    monkeypatch.setattr(search_planner, "async_search", fake_search)
+    monkeypatch.setattr(net, "async_harvest_repo", fake_harvest)
+    journal = run_journal.RunJournal(tmp_path / "run.jsonl", {})
+    journal.record_repo("o/done", {"name": "o/done", "cached": True})
+
+    res = asyncio.run(net.async_search_and_harvest(backend="rest", journal=journal))
+    assert harvested == ["o/new"]
+    assert sorted(r["name"] for r in res) == ["o/done", "o/new"]
+    assert journal.repo("o/new") == {"name": "o/new"}
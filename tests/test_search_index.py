@@ -0,0 +1,89 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_index_cli.__main__ import app as cli_app
+from agentic_index_cli.internal import json_codec
+from agentic_index_cli.internal.search_index import (
+    INDEX_FILE,
+    SearchIndex,
+    tokenize,
+)
+
+REPOS = [
+    {
+        "full_name": "acme/vectorstore",
+        "description": "Embedded vector database for agents",
+        "topics": "rag,embeddings",
+        "AgenticIndexScore": 1.0,
+    },
+    {
+        "full_name": "acme/planner",
+        "description": "Agent planning framework",
+        "topics": ["agents", "planning"],
+        "readme_excerpt": "Plans tasks with a vector memory.",
+        "AgenticIndexScore": 9.0,
+    },
+    {
+        "full_name": "other/notes",
+        "description": "A note taking app",
+        "AgenticIndexScore": 5.0,
+    },
+]
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The Vector-DB for RAG") == ["vector", "db", "rag"]
+
+
+def test_bm25_prefix_and_blend():
+    index = SearchIndex.build(REPOS)
+    names = [r[0] for r in index.search("vector")]
+    # the description outweighs the README excerpt
+    assert names == ["acme/vectorstore", "acme/planner"]
+    assert [r[0] for r in index.search("vectors")] == ["acme/vectorstore"]
+    assert index.search("vectors", prefix=False) == []
+    assert [r[0] for r in index.search("agent plan")] == ["acme/planner"]
+    assert index.search("plan", prefix=False) == []
+    blended = index.search("vector", blend=0.9)
+    assert [r[0] for r in blended] == ["acme/planner", "acme/vectorstore"]
+    assert index.search("nothing here") == []
+    assert len(index.search("ac", limit=1)) == 1
+
+
+def test_saved_index_round_trips(tmp_path):
+    data = tmp_path / "repos.json"
+    json_codec.write(data, {"schema_version": 3, "repos": REPOS})
+    SearchIndex.build(REPOS[:1]).save(tmp_path / INDEX_FILE)
+    # the saved index is newer than the data, so it is used as is
+    assert len(SearchIndex.for_data(data)) == 1
+    stamp = (tmp_path / INDEX_FILE).stat().st_mtime_ns - 10**9
+    os.utime(tmp_path / INDEX_FILE, ns=(stamp, stamp))
+    rebuilt = SearchIndex.for_data(data)
+    assert len(rebuilt) == 3
+    rebuilt.save(tmp_path / INDEX_FILE)
+    loaded = SearchIndex.load(tmp_path / INDEX_FILE)
+    assert loaded.search("vector", blend=0.5) == rebuilt.search("vector", blend=0.5)
+
+
+def test_search_endpoint_and_cli(tmp_path, monkeypatch):
+    data = tmp_path / "repos.json"
+    json_codec.write(data, {"schema_version": 3, "repos": REPOS})
+    from typer.testing import CliRunner
+
+    result = CliRunner().invoke(cli_app, ["search", "planning", "--data", str(data)])
+    assert result.exit_code == 0
+    assert "1. acme/planner" in result.output
+
+    try:
+        from agentic_index_api import main as api_main
+        from agentic_index_api.snapshot import SnapshotManager
+    except Exception as exc:  # pragma: no cover - optional deps
+        pytest.skip(f"Could not load API main module: {exc}")
+    monkeypatch.setattr(api_main, "manager", SnapshotManager(data))
+    client = TestClient(api_main.app)
+    body = client.get("/search", params={"q": "vect"}).json()
+    assert body["results"][0]["name"] == "acme/vectorstore"
+    assert body["results"][0]["description"].startswith("Embedded")
+    assert client.get("/search").status_code == 422
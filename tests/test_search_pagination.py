@@ -8,7 +8,9 @@ def test_search_and_harvest_pagination(monkeypatch):
     monkeypatch.setattr(ai, "SEARCH_TERMS", ["term"])
     monkeypatch.setattr(ai, "TOPIC_FILTERS", [])
 
-    async def fake_async_search(min_stars=0, max_pages=1):
+    async def fake_async_search(
+        min_stars=0, max_pages=1, backend=None, journal=None, baseline=None
+    ):
         return [fake_harvest_repo(f"repo{i}") for i in range(1, 4)]
 
     monkeypatch.setattr(ai, "async_search_and_harvest", fake_async_search)
@@ -0,0 +1,102 @@
+import asyncio
+import datetime
+import json
+import re
+
+from agentic_index_cli.internal import http_utils
+from agentic_index_cli.internal import search_planner as sp
+
+STARS_RE = re.compile(r"stars:(?:>=(\d+)|(\d+)\.\.(\d+))")
+PUSHED_RE = re.compile(r"pushed:(\S+)\.\.(\S+)")
+
+
+class FakeSearch:
+    """Serve search pages from an in-memory list with GitHub's result cap."""
+
+    def __init__(self, repos):
+        self.repos = repos
+        self.queries = []
+        self.totals = {}
+
+    async def __call__(self, url, params):
+        q = params["q"]
+        self.queries.append((q, params["page"]))
+        m = STARS_RE.search(q)
+        lo = int(m.group(1) or m.group(2))
+        hi = int(m.group(3)) if m.group(3) else None
+        hits = [r for r in self.repos if r["stargazers_count"] >= lo]
+        if hi is not None:
+            hits = [r for r in hits if r["stargazers_count"] <= hi]
+        p = PUSHED_RE.search(q)
+        if p:
+            hits = [r for r in hits if p.group(1) <= r["pushed_at"][:10] <= p.group(2)]
+        hits.sort(key=lambda r: -r["stargazers_count"])
+        start = (params["page"] - 1) * params["per_page"]
+        page = hits[:1000][start : start + params["per_page"]]
+        self.totals[q] = len(hits)
+        body = {"total_count": len(hits), "items": page}
+        return http_utils.Response(200, {}, json.dumps(body))
+
+
+def _repos(n, stars=lambda i: i):
+    day = datetime.date(2024, 1, 1)
+    return [
+        {
+            "full_name": f"o/r{i}",
+            "stargazers_count": stars(i),
+            "pushed_at": f"{day + datetime.timedelta(days=i % 300)}T00:00:00Z",
+        }
+        for i in range(n)
+    ]
+
+
+def _collect(terms, fetch, **kw):
+    async def run():
+        return [r async for r in sp.async_search(terms, fetch=fetch, **kw)]
+
+    return asyncio.run(run())
+
+
+def test_shard_query():
+    shard = sp.Shard(
+        "agent",
+        5,
+        9,
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 2, 1),
+    )
+    assert shard.query() == "agent stars:5..9 pushed:2024-01-01..2024-02-01"
+    assert sp.Shard("agent", 3).query() == "agent stars:>=3"
+
+
+def test_split_by_stars_then_date():
+    low, high = sp.Shard("a", 0).split(top_stars=99)
+    assert (low.min_stars, low.max_stars) == (0, 9)
+    assert (high.min_stars, high.max_stars) == (10, None)
+    early, late = sp.Shard("a", 7, 7).split(top_stars=7)
+    assert early.pushed_from == sp.EARLIEST_PUSH
+    assert late.pushed_from == early.pushed_to + datetime.timedelta(days=1)
+
+
+def test_search_covers_beyond_cap():
+    fake = FakeSearch(_repos(2500))
+    found = _collect(["agent"], fake)
+    assert len(found) == 2500
+    assert len({r["full_name"] for r in found}) == 2500
+    paged = {q for q, page in fake.queries if page > 1}
+    assert paged and all(fake.totals[q] <= sp.RESULT_CAP for q in paged)
+
+
+def test_search_splits_single_star_value_by_date():
+    fake = FakeSearch(_repos(1500, stars=lambda i: 3))
+    found = _collect(["agent"], fake)
+    assert len(found) == 1500
+    assert any("pushed:" in q for q, _ in fake.queries)
+
+
+def test_search_dedupes_and_caps_pages():
+    fake = FakeSearch(_repos(450))
+    found = _collect(["a", "b"], fake, max_pages=2)
+    assert len(found) == 200
+    assert not any(".." in q for q, _ in fake.queries)
+    assert sorted(page for _, page in fake.queries) == [1, 1, 2, 2]
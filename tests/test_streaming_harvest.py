@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+import agentic_index_cli.cli as cli
+import agentic_index_cli.network as net
+from agentic_index_cli.constants import SCORE_KEY
+from agentic_index_cli.internal import search_planner
+from agentic_index_cli.render import JsonlSink, TopN, load_jsonl
+
+
+def _fake_search(names, events):
+    async def fake(terms, **kw):
+        for name in names:
+            events.append(("search", name))
+            yield {"full_name": name}
+            await asyncio.sleep(0)
+
+    return fake
+
+
+def test_iter_yields_before_search_finishes(monkeypatch):
+    events = []
+    names = [f"o/r{i}" for i in range(5)]
+    monkeypatch.setattr(search_planner, "async_search", _fake_search(names, events))
+
+    async def fake_harvest(name, session=None):
+        if name == "o/r2":
+            raise RuntimeError("boom")
+        return {"name": name, SCORE_KEY: 1.0}
+
+    monkeypatch.setattr(net, "async_harvest_repo", fake_harvest)
+
+    async def run():
+        out = []
+        async for meta in net.async_iter_search_and_harvest(backend="rest"):
+            events.append(("yield", meta["name"]))
+            out.append(meta["name"])
+        return out
+
+    out = asyncio.run(run())
+    assert sorted(out) == ["o/r0", "o/r1", "o/r3", "o/r4"]
+    first_yield = events.index(("yield", out[0]))
+    assert first_yield < events.index(("search", "o/r4"))
+
+
+def test_iter_propagates_search_errors(monkeypatch):
+    async def broken(terms, **kw):
+        raise net.APIError("search down")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(search_planner, "async_search", broken)
+
+    async def run():
+        return [m async for m in net.async_iter_search_and_harvest(backend="rest")]
+
+    with pytest.raises(net.APIError, match="search down"):
+        asyncio.run(run())
+
+
+def test_stream_index_writes_jsonl(monkeypatch, tmp_path):
+    records = [{"name": f"r{i}", SCORE_KEY: float(i % 4)} for i in range(10)]
+
+    def fake_stream(
+        sink, min_stars=0, max_pages=1, backend=None, resume=False, incremental=False
+    ):
+        for rec in records:
+            sink(rec)
+        return len(records)
+
+    monkeypatch.setattr(cli, "stream_search_and_harvest", fake_stream)
+    path = tmp_path / "repos.jsonl"
+    top = cli.stream_index(0, path, limit=3)
+    assert [r["name"] for r in top] == ["r3", "r7", "r2"]
+    assert [r["name"] for r in load_jsonl(path)] == [r["name"] for r in records]
+
+
+def test_top_n_matches_sort():
+    records = [{"name": str(i), SCORE_KEY: (i * 7) % 5} for i in range(20)]
+    top = TopN(6)
+    for rec in records:
+        top.add(rec)
+    expected = sorted(records, key=lambda r: r[SCORE_KEY], reverse=True)[:6]
+    assert top.items() == expected
+
+
+def test_load_jsonl_skips_truncated_line(tmp_path):
+    path = tmp_path / "repos.jsonl"
+    with JsonlSink(path) as sink:
+        sink.write({"name": "a"})
+    with path.open("a") as fh:
+        fh.write('{"name": "b"')
+    assert list(load_jsonl(path)) == [{"name": "a"}]
+    assert json.loads(path.read_text().splitlines()[0]) == {"name": "a"}
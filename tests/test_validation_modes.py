@@ -0,0 +1,116 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from agentic_index_cli import validate
+
+REPOS = [
+    {
+        "name": "a",
+        "full_name": "o/a",
+        "stargazers_count": 10,
+        "license": {"spdx_id": "MIT"},
+        "owner": {"login": "o", "id": 1},
+        "AgenticIndexScore": 3,
+        "docs_quality": 0.5,
+        "score_delta": 0,
+        "stars_delta": "+new",
+        "description": None,
+    },
+    {"name": "b", "full_name": "o/b", "AgentOpsScore": 1.5, "topics": ["x"]},
+]
+
+
+class CountingAdapter:
+    def __init__(self):
+        self.validated = 0
+
+    def validate_python(self, items):
+        self.validated += len(items)
+        return validate.TypeAdapter(list[validate.Repo]).validate_python(items)
+
+    def dump_python(self, items, **kw):
+        return validate.TypeAdapter(list[validate.Repo]).dump_python(items, **kw)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    counting = CountingAdapter()
+    monkeypatch.setattr(validate, "_REPO_LIST", counting)
+    return counting
+
+
+def _write(path, repos):
+    path.write_text(json.dumps({"schema_version": 3, "repos": repos}))
+    return path
+
+
+def test_modes_normalise_alike(tmp_path):
+    path = _write(tmp_path / "repos.json", REPOS)
+    full = validate.load_repos(path)
+    assert full[0]["AgenticIndexScore"] == 3.0
+    assert full[0]["owner"] == {"login": "o"}
+    assert full[1]["AgenticIndexScore"] == 1.5
+    for mode in ("sampled", "hash", "off"):
+        loaded = validate.load_repos(path, validation=mode)
+        assert json.dumps(loaded) == json.dumps(full)
+
+
+def test_hash_mode_skips_known_content(tmp_path, adapter):
+    path = _write(tmp_path / "repos.json", REPOS)
+    validate.load_repos(path, validation="hash")
+    assert adapter.validated == 2
+    validate.load_repos(path, validation="hash")
+    assert adapter.validated == 2
+    _write(path, REPOS[:1])
+    validate.load_repos(path, validation="hash")
+    assert adapter.validated == 3
+
+
+def test_hash_mode_rejects_and_forgets_bad_content(tmp_path):
+    path = _write(tmp_path / "repos.json", [{"name": "a", "bogus": 1}])
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate.load_repos(path, validation="hash")
+    for mode in ("sampled", "off"):
+        with pytest.raises(ValidationError):
+            validate.load_repos(path, validation=mode)
+
+
+def test_unnormalised_files_are_coerced_or_rechecked(tmp_path, adapter):
+    raw = [{"name": "a", "stargazers_count": "12", "archived": 1, "stars": 5.0}]
+    path = _write(tmp_path / "repos.json", raw)
+    full = validate.load_repos(path)
+    assert full == [{"name": "a", "stargazers_count": 12, "archived": True, "stars": 5}]
+    assert validate.load_repos(path, validation="sampled") == full
+    for _ in range(2):
+        before = adapter.validated
+        assert validate.load_repos(path, validation="hash") == full
+        assert adapter.validated == before + 1
+
+
+def test_save_hash_matches_full_output(tmp_path, adapter):
+    full_path, hash_path = tmp_path / "full.json", tmp_path / "hash.json"
+    validate.save_repos(full_path, REPOS)
+    validate.save_repos(hash_path, REPOS, validation="hash")
+    assert hash_path.read_text() == full_path.read_text()
+    before = adapter.validated
+    validate.save_repos(tmp_path / "copy.json", REPOS, validation="hash")
+    validate.load_repos(hash_path, validation="hash")
+    assert adapter.validated == before
+
+
+def test_sampled_checks_edges(tmp_path):
+    bad = [{"name": "x", "stars": "many"}] + [{"name": f"r{i}"} for i in range(200)]
+    path = _write(tmp_path / "repos.json", bad)
+    with pytest.raises(ValidationError):
+        validate.load_repos(path, validation="sampled")
+
+
+def test_unknown_mode(tmp_path, monkeypatch):
+    path = _write(tmp_path / "repos.json", REPOS)
+    with pytest.raises(ValueError):
+        validate.load_repos(path, validation="lenient")
+    monkeypatch.setenv("REPOS_VALIDATION", "off")
+    assert len(validate.load_repos(path)) == 2